@@ -0,0 +1,207 @@
+"""Benchmark the dashboard's data pipeline on synthetic trackers.
+
+Every stage is timed separately at each tracker size (best wall time of a
+few runs, then peak traced memory in one more run of the same stage), and the
+results are written as JSON so two runs can be compared::
+
+    python -m benchmarks.pipeline --sizes 10k 100k --output .cache/bench/baseline.json
+    python -m benchmarks.pipeline --sizes 10k 100k --compare .cache/bench/baseline.json
+
+Synthetic trackers are generated once per size and seed under
+``.cache/synthetic``. Results depend on the machine, so keep baselines out of
+the repository and compare runs made on the same host.
+"""
+import argparse
+import gc
+import json
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from charts import build_duration_figure, build_funnel_figure, build_rejection_trend_figure, build_sourcing_trend_figure
+from tracker import (
+    FilterIndex, MetricsCube, SortKeys, StageDurations, compute_kpis, load_rules, quality_of_hire, schema,
+)
+from tracker.categorize import categorize_status
+from tracker.identity import IdentityIndex
+from tracker.interviews import InterviewEvents
+from tracker.synthetic import SIZES, parse_size, write_tracker
+
+DATA_DIR = Path('.cache/synthetic')
+DEFAULT_SIZES = ['10k', '100k', '1M']
+PAGE_SIZE = 25
+# A stage regresses when both its relative and absolute slowdown exceed these
+DEFAULT_TOLERANCE = 0.25
+MIN_SECONDS = 0.005
+DEFAULT_REPEAT = 3
+
+
+def _measure(fn, memory=True, repeat=1):
+    """``(result, best seconds of repeat calls, peak traced MB)``; the peak comes from one extra, traced call."""
+    seconds = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        seconds = min(seconds, time.perf_counter() - start)
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def _max_rss_mb():
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == 'darwin' else rss / 2**10
+
+
+def tracker_path(label, seed=0):
+    path = DATA_DIR / f"tracker-{label}-s{seed}.csv"
+    if not path.exists():
+        print(f"generating {path} ...", flush=True)
+        write_tracker(path, parse_size(label), seed=seed)
+    return path
+
+
+def _typical_filter(df, index):
+    """The busiest HM and location over the middle half of the sourcing dates."""
+    selections = {
+        'HM Details': [index.value_counts('HM Details').idxmax()],
+        'Location of posting': [index.value_counts('Location of posting').idxmax()],
+    }
+    dates = df['Sourcing Date'].dropna().sort_values()
+    date_range = None
+    if len(dates):
+        date_range = (dates.iloc[len(dates) // 4].date(), dates.iloc[3 * len(dates) // 4].date())
+    return selections, date_range
+
+
+def run_size(path, memory=True, repeat=DEFAULT_REPEAT):
+    """Time every pipeline stage on one tracker file; returns ``{stage: {seconds, peak_mb}}``."""
+    stages = {}
+
+    def stage(name, fn):
+        result, seconds, peak = _measure(fn, memory, repeat)
+        stages[name] = {'seconds': round(seconds, 6), 'peak_mb': None if peak is None else round(peak, 3)}
+        print(f"  {name:<18} {seconds:9.3f} s" + ('' if peak is None else f" {peak:10.1f} MB"), flush=True)
+        return result
+
+    header = schema.read_header(path)
+    rules = load_rules()
+    raw = stage('csv_parse', lambda: schema.read_raw(path, header, skiprows=schema.METADATA_ROWS + 1))
+    df = stage('string_cleaning', lambda: schema.convert_frame(raw.copy(deep=False)))
+    categories, rounds = stage('categorize_status', lambda: categorize_status(df, rules))
+    df['Dashboard_Category'], df['Reject_Round'] = categories, rounds
+
+    index = stage('filter_index', lambda: FilterIndex(df))
+    selections, date_range = _typical_filter(df, index)
+    positions = stage('filter_apply', lambda: index.resolve(selections, date_range))
+    kpis = stage('kpi_counts', lambda: compute_kpis(df['Dashboard_Category'].take(positions)))
+    cube = stage('cube_build', lambda: MetricsCube(df))
+    stage('cube_kpis', lambda: cube.kpis(selections, date_range))
+    trend = stage('cube_trend', lambda: cube.trend(selections, date_range, 'W'))
+    durations = stage('stage_durations', lambda: StageDurations(df))
+    identities = stage('identity_index', lambda: IdentityIndex(df))
+    stage('dedupe', lambda: identities.unique(positions))
+    interviews = stage('interview_events', lambda: InterviewEvents(df))
+    stage('interview_views', lambda: (interviews.panelist_load(positions), interviews.pass_rates(positions)))
+
+    def kpi_table():
+        # Sort keys per data version, then one sorted page of the filtered view
+        timings = durations.frame(np.arange(len(df)))
+        keys = SortKeys({'TTF': timings['TTF'], 'Candidate Name': df['Candidate Name']})
+        page = keys.order(positions, 'TTF', ascending=False)[:PAGE_SIZE]
+        table = df.take(page)[['Candidate Name', 'HM Details', 'Skill']].reset_index(drop=True)
+        table = table.join(durations.frame(page))
+        table['Quality of Hire'] = quality_of_hire(df['Dashboard_Category'].take(page)).to_numpy()
+        return table
+
+    stage('kpi_table', kpi_table)
+    stage('figures', lambda: (
+        build_funnel_figure(kpis).to_json(), build_duration_figure(durations.summary(positions)).to_json(),
+        build_sourcing_trend_figure(trend).to_json(), build_rejection_trend_figure(trend).to_json(),
+    ))
+    return {'rows': len(df), 'file_mb': round(path.stat().st_size / 2**20, 1), 'max_rss_mb': round(_max_rss_mb(), 1),
+            'stages': stages}
+
+
+def environment():
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Print per-stage ratios against ``baseline``; returns the regressed ``(size, stage, metric)`` entries."""
+    regressions = []
+    for size, result in current['sizes'].items():
+        old = baseline.get('sizes', {}).get(size)
+        if old is None:
+            continue
+        print(f"\n{size}: stage               time (new / old)        peak MB (new / old)")
+        for name, new_stage in result['stages'].items():
+            old_stage = old['stages'].get(name)
+            if old_stage is None:
+                continue
+            line = f"  {name:<18} {new_stage['seconds']:8.3f} / {old_stage['seconds']:<8.3f}"
+            slower = new_stage['seconds'] - old_stage['seconds']
+            if slower > MIN_SECONDS and new_stage['seconds'] > old_stage['seconds'] * (1 + tolerance):
+                regressions.append((size, name, 'seconds'))
+                line += ' SLOWER'
+            if new_stage['peak_mb'] is not None and old_stage['peak_mb'] is not None:
+                line += f"   {new_stage['peak_mb']:9.1f} / {old_stage['peak_mb']:<9.1f}"
+                if new_stage['peak_mb'] > old_stage['peak_mb'] * (1 + tolerance) + 1:
+                    regressions.append((size, name, 'peak_mb'))
+                    line += ' MORE MEMORY'
+            print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the tracker pipeline on synthetic data.")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help=f"row counts, e.g. {' '.join(SIZES)}")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help="write results JSON here")
+    parser.add_argument('--compare', type=Path, help="baseline JSON from an earlier run")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="timed runs per stage (best is kept)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the traced second run of each stage")
+    args = parser.parse_args(argv)
+
+    results = {'environment': environment(), 'sizes': {}}
+    for label in args.sizes:
+        path = tracker_path(label, args.seed)
+        print(f"{label} ({path})", flush=True)
+        results['sizes'][label] = run_size(path, memory=not args.no_memory, repeat=args.repeat)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nwrote {args.output}")
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): " + ', '.join('/'.join(r) for r in regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Plotly figures for the dashboard, kept free of Streamlit so they can be built headless.
+
+``plotly.express`` is imported on the first figure built, not on import, so
+a rerun served from the view cache never pays for it.
+"""
+import pandas as pd
+
+from tracker import FUNNEL_STAGES
+from tracker.cube import REJECTION_COLUMNS
+
+
+def build_duration_figure(summary):
+    import plotly.express as px
+
+    # Median and 90th percentile days per stage, TTF and TTH
+    duration_df = summary.melt(id_vars='Measure', value_vars=['P50', 'P90'], var_name='Percentile', value_name='Days')
+    fig_durations = px.bar(
+        duration_df,
+        x='Measure',
+        y='Days',
+        color='Percentile',
+        barmode='group',
+        color_discrete_sequence=['#3b82f6', '#f59e0b'],
+    )
+    fig_durations.update_layout(
+        height=400,
+        xaxis_title=None,
+        yaxis_title="Days",
+        yaxis=dict(showgrid=True, gridcolor='#e5e7eb'),
+        legend=dict(orientation='h', y=1.1, x=0),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=20, r=20, t=40, b=20),
+    )
+    return fig_durations
+
+
+def build_funnel_figure(kpis):
+    import plotly.express as px
+
+    # Create funnel data (Total at top, Joined at bottom, left-aligned)
+    funnel_data = {
+        'Stage': FUNNEL_STAGES,
+        'Count': kpis.funnel
+    }
+    funnel_df = pd.DataFrame(funnel_data)
+
+    # Create left-aligned funnel chart using horizontal bar
+    fig_funnel = px.bar(
+        funnel_df,
+        y='Stage',
+        x='Count',
+        orientation='h',
+        color='Stage',
+        color_discrete_sequence=['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6'],
+        text='Count'
+    )
+    fig_funnel.update_layout(
+        height=450,
+        showlegend=False,
+        xaxis_title="Number of Candidates",
+        yaxis_title=None,
+        xaxis=dict(
+            showgrid=True, 
+            gridcolor='#e5e7eb',
+            range=[0, kpis.total * 1.15],  # Add 15% padding to show full bar with text
+            fixedrange=True  # Disable zoom/pan
+        ),
+        yaxis=dict(
+            categoryorder='array', 
+            categoryarray=['Joined', 'Shortlisted', 'After Interviews', 'After Screening', 'Total Candidates'],
+            fixedrange=True  # Disable zoom/pan
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(size=14, color='#1e293b'),
+        margin=dict(l=20, r=50, t=10, b=50),  # Increased bottom margin to show x-axis
+        autosize=True
+    )
+    fig_funnel.update_traces(
+        textposition='outside',
+        textfont=dict(size=18, color='#000000', family='Inter', weight='bold'),  # Changed to pure black and bold
+        marker=dict(line=dict(width=0)),
+        texttemplate='%{text}'
+    )
+    return fig_funnel
+
+
+def _trend_layout(fig, title):
+    fig.update_layout(
+        height=360,
+        title=dict(text=title, font=dict(size=16, color='#1e293b')),
+        xaxis_title=None,
+        yaxis_title="Candidates",
+        yaxis=dict(showgrid=True, gridcolor='#e5e7eb'),
+        legend=dict(orientation='h', y=1.12, x=0, title=None),
+        hovermode='x unified',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=20, r=20, t=60, b=20),
+    )
+    return fig
+
+
+def build_sourcing_trend_figure(trend):
+    import plotly.express as px
+
+    # Candidates sourced per period (by sourcing date) against joins (by joining date)
+    trend_df = trend.reset_index().melt(id_vars='Period', value_vars=['Sourced', 'Joined'],
+                                        var_name='Measure', value_name='Candidates')
+    fig_trend = px.line(
+        trend_df,
+        x='Period',
+        y='Candidates',
+        color='Measure',
+        markers=True,
+        color_discrete_sequence=['#3b82f6', '#10b981'],
+    )
+    return _trend_layout(fig_trend, "Sourced vs Joined")
+
+
+def build_rejection_trend_figure(trend):
+    import plotly.express as px
+
+    # Rejections per period by the round they happened in (screening, R1, R2, R3)
+    trend_df = trend.reset_index().melt(id_vars='Period', value_vars=REJECTION_COLUMNS,
+                                        var_name='Round', value_name='Candidates')
+    fig_rejections = px.bar(
+        trend_df,
+        x='Period',
+        y='Candidates',
+        color='Round',
+        color_discrete_sequence=['#94a3b8', '#f59e0b', '#f97316', '#ef4444'],
+    )
+    fig_rejections.update_layout(barmode='stack')
+    return _trend_layout(fig_rejections, "Rejections by Round")
+
+
+def build_panelist_load_figure(load, top=8):
+    import plotly.express as px
+
+    # Interviews per week for the busiest panelists; everyone else is folded into "Others"
+    busiest = load.groupby('Panelist', observed=True)['Interviews'].sum().nlargest(top).index
+    load_df = load.assign(Panelist=load['Panelist'].astype(object).where(load['Panelist'].isin(busiest), 'Others'))
+    load_df = load_df.groupby(['Period', 'Panelist'], as_index=False)['Interviews'].sum()
+    fig_load = px.bar(
+        load_df,
+        x='Period',
+        y='Interviews',
+        color='Panelist',
+        category_orders={'Panelist': list(busiest) + ['Others']},
+    )
+    fig_load.update_layout(barmode='stack')
+    fig_load = _trend_layout(fig_load, "Panelist Load per Week")
+    fig_load.update_layout(yaxis_title="Interviews")
+    return fig_load
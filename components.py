@@ -0,0 +1,97 @@
+"""Reusable Streamlit components for the dashboard."""
+import streamlit as st
+
+from tracker.paging import page_bounds, page_count
+from tracker.views import Selection
+
+PAGE_SIZES = [15, 25, 50, 100]
+ROW_ORDER = 'Row order'
+MAX_VISIBLE_OPTIONS = 30
+
+
+def _set_selection(key, selection):
+    st.session_state[f"{key}_selection"] = selection
+    # Fresh checkbox keys so visible boxes pick up the new selection
+    st.session_state[f"{key}_generation"] = st.session_state.get(f"{key}_generation", 0) + 1
+
+
+def _toggle_option(key, value):
+    st.session_state[f"{key}_selection"] = st.session_state[f"{key}_selection"].toggled(value)
+
+
+def filter_multiselect(label, key, counts, max_visible=MAX_VISIBLE_OPTIONS):
+    """Searchable multi-select over the values of one filter column.
+
+    ``counts`` is a precomputed value -> row count Series (zero counts are
+    skipped). The selection lives in ``st.session_state[f"{key}_selection"]``
+    as one :class:`~tracker.views.Selection`; All / Clear replace it in O(1).
+    Only the ``max_visible`` most frequent options matching the search box
+    are rendered as checkboxes. Returns the selected values.
+    """
+    counts = counts[counts > 0]
+    selection = st.session_state.setdefault(f"{key}_selection", Selection())
+    generation = st.session_state.get(f"{key}_generation", 0)
+    with st.expander(label, expanded=False):
+        col_a, col_b = st.columns(2)
+        with col_a:
+            st.button("✔️ All", key=f"{key}_select_all", use_container_width=True,
+                      on_click=_set_selection, args=(key, Selection.everything()))
+        with col_b:
+            st.button("❌ Clear", key=f"{key}_deselect_all", use_container_width=True,
+                      on_click=_set_selection, args=(key, Selection()))
+
+        query = st.text_input("Search", key=f"{key}_query", placeholder=f"Search {len(counts):,} options",
+                              label_visibility="collapsed").strip()
+        matches = counts
+        if query:
+            matches = counts[counts.index.str.contains(query, case=False, regex=False)]
+        # Most frequent first; ties stay alphabetical
+        matches = matches.sort_values(ascending=False, kind='stable')
+        for value, count in matches.head(max_visible).items():
+            st.checkbox(f"{value} ({count:,})", value=value in selection, key=f"{key}_{generation}_{value}",
+                        on_change=_toggle_option, args=(key, value))
+
+        selected = selection.resolve(counts.index)
+        hidden = len(matches) - min(len(matches), max_visible)
+        notes = [f"{len(selected):,} of {len(counts):,} selected"]
+        if hidden:
+            notes.append(f"{hidden:,} more match, refine the search")
+        st.caption(" · ".join(notes))
+    return selected
+
+
+def paginated_table(key, fetch, positions, sort_keys, prepare, token):
+    """Render one server-side page of the rows at ``positions``.
+
+    Sorting runs on the server over ``sort_keys``; only the current page is
+    fetched (``fetch(page_positions)``, e.g. a backend's ``rows``), passed
+    through ``prepare`` and serialized. The
+    sorted order is kept in session state per ``token`` (the filtered view)
+    so page flips do not re-sort.
+    """
+    col_sort, col_dir, col_size = st.columns([2, 1, 1])
+    with col_sort:
+        sort_by = st.selectbox("Sort by", [ROW_ORDER] + sort_keys.columns, key=f"{key}_sort")
+    with col_dir:
+        descending = st.toggle("Descending", key=f"{key}_desc")
+    with col_size:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_page_size")
+
+    column = None if sort_by == ROW_ORDER else sort_by
+    order_key = (token, column, descending)
+    cached = st.session_state.get(f"{key}_order")
+    if cached is None or cached[0] != order_key:
+        cached = (order_key, sort_keys.order(positions, column, ascending=not descending))
+        st.session_state[f"{key}_order"] = cached
+    ordered = cached[1]
+
+    pages = page_count(len(ordered), page_size)
+    # Keep the page number valid when filters shrink the view
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    start, stop = page_bounds(len(ordered), page, page_size)
+
+    page_df = prepare(fetch(ordered[start:stop]))
+    st.dataframe(page_df, use_container_width=True, hide_index=True, height=35 * (len(page_df) + 1) + 3)
+    st.caption(f"Showing {start + 1 if stop else 0:,}–{stop:,} of {len(ordered):,} candidates")
@@ -1,6 +1,21 @@
+import os
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.io as pio
+
+from charts import (
+    build_duration_figure, build_funnel_figure, build_panelist_load_figure, build_rejection_trend_figure,
+    build_sourcing_trend_figure,
+)
+from components import filter_multiselect, paginated_table
+from tracker import (
+    TREND_FREQUENCIES, TTF_SLA_DAYS, TTH_SLA_DAYS, DatabaseHolder, DatasetHolder, FilterState, PandasBackend, Recorder,
+    SortKeys, StageDurations, StreamBackend, TrackerAnalysis, TrackerWatcher, View, ViewCache, compact_positions,
+    quality_of_hire,
+)
+from tracker.stream import StreamHolder
 
 # 1. Page Configuration
 st.set_page_config(
@@ -251,159 +266,214 @@ st.markdown("""
     """, unsafe_allow_html=True)
 
 # 2. Data Loading & Logic
-@st.cache_data(ttl=60)
-def load_and_clean_data():
-    # Load and skip the first metadata row
-    df = pd.read_csv('TA Tracker - HM Sheet.csv', skiprows=1)
-    df.columns = [col.strip() for col in df.columns]
-    
-    # Clean string columns
-    str_cols = ['Status', 'HM Details', 'Skill', 'Location of posting', 'Recruiter Name', 'Candidate Name']
-    for col in str_cols:
-        if col in df.columns:
-            # Use pandas "string" dtype so missing values stay as <NA> (not the literal "nan")
-            df[col] = df[col].astype("string").str.strip()
-
-    # Convert Date
-    df['Sourcing Date'] = pd.to_datetime(df['Sourcing Date'], errors='coerce')
-
-    # Define Grouping Logic
-    joined_list = {'joined', 'internship letter shared'}
-    selected_list = {'selected', 'yes', 'shortlisted'}
-    rejected_list = {'rejected', 'rejected in r1', 'rejected in r2', 'rejected in technical screening', 'offer declined...'}
-    screening_list = {'screening reject'}
-    pending_list = {
-        'in process', 'under discussion',
-        'pending at r1', 'pending at r2', 'pending at r3',
-        'on hold',
-        'scheduled for r1', 'scheduled for r2', 'scheduled for r3',
-    }
-
-    def categorize_status(row):
-        status = row.get('Status')
-        r1, r2, r3 = row.get('Status of R1'), row.get('Status of R2'), row.get('Status of R3')
-
-        # Normalize text safely
-        status_txt = "" if pd.isna(status) else str(status).strip()
-        status_lc = status_txt.lower()
-        r1_txt = "" if pd.isna(r1) else str(r1).strip()
-        r2_txt = "" if pd.isna(r2) else str(r2).strip()
-        r3_txt = "" if pd.isna(r3) else str(r3).strip()
-        
-        # Treat blanks as Pending (requested)
-        if status_txt == "" or status_lc == "nan":
-            return ('Pending/Active', None)
-
-        if status_lc in joined_list:
-            return ('Joined', None)
-        if status_lc in selected_list:
-            return ('Selected', None)
-        if status_lc in screening_list:
-            return ('Screening Reject', None)
-        
-        # Determine reject round (but we’ll consolidate by default in the charts)
-        reject_round = None
-        if r1_txt == 'Not Cleared':
-            reject_round = 'R1'
-        elif r2_txt == 'Not Cleared':
-            reject_round = 'R2'
-        elif r3_txt == 'Not Cleared':
-            reject_round = 'R3'
-
-        if status_lc in rejected_list or ('rejected' in status_lc):
-            # If no round info, treat as screening reject (keeps your prior behavior)
-            if reject_round is None and (r1_txt == "" and r2_txt == "" and r3_txt == ""):
-                return ('Screening Reject', None)
-            return ('Rejected', reject_round)
-            
-        if status_lc in pending_list:
-            return ('Pending/Active', None)
-
-        return ('Other', None)
-
-    df[['Dashboard_Category', 'Reject_Round']] = df.apply(categorize_status, axis=1, result_type='expand')
-    return df
-
-df_raw = load_and_clean_data()
+# A tracker CSV, a directory of them or a glob (one sheet per business unit)
+DATA_PATH = os.environ.get('TA_TRACKER_PATH', 'TA Tracker - HM Sheet.csv')
+
+# Seconds between each session's check for a new tracker snapshot
+UPDATE_CHECK_SECONDS = 1
+
+# Where filters, option counts, KPIs and table pages are queried: pandas (in memory), sqlite or duckdb,
+# or stream (aggregates and pages read from the file, for a tracker too large to load)
+BACKEND = os.environ.get('TA_BACKEND', 'pandas')
+STREAMING = BACKEND == 'stream'
+# Only the pandas backend loads the tracker into memory and builds the analysis structures
+IN_MEMORY = BACKEND == 'pandas'
+
+@st.cache_resource
+def get_dataset_holder():
+    # One read-only tracker snapshot per process, shared by reference with every session;
+    # reloaded only when a tracker file changed. Streaming mode holds a TrackerStream instead of the frame,
+    # the SQL backends a database file of the current data version.
+    if IN_MEMORY:
+        return DatasetHolder(DATA_PATH)
+    return StreamHolder(DATA_PATH) if STREAMING else DatabaseHolder(DATA_PATH, BACKEND)
+
+@st.cache_resource
+def get_tracker_watcher():
+    # Background stat polling: reloads the shared snapshot within a second of a save
+    return TrackerWatcher(get_dataset_holder()).start()
+
+@st.fragment(run_every=UPDATE_CHECK_SECONDS)
+def follow_tracker_updates(version):
+    # Reruns on its own every second; a newer snapshot from the watcher reruns the whole page
+    if holder.version != version:
+        st.rerun(scope="app")
+    if holder.error is not None:
+        st.caption(f"⚠️ Tracker reload failed, showing the previous data: {holder.error}")
+
+@st.cache_resource(max_entries=2)
+def build_analysis(_df, data_version):
+    # Filter index, metrics cube, stage durations and search, built once per data version and shared by all sessions
+    return TrackerAnalysis(_df)
+
+@st.cache_resource(max_entries=64)
+def build_trend_figures(view_key, freq, _analysis, _state, _positions):
+    # Trend per filtered view and frequency, aggregated and serialized once and shared by all sessions
+    trend = _analysis.trend(_state, freq, _positions)
+    return build_sourcing_trend_figure(trend).to_json(), build_rejection_trend_figure(trend).to_json()
+
+@st.cache_resource(max_entries=64)
+def build_interview_views(view_key, _interviews, _positions):
+    # Panelist load chart, feedback turnaround and pass rates per filtered view, shared by all sessions
+    rates = _interviews.pass_rates(_positions)
+    pass_rates = rates.pivot(index='HM', columns='Round', values='Pass %')
+    pass_rates.columns = [f"{r} Pass %" for r in pass_rates.columns]
+    interviews = rates[['Cleared', 'Not Cleared', 'Pending']].sum(axis=1).groupby(rates['HM'], observed=True).sum()
+    pass_rates.insert(0, 'Interviews', interviews)
+    return (
+        build_panelist_load_figure(_interviews.panelist_load(_positions)).to_json(),
+        _interviews.feedback_turnaround(_positions),
+        _interviews.feedback_turnaround(_positions, by='Panelist'),
+        pass_rates.sort_values('Interviews', ascending=False),
+    )
+
+# Table layouts for the Candidate Metrics and Detailed Records tabs
+KPI_TABLE_COLUMNS = {
+    'Candidate Name': 'Candidate Name',
+    'HM Details': 'HM',
+    'Skill': 'Skill',
+}
+RECORD_COLUMNS = ['Candidate Name', 'HM Details', 'Skill', 'Status', 'Dashboard_Category', 'Recruiter Name']
+
+def prepare_kpi_page(page):
+    # Rename columns for display; durations and Quality of Hire for the page rows only
+    page_kpi = page[list(KPI_TABLE_COLUMNS)].rename(columns=KPI_TABLE_COLUMNS)
+    if durations is None:
+        # Streaming mode: the page's own dates give the same durations
+        timings = StageDurations(page).frame(np.arange(len(page)), as_of=today)
+    else:
+        timings = durations.frame(page.index.to_numpy(), as_of=today)
+    timings.index = page.index
+    page_kpi = page_kpi.join(timings)
+    page_kpi['Quality of Hire'] = quality_of_hire(page['Dashboard_Category'])
+    return page_kpi
+
+def prepare_record_page(page):
+    # Repeat candidates link to their earlier application (the sheet's red highlight)
+    if identities is None:
+        return page[RECORD_COLUMNS]
+    repeats = identities.frame(page.index.to_numpy(), df_raw)
+    repeats.index = page.index
+    return page[RECORD_COLUMNS].join(repeats)
+
+@st.cache_resource(max_entries=2)
+def build_sort_keys(_analysis, data_version, today):
+    # Precomputed sort ranks for both tables, shared by all sessions (SLA breach flags change daily)
+    df, identities = _analysis.df, _analysis.identities
+    kpi_keys = {display: df[col] for col, display in KPI_TABLE_COLUMNS.items()}
+    kpi_keys.update(_analysis.durations.frame(np.arange(len(df)), as_of=today))
+    kpi_keys['Quality of Hire'] = quality_of_hire(df['Dashboard_Category'])
+    record_keys = {col: df[col] for col in RECORD_COLUMNS}
+    # Applications: by count, then each person's applications together and in order
+    record_keys['Applications'] = pd.Series(
+        np.lexsort((identities.application, identities.identity, identities.applications)).argsort())
+    return SortKeys(kpi_keys), SortKeys(record_keys)
+
+@st.cache_resource
+def get_recorder():
+    # Stage timings shared across sessions; TA_PERF_LOG / TA_PERF_METRICS add a JSON log and a Prometheus file
+    return Recorder.from_env()
+
+@st.cache_resource
+def get_view_cache():
+    # Filtered views (positions, KPIs, funnel figure) shared across sessions, LRU with a memory cap
+    return ViewCache()
+
+# Per-stage timings for this rerun; recorded only when the Performance panel (?perf=1) or a sink is on
+recorder = get_recorder()
+show_performance = st.query_params.get("perf") == "1" or os.environ.get('TA_PERF_PANEL') == '1'
+run = recorder.run(enabled=show_performance or recorder.has_sinks)
+
+holder = get_dataset_holder()
+watcher = get_tracker_watcher()
+loads = holder.loads
+with run.stage('load') as span:
+    dataset = holder.current()
+    span.rows_out = len(dataset)
+run.hit('dataset', holder.loads == loads)
+data_version = dataset.version
+today = pd.Timestamp.today().normalize()  # open candidates' SLA breaches are aged to this
+with run.stage('indexes'):
+    if IN_MEMORY:
+        df_raw = dataset.frame
+        analysis = build_analysis(df_raw, data_version)
+        durations, identities = analysis.durations, analysis.identities
+        kpi_sort_keys, record_sort_keys = build_sort_keys(analysis, data_version, today)
+        backend = PandasBackend(analysis)
+    else:
+        # Nothing row-level in memory: the stream's aggregates or the database answer, pages are fetched per page
+        df_raw = analysis = durations = identities = None
+        kpi_sort_keys = record_sort_keys = SortKeys({})
+        backend = StreamBackend(dataset.frame, data_version) if STREAMING else dataset.frame
 
 # 3. Sidebar Filters
-with st.sidebar:
+with st.sidebar, run.stage('sidebar'):
     st.title("TA Analytics")
+    follow_tracker_updates(data_version)
     st.subheader("Filters")
     
     # Date Range Filter
-    min_date = df_raw['Sourcing Date'].min()
-    max_date = df_raw['Sourcing Date'].max()
+    min_date, max_date = backend.date_bounds()
     date_range = st.date_input("Sourcing Date Range", [min_date, max_date])
     
-    # Expandable Checkbox Filters
-    with st.expander("🏢 Hiring Manager", expanded=False):
-        hm_options = sorted(df_raw['HM Details'].dropna().unique())
-        col_a, col_b = st.columns(2)
-        with col_a:
-            if st.button("✔️ All", key="hm_select_all", use_container_width=True):
-                for hm in hm_options:
-                    st.session_state[f"hm_{hm}"] = True
-        with col_b:
-            if st.button("❌ Clear", key="hm_deselect_all", use_container_width=True):
-                for hm in hm_options:
-                    st.session_state[f"hm_{hm}"] = False
-        
-        hm_filter = [hm for hm in hm_options if st.checkbox(hm, key=f"hm_{hm}")]
-    
-    with st.expander("💼 Skill", expanded=False):
-        skill_options = sorted(df_raw['Skill'].dropna().unique())
-        col_a, col_b = st.columns(2)
-        with col_a:
-            if st.button("✔️ All", key="skill_select_all", use_container_width=True):
-                for skill in skill_options:
-                    st.session_state[f"skill_{skill}"] = True
-        with col_b:
-            if st.button("❌ Clear", key="skill_deselect_all", use_container_width=True):
-                for skill in skill_options:
-                    st.session_state[f"skill_{skill}"] = False
-        
-        skill_filter = [skill for skill in skill_options if st.checkbox(skill, key=f"skill_{skill}")]
-    
-    with st.expander("📍 Location", expanded=False):
-        loc_options = sorted(df_raw['Location of posting'].dropna().unique())
-        col_a, col_b = st.columns(2)
-        with col_a:
-            if st.button("✔️ All", key="loc_select_all", use_container_width=True):
-                for loc in loc_options:
-                    st.session_state[f"loc_{loc}"] = True
-        with col_b:
-            if st.button("❌ Clear", key="loc_deselect_all", use_container_width=True):
-                for loc in loc_options:
-                    st.session_state[f"loc_{loc}"] = False
-        
-        loc_filter = [loc for loc in loc_options if st.checkbox(loc, key=f"loc_{loc}")]
-    
-    with st.expander("👤 Recruiter", expanded=False):
-        recruiter_options = sorted(df_raw['Recruiter Name'].dropna().unique())
-        col_a, col_b = st.columns(2)
-        with col_a:
-            if st.button("✔️ All", key="recruiter_select_all", use_container_width=True):
-                for recruiter in recruiter_options:
-                    st.session_state[f"recruiter_{recruiter}"] = True
-        with col_b:
-            if st.button("❌ Clear", key="recruiter_deselect_all", use_container_width=True):
-                for recruiter in recruiter_options:
-                    st.session_state[f"recruiter_{recruiter}"] = False
-        
-        recruiter_filter = [recruiter for recruiter in recruiter_options if st.checkbox(recruiter, key=f"recruiter_{recruiter}")]
-    
-    name_search = st.text_input("Search Candidate Name")
+    # Searchable multi-select filters; selections live in session state as one set per filter
+    hm_filter = filter_multiselect("🏢 Hiring Manager", "hm", backend.value_counts('HM Details'))
+    skill_filter = filter_multiselect("💼 Skill", "skill", backend.value_counts('Skill'))
+    loc_filter = filter_multiselect("📍 Location", "loc", backend.value_counts('Location of posting'))
+    recruiter_filter = filter_multiselect("👤 Recruiter", "recruiter", backend.value_counts('Recruiter Name'))
+    unit_counts = backend.value_counts('Business Unit')
+    unit_filter = filter_multiselect("🏛️ Business Unit", "unit", unit_counts) if (unit_counts > 0).sum() > 1 else []
+    
+    if STREAMING:
+        name_search, fuzzy_search, dedupe = "", False, False
+        st.caption("Streaming mode: candidate search and repeat-candidate counting need the full tracker in memory.")
+    else:
+        name_search = st.text_input("Search Candidate (name, mail or mobile)")
+        fuzzy_search = st.checkbox("Typo-tolerant search", key="fuzzy_search")
+        dedupe = st.checkbox("Count repeat candidates once", key="dedupe",
+                             help="Matched on mobile number, mail id or name + date of birth; the latest application counts")
 
-# Apply Filters
-df = df_raw.copy()
-if len(date_range) == 2:
-    df = df[(df['Sourcing Date'].dt.date >= date_range[0]) & (df['Sourcing Date'].dt.date <= date_range[1])]
-if hm_filter: df = df[df['HM Details'].isin(hm_filter)]
-if skill_filter: df = df[df['Skill'].isin(skill_filter)]
-if loc_filter: df = df[df['Location of posting'].isin(loc_filter)]
-if recruiter_filter: df = df[df['Recruiter Name'].isin(recruiter_filter)]
-if name_search: df = df[df['Candidate Name'].str.contains(name_search, case=False)]
+    # Statuses not covered by .streamlit/status_rules.toml
+    unknown = backend.unknown
+    with st.expander(f"🩺 Data Diagnostics ({len(unknown)})", expanded=False):
+        if unknown.empty:
+            st.caption("All statuses are covered by the status rules.")
+        else:
+            st.caption("Statuses not matched by .streamlit/status_rules.toml (counted as Other):")
+            st.dataframe(unknown, use_container_width=True)
+
+# Apply Filters (memoized per normalized filter state and data version)
+filter_state = FilterState.from_widgets(
+    hm=hm_filter,
+    skill=skill_filter,
+    location=loc_filter,
+    recruiter=recruiter_filter,
+    business_unit=unit_filter,
+    date_range=date_range if len(date_range) == 2 else None,
+    name=name_search,
+    fuzzy=fuzzy_search,
+    dedupe=dedupe,
+)
+view_cache = get_view_cache()
+view_key = filter_state.key(f"{data_version}@{today.date()}")
+view = view_cache.get(view_key)
+run.hit('view', view is not None)
+if view is None:
+    steps = [] if run.enabled else None
+    positions = backend.positions(filter_state, steps=steps)
+    for label, seconds, rows_in, rows_out in steps or []:
+        run.add(f"filter: {label}", seconds, rows_in, rows_out)
+    with run.stage('metrics', rows_in=len(positions)):
+        # The cube answers the cards, funnel and Quick Stats; a name search needs the matching rows
+        kpis = backend.kpis(filter_state, positions)
+        duration_summary = backend.duration_summary(filter_state, positions, as_of=today)
+    with run.stage('figures'):
+        view = view_cache.put(view_key, View(
+            compact_positions(positions), kpis, build_funnel_figure(kpis).to_json(),
+            duration_summary, build_duration_figure(duration_summary).to_json(),
+            repeats=backend.repeats(filter_state, positions),
+        ))
+kpis = view.kpis
 
 # 4. Main Dashboard UI
 st.markdown("<h1>📊 Talent Acquisition Dashboard</h1>", unsafe_allow_html=True)
@@ -411,48 +481,48 @@ st.markdown("<p style='color: #64748b; font-size: 1.1rem; margin-top: -0.5rem;'>
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Top Metrics Row with Colored Blocks (Like your reference image)
-m1, m2, m3, m4, m5 = st.columns(5)
-
-# Data for blocks
-total_val = len(df)
-rejected_val = len(df[df['Dashboard_Category'] == 'Rejected'])
-selected_val = len(df[df['Dashboard_Category'] == 'Selected'])
-joined_val = len(df[df['Dashboard_Category'] == 'Joined'])
-pending_val = len(df[df['Dashboard_Category'] == 'Pending/Active'])
+m1, m2, m3, m4, m5, m6 = st.columns(6)
 
-# Rendering Blocks (Order: Total, Rejections, Selected, Joined, Pending)
+# Rendering Blocks (Order: Total, Rejections, Selected, Joined, Pending, Repeat)
 with m1:
     st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);">
-        <h3>👥 Total Candidates</h3><h2>{total_val}</h2>
+        <h3>👥 {"Unique" if filter_state.dedupe else "Total"} Candidates</h3><h2>{kpis.total}</h2>
     </div>""", unsafe_allow_html=True)
 
 with m2:
     st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #ec4899 0%, #ef4444 100%);">
-        <h3>❌ Rejections</h3><h2>{rejected_val}</h2>
+        <h3>❌ Rejections</h3><h2>{kpis.rejected}</h2>
     </div>""", unsafe_allow_html=True)
 
 with m3:
     st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #f59e0b 0%, #f97316 100%);">
-        <h3>⭐ Selected</h3><h2>{selected_val}</h2>
+        <h3>⭐ Selected</h3><h2>{kpis.selected}</h2>
     </div>""", unsafe_allow_html=True)
 
 with m4:
     st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #10b981 0%, #059669 100%);">
-        <h3>✅ Joined</h3><h2>{joined_val}</h2>
+        <h3>✅ Joined</h3><h2>{kpis.joined}</h2>
     </div>""", unsafe_allow_html=True)
 
 with m5:
     st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #06b6d4 0%, #3b82f6 100%);">
-        <h3>⏳ Pending</h3><h2>{pending_val}</h2>
+        <h3>⏳ Pending</h3><h2>{kpis.pending}</h2>
+    </div>""", unsafe_allow_html=True)
+
+with m6:
+    st.markdown(f"""<div class="kpi-card" style="background: linear-gradient(135deg, #64748b 0%, #475569 100%);">
+        <h3>🔁 Repeat Candidates</h3><h2>{"—" if view.repeats is None else view.repeats}</h2>
     </div>""", unsafe_allow_html=True)
 
 st.markdown("<br>", unsafe_allow_html=True)
 
 # Analytics Tabs
-tab1, tab2, tab3 = st.tabs(["📊 Pipeline Overview", "📈 Candidate Metrics", "📋 Detailed Records"])
+tab1, tab2, tab3, tab4, tab5 = st.tabs(
+    ["📊 Pipeline Overview", "📈 Candidate Metrics", "📋 Detailed Records", "📅 Trends", "🎤 Interviews"]
+)
 
 # Tab 1: Pipeline Funnel
-with tab1:
+with tab1, run.stage('tab: Pipeline Overview'):
     st.markdown("<br>", unsafe_allow_html=True)
     
     col1, col2 = st.columns([2, 1])
@@ -460,126 +530,110 @@ with tab1:
     with col1:
         st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>🎯 Recruitment Pipeline</h3>", unsafe_allow_html=True)
         
-        # Calculate funnel metrics
-        total_candidates = len(df)
-        screening_rejected = len(df[df['Dashboard_Category'] == 'Screening Reject'])
-        interview_rejected = len(df[df['Dashboard_Category'] == 'Rejected'])
-        shortlisted = len(df[df['Dashboard_Category'] == 'Selected'])
-        joined = len(df[df['Dashboard_Category'] == 'Joined'])
-        
-        # Create funnel data (Total at top, Joined at bottom, left-aligned)
-        funnel_data = {
-            'Stage': ['Total Candidates', 'After Screening', 'After Interviews', 'Shortlisted', 'Joined'],
-            'Count': [total_candidates, total_candidates - screening_rejected, total_candidates - screening_rejected - interview_rejected, shortlisted, joined]
-        }
-        funnel_df = pd.DataFrame(funnel_data)
-        
-        # Create left-aligned funnel chart using horizontal bar
-        fig_funnel = px.bar(
-            funnel_df,
-            y='Stage',
-            x='Count',
-            orientation='h',
-            color='Stage',
-            color_discrete_sequence=['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#8b5cf6'],
-            text='Count'
-        )
-        fig_funnel.update_layout(
-            height=450,
-            showlegend=False,
-            xaxis_title="Number of Candidates",
-            yaxis_title=None,
-            xaxis=dict(
-                showgrid=True, 
-                gridcolor='#e5e7eb',
-                range=[0, total_candidates * 1.15],  # Add 15% padding to show full bar with text
-                fixedrange=True  # Disable zoom/pan
-            ),
-            yaxis=dict(
-                categoryorder='array', 
-                categoryarray=['Joined', 'Shortlisted', 'After Interviews', 'After Screening', 'Total Candidates'],
-                fixedrange=True  # Disable zoom/pan
-            ),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(size=14, color='#1e293b'),
-            margin=dict(l=20, r=50, t=10, b=50),  # Increased bottom margin to show x-axis
-            autosize=True
-        )
-        fig_funnel.update_traces(
-            textposition='outside',
-            textfont=dict(size=18, color='#000000', family='Inter', weight='bold'),  # Changed to pure black and bold
-            marker=dict(line=dict(width=0)),
-            texttemplate='%{text}'
-        )
-        st.plotly_chart(fig_funnel, use_container_width=True)
+        st.plotly_chart(pio.from_json(view.funnel_json), use_container_width=True)
     
     with col2:
         st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>📌 Quick Stats</h3>", unsafe_allow_html=True)
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Quick stats cards
-        pending_count = len(df[df['Dashboard_Category'] == 'Pending/Active'])
-        conversion_rate = (joined / total_candidates * 100) if total_candidates > 0 else 0
-        selection_rate = (shortlisted / total_candidates * 100) if total_candidates > 0 else 0
-        
         st.markdown(f"""
         <div style='background: white; padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
             <p style='color: #718096; margin: 0; font-size: 0.875rem;'>Pending Candidates</p>
-            <h2 style='color: #2d3748; margin: 0.25rem 0 0 0; font-size: 2rem;'>{pending_count}</h2>
+            <h2 style='color: #2d3748; margin: 0.25rem 0 0 0; font-size: 2rem;'>{kpis.pending}</h2>
         </div>
         
         <div style='background: white; padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
             <p style='color: #718096; margin: 0; font-size: 0.875rem;'>Conversion Rate</p>
-            <h2 style='color: #48bb78; margin: 0.25rem 0 0 0; font-size: 2rem;'>{conversion_rate:.1f}%</h2>
+            <h2 style='color: #48bb78; margin: 0.25rem 0 0 0; font-size: 2rem;'>{kpis.conversion_rate:.1f}%</h2>
         </div>
         
         <div style='background: white; padding: 1.5rem; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);'>
             <p style='color: #718096; margin: 0; font-size: 0.875rem;'>Shortlist Rate</p>
-            <h2 style='color: #4299e1; margin: 0.25rem 0 0 0; font-size: 2rem;'>{selection_rate:.1f}%</h2>
+            <h2 style='color: #4299e1; margin: 0.25rem 0 0 0; font-size: 2rem;'>{kpis.shortlist_rate:.1f}%</h2>
         </div>
         """, unsafe_allow_html=True)
 
 # Tab 2: Candidate Metrics
-with tab2:
+with tab2, run.stage('tab: Candidate Metrics'):
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>📈 Performance Metrics</h3>", unsafe_allow_html=True)
     
-    # Prepare KPI data for candidates
-    kpi_columns = ['Candidate Name', 'HM Details', 'Skill', 'Status', 'Dashboard_Category', 'TTF (60 days)', 'TTH (30 days)']
-    df_kpi = df[kpi_columns].copy()
-    df_kpi.columns = ['Candidate Name', 'HM', 'Skill', 'Status', 'Category', 'TTF', 'TTH']
-    
-    # Rename columns for display and convert to numeric where possible
-    df_kpi_display = df_kpi.copy()
-    df_kpi_display['TTF'] = pd.to_numeric(df_kpi_display['TTF'], errors='coerce')
-    df_kpi_display['TTH'] = pd.to_numeric(df_kpi_display['TTH'], errors='coerce')
-    
-    # Calculate Quality of Hire (based on joining status)
-    def quality_of_hire(row):
-        if row['Category'] == 'Selected':
-            return 'High'
-        elif row['Category'] == 'Pending/Active':
-            return 'In Progress'
-        else:
-            return 'Not Selected'
-    
-    df_kpi_display['Quality of Hire'] = df_kpi_display.apply(quality_of_hire, axis=1)
-    
-    # Display as a formatted dataframe
-    st.dataframe(
-        df_kpi_display[['Candidate Name', 'HM', 'Skill', 'TTF', 'TTH', 'Quality of Hire']],
-        use_container_width=True,
-        height=500
-    )
+    # Stage durations for the filtered candidates (recomputed from the tracker dates)
+    duration_stats = view.durations.set_index('Measure')
+    for column, measure, sla in zip(st.columns(2), ['Time to Fill', 'Time to Hire'], [TTF_SLA_DAYS, TTH_SLA_DAYS]):
+        stats = duration_stats.loc[measure]
+        with column:
+            st.metric(
+                f"Median {measure} (SLA {sla} days)",
+                "—" if pd.isna(stats['P50']) else f"{stats['P50']:.0f} days",
+                f"{int(stats['SLA Breaches']):,} over SLA",
+                delta_color="inverse",
+            )
+    st.plotly_chart(pio.from_json(view.durations_json), use_container_width=True)
+    if STREAMING:
+        st.caption("Streaming mode: stage durations cover the whole tracker, not only the filtered candidates.")
+
+    # Server-side paginated: only the visible page is prepared and serialized
+    paginated_table("kpi_table", backend.rows, view.positions, kpi_sort_keys, prepare_kpi_page, view_key)
 
 # Tab 3: Detailed Records
-with tab3:
+with tab3, run.stage('tab: Detailed Records'):
     st.markdown("<br>", unsafe_allow_html=True)
     st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>📋 Complete Candidate Data</h3>", unsafe_allow_html=True)
     
-    st.dataframe(
-        df[['Candidate Name', 'HM Details', 'Skill', 'Status', 'Dashboard_Category', 'Recruiter Name']],
-        use_container_width=True,
-        height=500
-    )
\ No newline at end of file
+    paginated_table("records_table", backend.rows, view.positions, record_sort_keys, prepare_record_page, view_key)
+    if view.repeats is not None:
+        st.caption(f"🔁 {view.repeats:,} repeat applications in this view: the same mobile number, mail id or "
+                   "name + date of birth applied before. Applications shows which attempt a row is.")
+
+# Tab 4: Trends (summed from the metrics cube, so they cost the same at any tracker size)
+with tab4, run.stage('tab: Trends'):
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>📅 Pipeline Trends</h3>", unsafe_allow_html=True)
+
+    if analysis is None:
+        st.info("Trends need the metrics cube, which is built from the full tracker in memory (TA_BACKEND=pandas).")
+    else:
+        period = st.radio("Period", list(TREND_FREQUENCIES), horizontal=True, key="trend_period",
+                          label_visibility="collapsed")
+        freq = TREND_FREQUENCIES[period]
+        sourcing_json, rejection_json = build_trend_figures(view_key, freq, analysis, filter_state, view.positions)
+        st.plotly_chart(pio.from_json(sourcing_json), use_container_width=True)
+        st.plotly_chart(pio.from_json(rejection_json), use_container_width=True)
+        st.caption("Sourced and rejected candidates are counted by sourcing date, joins by joining date.")
+
+# Tab 5: Interviews (one event per candidate and round, from the R1 / R2 / R3 columns)
+with tab5, run.stage('tab: Interviews'):
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown("<h3 style='color: #1e293b; font-weight: 600;'>🎤 Interview Rounds</h3>", unsafe_allow_html=True)
+
+    if analysis is None:
+        st.info("Interview analytics need the interview events, which are built from the full tracker in memory "
+                "(TA_BACKEND=pandas).")
+    else:
+        load_json, turnaround_by_round, turnaround_by_panelist, pass_rates = build_interview_views(
+            view_key, analysis.interviews, view.positions)
+        st.plotly_chart(pio.from_json(load_json), use_container_width=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("<h4 style='color: #1e293b; font-weight: 600;'>⏱️ Feedback Turnaround (days)</h4>",
+                        unsafe_allow_html=True)
+            st.dataframe(turnaround_by_round, use_container_width=True)
+            st.dataframe(turnaround_by_panelist, use_container_width=True, height=300)
+        with col2:
+            st.markdown("<h4 style='color: #1e293b; font-weight: 600;'>✅ Pass Rate per Round</h4>",
+                        unsafe_allow_html=True)
+            st.dataframe(pass_rates, use_container_width=True, height=460)
+        st.caption("Pass rate: cleared out of decided (cleared or not cleared) interviews. Turnaround: interview "
+                   "date to feedback date, ignoring gaps that are negative or longer than a year.")
+
+# Admin Performance panel: p50 / p95 per stage across sessions, filter row counts and cache hit ratios
+if show_performance:
+    with st.sidebar:
+        with st.expander("⏱️ Performance", expanded=False):
+            st.dataframe(recorder.summary(), use_container_width=True, hide_index=True)
+            for cache, (hits, misses, ratio) in recorder.hit_ratios().items():
+                st.caption(f"{cache} cache: {ratio:.0%} hits ({hits:,} of {hits + misses:,})")
+run.finish()
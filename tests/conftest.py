@@ -0,0 +1,71 @@
+"""Trackers and filter states shared by the parity tests."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tracker.index import DATE_COLUMN, FILTER_COLUMNS
+from tracker.loader import read_tracker
+from tracker.synthetic import write_tracker
+from tracker.views import FilterState
+
+TRACKER_CSV = Path(__file__).resolve().parent.parent / 'TA Tracker - HM Sheet.csv'
+SYNTHETIC_ROWS = 20_000
+
+# FilterState.from_widgets keyword per filter column
+WIDGETS = {
+    'HM Details': 'hm', 'Skill': 'skill', 'Location of posting': 'location', 'Recruiter Name': 'recruiter',
+    'Business Unit': 'business_unit',
+}
+
+
+@pytest.fixture(scope='session')
+def sample():
+    return read_tracker(TRACKER_CSV)
+
+
+@pytest.fixture(scope='session')
+def synthetic_csv(tmp_path_factory):
+    return write_tracker(tmp_path_factory.mktemp('trackers') / 'TA Tracker - Synthetic.csv', SYNTHETIC_ROWS, seed=7)
+
+
+@pytest.fixture(scope='session')
+def synthetic(synthetic_csv):
+    return read_tracker(synthetic_csv)
+
+
+@pytest.fixture(params=['sample', 'synthetic'])
+def tracker(request):
+    return request.getfixturevalue(request.param)
+
+
+def random_states(df, count, seed=0):
+    """``count`` random filter states over ``df``'s values: some columns, some dates, now and then an unknown value."""
+    rng = np.random.default_rng(seed)
+    dates = df[DATE_COLUMN].dropna().dt.date.to_numpy()
+    states = []
+    for _ in range(count):
+        widgets = {}
+        for col in FILTER_COLUMNS:
+            if col in df.columns and rng.random() < 0.4:
+                values = df[col].dropna().unique()
+                chosen = list(rng.choice(values, size=min(len(values), rng.integers(1, 4)), replace=False))
+                widgets[WIDGETS[col]] = chosen + ['No such value'] * (rng.random() < 0.1)
+        if len(dates) and rng.random() < 0.5:
+            widgets['date_range'] = sorted(rng.choice(dates, size=2))
+        states.append(FilterState.from_widgets(**widgets))
+    return states
+
+
+def naive_mask(df, state):
+    """Rows matching ``state``'s column and date filters, one boolean mask per filter."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in state.selections.items():
+        if values:
+            mask &= df[col].isin(values).to_numpy()
+    if state.date_range is not None:
+        lo, hi = (pd.Timestamp(d) for d in state.date_range)
+        days = df[DATE_COLUMN].dt.floor('D')
+        mask &= ((days >= lo) & (days <= hi)).to_numpy()
+    return mask
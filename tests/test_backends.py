@@ -0,0 +1,177 @@
+"""The SQL backends against the in-memory pandas backend over the same trackers."""
+import importlib.util
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV, random_states
+from tracker.analysis import TrackerAnalysis
+from tracker import backends as backends_module
+from tracker.backends import DatabaseHolder, PandasBackend, SqlBackend, open_backend
+from tracker.index import FILTER_COLUMNS
+from tracker.sources import load_trackers
+from tracker.views import FilterState
+
+ENGINES = ['sqlite', pytest.param('duckdb', marks=pytest.mark.skipif(
+    importlib.util.find_spec('duckdb') is None, reason="duckdb is not installed",
+))]
+
+
+@pytest.fixture(scope='module')
+def analysis(tmp_path_factory, synthetic_csv):
+    # Two business units with different column sets, loaded the way the dashboard loads a directory
+    trackers = tmp_path_factory.mktemp('units')
+    shutil.copy(TRACKER_CSV, trackers / 'TA Tracker - HM Sheet.csv')
+    shutil.copy(synthetic_csv, trackers / 'TA Tracker - Synthetic.csv')
+    return TrackerAnalysis(load_trackers(str(trackers), cache_dir=tmp_path_factory.mktemp('cache')))
+
+
+@pytest.fixture(scope='module', params=ENGINES)
+def backends(request, analysis, tmp_path_factory):
+    """``(pandas backend, SQL backend)`` over the same data version."""
+    sql = open_backend(analysis, request.param, directory=tmp_path_factory.mktemp(request.param))
+    return PandasBackend(analysis), sql
+
+
+def searches(df, count, seed=0):
+    """Name fragments, mail prefixes and mobile digits taken from the tracker, plus one that matches nothing."""
+    rng = np.random.default_rng(seed)
+    names = df['Candidate Name'].dropna().astype(str).to_numpy()
+    mails = df['Mail Id'].dropna().astype(str).to_numpy()
+    mobiles = df['Mobile Number'].dropna().astype(str).str.replace(r'\D', '', regex=True).to_numpy()
+    queries = ['zzzz qqqq']
+    for _ in range(count):
+        name, mail, mobile = rng.choice(names), rng.choice(mails), rng.choice(mobiles)
+        word = rng.choice(name.split() or [name])
+        queries += [word[:3], name, f'  {name.upper()}  ', mail[:6], mobile[:5], mobile[-6:]]
+    return queries
+
+
+def plain(values):
+    return [None if pd.isna(v) else v for v in values]
+
+
+def test_version_and_size(analysis, backends):
+    _, sql = backends
+    assert sql.version == analysis.version
+    assert sql.size == len(analysis.df)
+
+
+def test_value_counts(analysis, backends):
+    pandas, sql = backends
+    for col in FILTER_COLUMNS:
+        expected = pandas.value_counts(col)
+        assert sql.value_counts(col).to_dict() == expected[expected > 0].to_dict()
+
+
+@pytest.mark.parametrize('dedupe', [False, True])
+def test_filters(analysis, backends, dedupe):
+    pandas, sql = backends
+    for state in random_states(analysis.df, 150, seed=6):
+        if dedupe:
+            state = FilterState.from_widgets(**{**state.__dict__, 'dedupe': True, 'date_range': None})
+        positions = pandas.positions(state)
+        assert np.array_equal(sql.positions(state), positions), state
+        assert sql.kpis(state) == pandas.kpis(state, positions), state
+        assert sql.repeats(state) == pandas.repeats(state, positions), state
+
+
+def test_duration_summary(analysis, backends):
+    pandas, sql = backends
+    for state in random_states(analysis.df, 20, seed=9):
+        expected = pandas.duration_summary(state, pandas.positions(state))
+        pd.testing.assert_frame_equal(sql.duration_summary(state), expected, check_dtype=False)
+
+
+def test_unknown_statuses(backends):
+    pandas, sql = backends
+    assert sql.unknown.to_dict() == pandas.unknown.rename(index=str).to_dict()
+
+
+def test_search(analysis, backends):
+    pandas, sql = backends
+    for query in searches(analysis.df, 40, seed=7):
+        for dedupe in (False, True):
+            state = FilterState.from_widgets(name=query, dedupe=dedupe)
+            positions = pandas.positions(state)
+            assert np.array_equal(sql.positions(state), positions), query
+            assert sql.kpis(state) == pandas.kpis(state, positions), query
+
+
+def test_rows(analysis, backends):
+    pandas, sql = backends
+    positions = np.random.default_rng(8).choice(len(analysis.df), size=300, replace=False)
+    got, expected = sql.rows(positions), pandas.rows(positions)
+    assert got.index.tolist() == positions.tolist()
+    assert got.columns.tolist() == expected.columns.tolist()
+    for col in expected.columns:
+        # Missing values come back as None or NaN rather than <NA> / NaT
+        assert plain(got[col]) == plain(expected[col]), col
+    assert sql.rows([]).empty
+
+
+def test_dates_before_year_1000(analysis, backends):
+    # The bundled sheet has a 0202 typo; it must round-trip through the ISO text the database stores
+    pandas, sql = backends
+    dates = analysis.df.select_dtypes('datetime')
+    positions = np.flatnonzero((dates.apply(lambda col: col.dt.year) < 1000).any(axis=1).to_numpy())
+    assert len(positions)
+    got, expected = sql.rows(positions), pandas.rows(positions)
+    for col in dates.columns:
+        assert plain(got[col]) == plain(expected[col]), col
+
+
+def test_date_bounds(backends):
+    pandas, sql = backends
+    assert sql.date_bounds() == pandas.date_bounds()
+
+
+def append_row(path):
+    """Save the tracker with its last data row repeated, as a new data version."""
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b''.join(lines) + lines[2])
+
+
+@pytest.fixture
+def tracker_file(tmp_path):
+    path = tmp_path / 'TA Tracker - HM Sheet.csv'
+    shutil.copy(TRACKER_CSV, path)
+    return path
+
+
+def database_holder(path, directory):
+    return DatabaseHolder(str(path), 'sqlite', directory, cache_dir=path.parent / 'cache', check_interval=0)
+
+
+def test_holder_opens_an_existing_database_without_loading(tracker_file, tmp_path, monkeypatch):
+    first = database_holder(tracker_file, tmp_path / 'db').current()
+    assert isinstance(first.frame, SqlBackend)
+    assert first.version == load_trackers(str(tracker_file), cache_dir=tmp_path / 'cache').attrs['data_version']
+
+    def no_loading(*args, **kwargs):
+        raise AssertionError("the tracker was loaded")
+
+    monkeypatch.setattr(backends_module, 'load_trackers', no_loading)
+    second = database_holder(tracker_file, tmp_path / 'db').current()
+    assert second.version == first.version and second.frame.path == first.frame.path
+    assert len(second) == first.frame.size
+
+
+def test_holder_prunes_only_its_own_released_databases(tracker_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(backends_module, 'RELEASE_GRACE_SECONDS', 0)
+    holder = database_holder(tracker_file, tmp_path / 'db')
+    v1 = holder.current().frame.path
+    # Another dashboard's database in the same directory
+    other = tmp_path / 'other.csv'
+    shutil.copy(TRACKER_CSV, other)
+    append_row(other)
+    foreign = database_holder(other, tmp_path / 'db').current().frame.path
+
+    append_row(tracker_file)
+    v2 = holder.refresh().frame.path
+    assert v2 != v1 and v1.exists()  # superseded, but a rerun may still be reading it
+    append_row(tracker_file)
+    v3 = holder.refresh().frame.path
+    assert not v1.exists() and v2.exists() and v3.exists() and foreign.exists()
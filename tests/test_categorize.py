@@ -0,0 +1,117 @@
+"""Parity of the vectorized categorize_status with the original row-wise version."""
+import itertools
+
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV
+from tracker.categorize import ROUND_STATUS_COLUMNS, categorize_status
+from tracker.loader import read_tracker
+
+# The categorization dashboard.py ran per row (df.apply(..., axis=1)) before it was vectorized
+JOINED = {'joined', 'internship letter shared'}
+SELECTED = {'selected', 'yes', 'shortlisted'}
+REJECTED = {'rejected', 'rejected in r1', 'rejected in r2', 'rejected in technical screening', 'offer declined...'}
+SCREENING = {'screening reject'}
+PENDING = {
+    'in process', 'under discussion',
+    'pending at r1', 'pending at r2', 'pending at r3',
+    'on hold',
+    'scheduled for r1', 'scheduled for r2', 'scheduled for r3',
+}
+
+
+def row_wise_categorize(row):
+    status = row.get('Status')
+    r1, r2, r3 = row.get('Status of R1'), row.get('Status of R2'), row.get('Status of R3')
+
+    status_txt = "" if pd.isna(status) else str(status).strip()
+    status_lc = status_txt.lower()
+    r1_txt = "" if pd.isna(r1) else str(r1).strip()
+    r2_txt = "" if pd.isna(r2) else str(r2).strip()
+    r3_txt = "" if pd.isna(r3) else str(r3).strip()
+
+    if status_txt == "" or status_lc == "nan":
+        return ('Pending/Active', None)
+    if status_lc in JOINED:
+        return ('Joined', None)
+    if status_lc in SELECTED:
+        return ('Selected', None)
+    if status_lc in SCREENING:
+        return ('Screening Reject', None)
+
+    reject_round = None
+    if r1_txt == 'Not Cleared':
+        reject_round = 'R1'
+    elif r2_txt == 'Not Cleared':
+        reject_round = 'R2'
+    elif r3_txt == 'Not Cleared':
+        reject_round = 'R3'
+
+    if status_lc in REJECTED or ('rejected' in status_lc):
+        if reject_round is None and (r1_txt == "" and r2_txt == "" and r3_txt == ""):
+            return ('Screening Reject', None)
+        return ('Rejected', reject_round)
+    if status_lc in PENDING:
+        return ('Pending/Active', None)
+    return ('Other', None)
+
+
+def mismatches(df, category, reject_round):
+    """Rows where ``(category, reject_round)`` differ from the row-wise result."""
+    expected = df.apply(row_wise_categorize, axis=1, result_type='expand')
+    got_round = reject_round.astype(object).fillna('-').to_numpy()
+    return (category.astype(object).to_numpy() != expected[0].to_numpy()) | (got_round != expected[1].fillna('-').to_numpy())
+
+
+def assert_matches_row_wise(df):
+    category, reject_round = categorize_status(df)
+    wrong = mismatches(df, category, reject_round)
+    assert not wrong.any(), df[wrong].assign(category=category[wrong], reject_round=reject_round[wrong])
+
+
+def test_bundled_tracker_as_read_originally():
+    # The original loader: read_csv with inferred dtypes, stripped string columns
+    df = pd.read_csv(TRACKER_CSV, skiprows=1)
+    df.columns = [col.strip() for col in df.columns]
+    df['Status'] = df['Status'].astype('string').str.strip()
+    assert_matches_row_wise(df)
+
+
+def test_bundled_tracker_through_the_schema():
+    # The same rows read by the schema loader: stripped categoricals and the bundled status rules
+    df = read_tracker(TRACKER_CSV)
+    wrong = mismatches(df, df['Dashboard_Category'], df['Reject_Round'])
+    assert not wrong.any(), df[wrong]
+
+
+STATUSES = [
+    None, '', '   ', 'nan', 'NaN', 'Joined', '  joined  ', 'INTERNSHIP LETTER SHARED', 'Selected', 'yes', 'Shortlisted ',
+    'Screening Reject', 'Rejected', 'rejected in R1', 'Rejected in technical screening', 'Offer Declined...',
+    'Rejected by client', 'Not rejected?', 'In Process', 'on hold', 'Scheduled for R3', 'Pending at r2', 'Hold',
+    'Dropped', '???',
+]
+ROUND_VALUES = [None, '', ' ', 'Not Cleared', ' Not Cleared ', 'not cleared', 'Cleared', 'Pending']
+
+
+def edge_case_frame():
+    rows = []
+    for status in STATUSES:
+        for r1, r2, r3 in itertools.product(ROUND_VALUES, repeat=3):
+            rows.append({'Status': status, 'Status of R1': r1, 'Status of R2': r2, 'Status of R3': r3})
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize('dtype', [object, 'string', 'category'])
+def test_edge_cases(dtype):
+    assert_matches_row_wise(edge_case_frame().astype(dtype))
+
+
+@pytest.mark.parametrize('missing', [['Status of R3'], ['Status of R1'], ROUND_STATUS_COLUMNS])
+def test_missing_round_columns(missing):
+    assert_matches_row_wise(edge_case_frame().drop(columns=missing))
+
+
+def test_empty_frame():
+    category, reject_round = categorize_status(edge_case_frame().iloc[:0])
+    assert len(category) == len(reject_round) == 0
@@ -0,0 +1,77 @@
+"""MetricsCube KPIs and trends against the same numbers computed from the matching rows."""
+import pandas as pd
+import pytest
+
+from conftest import naive_mask, random_states
+from tracker.analysis import TrackerAnalysis
+from tracker.categorize import REJECT_ROUNDS
+from tracker.cube import JOIN_DATE_COLUMN, TREND_COLUMNS, MetricsCube
+from tracker.index import DATE_COLUMN
+from tracker.metrics import compute_kpis
+from tracker.views import FilterState
+
+
+def period_start(dates, freq):
+    days = dates.dt.floor('D')
+    offset = days.dt.dayofweek if freq == 'W' else days.dt.day - 1
+    return days - pd.to_timedelta(offset, unit='D')
+
+
+def row_level_trend(rows, freq):
+    """Sourced and rejected rows per sourcing period, joins per joining period, gaps filled with 0."""
+    sourced = rows[rows[DATE_COLUMN].notna()]
+    counts = pd.DataFrame({
+        'Sourced': 1,
+        'Screening Reject': sourced['Dashboard_Category'] == 'Screening Reject',
+        **{f'{r} Reject': sourced['Reject_Round'] == r for r in REJECT_ROUNDS},
+    }, index=sourced.index).groupby(period_start(sourced[DATE_COLUMN], freq)).sum()
+    joined = rows[(rows['Dashboard_Category'] == 'Joined') & rows[JOIN_DATE_COLUMN].notna()]
+    joins = joined.groupby(period_start(joined[JOIN_DATE_COLUMN], freq)).size()
+
+    periods = counts.index.union(joins.index)
+    if len(periods):
+        periods = pd.date_range(periods.min(), periods.max(), freq='W-MON' if freq == 'W' else 'MS')
+    trend = counts.reindex(periods, fill_value=0)
+    trend['Joined'] = joins.reindex(periods, fill_value=0)
+    return trend[TREND_COLUMNS].astype('int64')
+
+
+def assert_same_trend(got, expected):
+    pd.testing.assert_frame_equal(got, expected, check_names=False, check_freq=False, check_index_type=False)
+
+
+@pytest.fixture
+def cube(tracker):
+    return MetricsCube(tracker)
+
+
+def test_kpis_match_the_rows(tracker, cube):
+    for state in random_states(tracker, 300, seed=2):
+        expected = compute_kpis(tracker['Dashboard_Category'][naive_mask(tracker, state)])
+        assert cube.kpis(state.selections, state.date_range) == expected, state
+
+
+@pytest.mark.parametrize('freq', ['W', 'M'])
+def test_trend_matches_the_rows(tracker, cube, freq):
+    for state in random_states(tracker, 60, seed=3):
+        got = cube.trend(state.selections, state.date_range, freq)
+        assert_same_trend(got, row_level_trend(tracker[naive_mask(tracker, state)], freq))
+
+
+def test_cube_is_no_larger_than_the_tracker(tracker, cube):
+    assert len(cube) <= len(tracker)
+    assert int(cube.counts.sum()) == len(tracker)
+
+
+def test_trend_for_a_name_search(sample):
+    analysis = TrackerAnalysis(sample)
+    name = sample['Candidate Name'].dropna().iloc[0].split()[0]
+    state = FilterState.from_widgets(name=name)
+    positions = analysis.positions(state)
+    assert len(positions)
+    assert_same_trend(analysis.trend(state, 'M', positions), row_level_trend(sample.take(positions), 'M'))
+
+
+def test_unknown_trend_frequency(cube):
+    with pytest.raises(ValueError):
+        cube.trend(freq='D')
@@ -0,0 +1,46 @@
+"""DatasetHolder reloads: a failed reload keeps the previous snapshot."""
+import os
+import shutil
+
+import pytest
+
+from conftest import TRACKER_CSV
+from tracker.dataset import DatasetHolder
+from tracker.rules import DEFAULT_RULES_PATH
+
+
+def touch(path, content):
+    # Bump the mtime as well, so the change shows in the stat signature even within one clock tick
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def holder(tmp_path):
+    shutil.copy(TRACKER_CSV, tmp_path / 'TA Tracker - HM Sheet.csv')
+    shutil.copy(DEFAULT_RULES_PATH, tmp_path / 'rules.toml')
+    return DatasetHolder(str(tmp_path / 'TA Tracker - HM Sheet.csv'), tmp_path / 'rules.toml',
+                         cache_dir=tmp_path / 'cache', check_interval=0)
+
+
+def test_failed_reload_keeps_the_snapshot(holder):
+    first = holder.current()
+    rules = holder.rules_path.read_text()
+
+    touch(holder.rules_path, 'not = [valid toml')
+    assert holder.refresh() is first
+    assert holder.error is not None
+    # Unchanged files are not retried on every check
+    assert holder.current() is first and holder.loads == 1
+
+    touch(holder.rules_path, rules)
+    assert holder.refresh() is first  # same rules and tracker: same data version
+    assert holder.error is None and holder.loads == 2
+
+
+def test_first_load_raises(holder):
+    touch(holder.rules_path, 'not = [valid toml')
+    with pytest.raises(ValueError):
+        holder.current()
+    assert holder.version is None
@@ -0,0 +1,53 @@
+"""Stage durations: open candidates' SLA breaches are aged when asked for, not when built."""
+import numpy as np
+import pandas as pd
+
+from conftest import TRACKER_CSV
+from tracker.durations import OPEN_CATEGORIES, TTF_SLA_DAYS, TTH_SLA_DAYS, StageDurations
+from tracker.stream import stream_tracker
+
+
+def expected_breaches(df, as_of):
+    """TTF / TTH breach counts worked out row by row with pandas dates."""
+    as_of = pd.Timestamp(as_of)
+    is_open = df['Dashboard_Category'].isin(OPEN_CATEGORIES)
+    counts = []
+    measures = [('Req Date', 'Joining Date', TTF_SLA_DAYS), ('Screening Date', 'Offer Acceptance Date', TTH_SLA_DAYS)]
+    for start, end, sla in measures:
+        days = (df[end] - df[start]).dt.days
+        days = days.where(days >= 0)
+        waiting = is_open & days.isna() & ((as_of - df[start]).dt.days > sla)
+        counts.append(int(((days > sla) | waiting).sum()))
+    return counts
+
+
+def test_breaches_follow_the_as_of_date(sample):
+    durations = StageDurations(sample)
+    first = sample['Req Date'].min()
+    dates = [first, first + pd.Timedelta(days=400)]
+    counts = []
+    for as_of in dates:
+        summary = durations.summary(as_of=as_of).set_index('Measure')['SLA Breaches']
+        counts.append([summary['Time to Fill'], summary['Time to Hire']])
+        assert counts[-1] == expected_breaches(sample, as_of)
+    # The same cached object reports more breaches later on, as open candidates age
+    assert counts[0] != counts[1]
+    assert counts[0][0] < counts[1][0]
+
+
+def test_frame_flags_match_the_summary(sample):
+    durations = StageDurations(sample)
+    as_of = sample['Req Date'].min() + pd.Timedelta(days=200)
+    positions = np.arange(0, len(sample), 3)
+    frame = durations.frame(positions, as_of=as_of)
+    summary = durations.summary(positions, as_of=as_of).set_index('Measure')['SLA Breaches']
+    assert frame[f'TTF > {TTF_SLA_DAYS}d'].sum() == summary['Time to Fill']
+    assert frame[f'TTH > {TTH_SLA_DAYS}d'].sum() == summary['Time to Hire']
+
+
+def test_stream_breaches_follow_the_as_of_date(sample):
+    stream = stream_tracker(TRACKER_CSV, chunk_rows=100, stride=50)
+    durations = StageDurations(sample)
+    first = sample['Req Date'].min()
+    for as_of in [first, first + pd.Timedelta(days=90), first + pd.Timedelta(days=400)]:
+        pd.testing.assert_frame_equal(stream.aggregates.duration_summary(as_of), durations.summary(as_of=as_of))
@@ -0,0 +1,107 @@
+"""Repeat candidates: identities linked through shared mobiles, mail ids and name + date of birth."""
+import re
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from tracker.identity import MAX_KEY_ROWS, IdentityIndex
+from tracker.metrics import compute_kpis
+from tracker.search import normalize_text
+
+# (name, mobile, mail, date of birth, sourcing date, category)
+PEOPLE = [
+    ('Asha Rao', '+91 98765 43210', 'asha@example.com', None, '05-Jan-2025', 'Rejected'),
+    ('A. Rao', '09876543210', 'asha.rao@example.org', None, '01-Feb-2025', 'Rejected'),  # 0's mobile
+    ('Asha R', '91111 22222', ' ASHA.RAO@example.org', None, '01-Mar-2025', 'Joined'),  # 1's mail
+    ('Vikram', '90000-00001', 'vikram@example.com', None, '10-Jan-2025', 'Pending/Active'),
+    ('Vikram S', '9000000001', None, None, None, 'Selected'),  # 3's mobile, undated
+    ('Meera', 'NA', None, '01-May-1990', '01-Apr-2025', 'Rejected'),
+    ('  meera ', '12', None, '01-May-1990', '01-May-2025', 'Screening Reject'),  # 5's name and birth date
+    ('Meera', None, None, '01-Jan-1991', '02-Apr-2025', 'Rejected'),  # same name, another person
+    ('Kiran', None, None, None, '03-Apr-2025', 'Pending/Active'),
+    ('Someone', '99999 88888', 'other@example.com', None, '03-Mar-2025', 'Selected'),  # 10's mobile
+    ('Ravi', '99999 88888', 'ravi@example.com', None, '02-Mar-2025', 'Rejected'),  # 11's mail
+    ('Ravi K', '91234 56789', 'Ravi@Example.com', None, '01-Mar-2025', 'Pending/Active'),
+]
+PERSONS = [{0, 1, 2}, {3, 4}, {5, 6}, {7}, {8}, {9, 10, 11}]
+
+
+def people_frame(people=PEOPLE):
+    columns = ['Candidate Name', 'Mobile Number', 'Mail Id', 'Date of Birth', 'Sourcing Date', 'Dashboard_Category']
+    df = pd.DataFrame(people, columns=columns)
+    for col in ['Date of Birth', 'Sourcing Date']:
+        df[col] = pd.to_datetime(df[col], format='%d-%b-%Y')
+    return df
+
+
+def partition(identity):
+    """Rows per person as sets, ordered by their first row."""
+    order = np.argsort(identity, kind='stable')
+    groups = np.split(order, np.flatnonzero(np.diff(identity[order])) + 1)
+    return sorted((set(group.tolist()) for group in groups), key=min)
+
+
+def test_transitive_links():
+    index = IdentityIndex(people_frame())
+    assert partition(index.identity) == PERSONS
+    assert index.identities == len(PERSONS)
+    # Applications in sourcing-date order, undated last
+    assert index.application.tolist() == [1, 2, 3, 1, 2, 1, 2, 1, 1, 3, 2, 1]
+    assert index.applications.tolist() == [3, 3, 3, 2, 2, 2, 2, 1, 1, 3, 3, 3]
+    assert index.previous.tolist() == [-1, 0, 1, -1, 3, -1, 5, -1, -1, 10, 11, -1]
+    assert index.repeats(np.arange(len(PEOPLE))) == 6
+
+
+def test_deduped_counts_keep_the_latest_application():
+    df = people_frame()
+    index = IdentityIndex(df)
+    unique = index.unique(np.arange(len(df)))
+    assert unique.tolist() == [2, 4, 6, 7, 8, 9]
+    kpis = compute_kpis(df['Dashboard_Category'].take(unique))
+    counts = (kpis.total, kpis.joined, kpis.selected, kpis.rejected, kpis.screening_rejected, kpis.pending)
+    assert counts == (6, 1, 2, 1, 1, 1)
+    # Among a subset, the latest of the rows present is kept
+    assert index.unique(np.array([0, 1, 3, 11])).tolist() == [1, 3, 11]
+
+
+def test_placeholder_keys_do_not_link():
+    filler = [(f'Person {i}', '0000000000', 'na', None, '01-Jan-2025', 'Rejected') for i in range(MAX_KEY_ROWS + 1)]
+    index = IdentityIndex(people_frame(PEOPLE + filler))
+    assert partition(index.identity)[:len(PERSONS)] == PERSONS
+    assert index.identities == len(PERSONS) + len(filler)
+
+
+def naive_identities(df):
+    """Union-find over the same keys, one row at a time."""
+    keys = []
+    for name, mobile, mail, birth in zip(df['Candidate Name'], df['Mobile Number'], df['Mail Id'], df['Date of Birth']):
+        row = []
+        digits = re.sub(r'\D', '', mobile) if isinstance(mobile, str) else ''
+        if len(digits) >= 7:
+            row.append(('mobile', digits[-10:]))
+        if normalize_text(mail):
+            row.append(('mail', normalize_text(mail).replace(' ', '')))
+        if normalize_text(name) and pd.notna(birth):
+            row.append(('birth', normalize_text(name), birth))
+        keys.append(row)
+    sizes = Counter(key for row in keys for key in row)
+    parent = list(range(len(df)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner = {}
+    for i, row in enumerate(keys):
+        for key in row:
+            if sizes[key] <= MAX_KEY_ROWS:
+                parent[find(i)] = find(owner.setdefault(key, i))
+    return np.array([find(i) for i in range(len(df))])
+
+
+def test_partition_matches_union_find(tracker):
+    index = IdentityIndex(tracker)
+    assert partition(index.identity) == partition(naive_identities(tracker))
@@ -0,0 +1,37 @@
+"""FilterIndex against plain boolean masks over the same frame."""
+import numpy as np
+import pandas as pd
+
+from conftest import naive_mask, random_states
+from tracker.index import DATE_COLUMN, FilterIndex
+
+
+def test_resolve_matches_masks(tracker):
+    index = FilterIndex(tracker)
+    for state in random_states(tracker, 300, seed=1):
+        steps = []
+        positions = index.resolve(state.selections, state.date_range, steps=steps)
+        assert np.array_equal(positions, np.flatnonzero(naive_mask(tracker, state))), state
+        assert all(rows_out <= rows_in for _, _, rows_in, rows_out in steps)
+
+
+def test_no_filters_is_every_row(tracker):
+    assert np.array_equal(FilterIndex(tracker).resolve({}), np.arange(len(tracker)))
+
+
+def test_options_and_value_counts(tracker):
+    index = FilterIndex(tracker)
+    for col in index.postings:
+        counts = tracker[col].value_counts(sort=False)
+        assert index.value_counts(col).to_dict() == counts.to_dict()
+        assert index.options(col) == sorted(counts[counts > 0].index)
+
+
+def test_dates_outside_the_nanosecond_range():
+    # A sheet typo like 0202 for 2023 must stay in year 202, not wrap into the range being filtered
+    days = pd.Series(pd.to_datetime(['0202-12-01', '1956-03-04', None, '2024-05-06'], format='%Y-%m-%d').as_unit('us'))
+    df = pd.DataFrame({DATE_COLUMN: days, 'Skill': pd.Categorical(['Go', 'Go', 'Go', 'Rust'])})
+    index = FilterIndex(df, columns=['Skill'])
+    assert index.resolve({}, ('1956-01-01', '1956-12-31')).tolist() == [1]
+    assert index.resolve({}, ('0202-01-01', '0202-12-31')).tolist() == [0]
+    assert index.resolve({'Skill': ['Go']}, ('0001-01-01', '2100-12-31')).tolist() == [0, 1]
@@ -0,0 +1,85 @@
+"""Interview events: panelist load, feedback turnaround and pass rates on hand-counted rows."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from tracker.interviews import InterviewEvents
+
+# HM, then per round: interview date, panelist, status, feedback date (weeks start on Monday 3, 10 and 17 March)
+ROWS = [
+    ('Anu', ('03-Mar-2025', 'Priya', 'Cleared', '05-Mar-2025'),
+     ('10-Mar-2025', 'Rahul', 'Not Cleared', '10-Mar-2025'), None),
+    ('Anu', ('04-Mar-2025', 'Priya', ' cleared ', None), None, None),  # no feedback date yet
+    ('Anu', ('12-Mar-2025', None, 'Not Cleared', '15-Mar-2025'), None, None),  # no panelist
+    ('Bala', ('05-Mar-2025', 'Rahul', 'On Hold', '04-Mar-2025'), None, None),  # feedback before the interview
+    ('Bala', None, None, None),  # never interviewed
+    ('Bala', (None, 'Priya', 'Cleared', '20-Mar-2025'), None, None),  # no interview date
+    ('Bala', None, None, ('17-Mar-2025', 'Priya', 'Cleared', '21-Mar-2025')),
+    ('Chitra', None, ('18-Mar-2025', 'Rahul', None, None), None),  # not decided
+]
+
+
+@pytest.fixture(scope='module')
+def events():
+    records = []
+    for hm, *rounds in ROWS:
+        record = {'HM Details': hm}
+        for r, values in zip(['R1', 'R2', 'R3'], rounds):
+            date, panelist, status, feedback = values or (None,) * 4
+            record.update({f'Date {r} Interview': date, f'{r} Panelist': panelist, f'Status of {r}': status,
+                           f'{r} Feedback Date': feedback})
+        records.append(record)
+    df = pd.DataFrame(records)
+    for col in df.columns[df.columns.str.contains('Date')]:
+        df[col] = pd.to_datetime(df[col], format='%d-%b-%Y')
+    for col in df.columns[df.columns.str.contains('Panelist|Status|HM')]:
+        df[col] = df[col].astype('category')
+    return InterviewEvents(df)
+
+
+def test_events(events):
+    assert len(events) == 8
+    assert events.events['Candidate'].tolist() == [0, 1, 2, 3, 5, 0, 7, 6]
+    assert events.events['Turnaround'].tolist()[:6] == pytest.approx([2, np.nan, 3, np.nan, np.nan, 0], nan_ok=True)
+
+
+def test_panelist_load(events):
+    load = events.panelist_load().astype({'Panelist': str})
+    expected = pd.DataFrame({
+        'Period': pd.to_datetime(['2025-03-03', '2025-03-03', '2025-03-10', '2025-03-17', '2025-03-17']),
+        'Panelist': ['Priya', 'Rahul', 'Rahul', 'Priya', 'Rahul'],
+        'Interviews': [2, 1, 1, 1, 1],
+    })
+    load = load.sort_values(['Period', 'Panelist'], ignore_index=True)
+    pd.testing.assert_frame_equal(load, expected, check_dtype=False)
+
+    monthly = events.panelist_load(freq='M').groupby('Panelist', observed=True)['Interviews'].sum()
+    assert monthly.to_dict() == {'Priya': 3, 'Rahul': 3}
+
+
+def test_feedback_turnaround(events):
+    by_round = events.feedback_turnaround()
+    assert by_round['Feedbacks'].to_dict() == {'R1': 2, 'R2': 1, 'R3': 1}
+    assert by_round.loc['R1', ['P50', 'P75', 'P90']].tolist() == [2.5, 2.8, 2.9]  # days 2 and 3
+    assert by_round.loc['R3', 'P50'] == 4
+
+    by_panelist = events.feedback_turnaround(by='Panelist')
+    assert by_panelist['Feedbacks'].to_dict() == {'Priya': 2, 'Rahul': 1}
+    assert by_panelist.loc['Priya', ['P50', 'P75', 'P90']].tolist() == [3.0, 3.5, 3.8]  # days 2 and 4
+
+    assert events.feedback_turnaround(positions=[1, 3, 4]).empty
+
+
+def test_pass_rates(events):
+    rates = events.pass_rates().astype({'HM': str, 'Round': str}).set_index(['HM', 'Round'])
+    assert rates[['Cleared', 'Not Cleared', 'Pending']].to_dict('index') == {
+        ('Anu', 'R1'): {'Cleared': 2, 'Not Cleared': 1, 'Pending': 0},
+        ('Anu', 'R2'): {'Cleared': 0, 'Not Cleared': 1, 'Pending': 0},
+        ('Bala', 'R1'): {'Cleared': 1, 'Not Cleared': 0, 'Pending': 1},
+        ('Bala', 'R3'): {'Cleared': 1, 'Not Cleared': 0, 'Pending': 0},
+        ('Chitra', 'R2'): {'Cleared': 0, 'Not Cleared': 0, 'Pending': 1},
+    }
+    assert rates['Pass %'].tolist() == pytest.approx([66.7, 0.0, 100.0, 100.0, np.nan], nan_ok=True)
+
+    subset = events.pass_rates(positions=[3, 4, 5])
+    assert subset[['Cleared', 'Not Cleared', 'Pending']].values.tolist() == [[1, 0, 1]]
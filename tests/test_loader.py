@@ -0,0 +1,123 @@
+"""Incremental loading: appended rows, edited rows and a damaged or unwritable cache."""
+import csv
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV
+from tracker import cache, loader
+from tracker.loader import load_tracker, read_tracker
+
+
+@pytest.fixture(scope='module')
+def records():
+    with open(TRACKER_CSV, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def write_rows(path, rows, newline=True):
+    # Rows include the sheet's metadata and header rows
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(rows)
+    text = buffer.getvalue()
+    path.write_bytes((text if newline else text[:-1]).encode('utf-8'))
+    bump_mtime(path)
+
+
+def bump_mtime(path):
+    # The stat signature must change even within one clock tick
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def appends(monkeypatch):
+    """The result of every ``_append_tail`` call: a frame, or ``None`` for a full rebuild."""
+    results = []
+    append_tail = loader._append_tail
+
+    def spy(*args):
+        results.append(append_tail(*args))
+        return results[-1]
+
+    monkeypatch.setattr(loader, '_append_tail', spy)
+    return results
+
+
+def assert_same_as_full_parse(df, path):
+    pd.testing.assert_frame_equal(df, read_tracker(path), check_categorical=False)
+
+
+def test_appended_rows_are_parsed_alone(tmp_path, records, appends):
+    path = tmp_path / 'tracker.csv'
+    write_rows(path, records[:120])
+    first = load_tracker(path, cache_dir=tmp_path / 'cache')
+    assert_same_as_full_parse(first, path)
+
+    write_rows(path, records[:200])
+    df = load_tracker(path, cache_dir=tmp_path / 'cache')
+    assert len(appends) == 1 and appends[0] is not None
+    assert_same_as_full_parse(df, path)
+    assert df.attrs['data_version'] != first.attrs['data_version']
+    # The appended result is cached: the next load maps it without parsing
+    assert_same_as_full_parse(load_tracker(path, cache_dir=tmp_path / 'cache'), path)
+    assert len(appends) == 1
+
+
+def test_an_edited_row_rebuilds(tmp_path, records, appends):
+    path = tmp_path / 'tracker.csv'
+    write_rows(path, records[:120])
+    load_tracker(path, cache_dir=tmp_path / 'cache')
+
+    edited = [list(row) for row in records[:200]]
+    status = edited[1].index('Status')
+    edited[10][status] = 'Rejected' if edited[10][status] != 'Rejected' else 'Joined'
+    write_rows(path, edited)
+    df = load_tracker(path, cache_dir=tmp_path / 'cache')
+    assert appends == [None]
+    assert_same_as_full_parse(df, path)
+
+
+def test_an_extended_last_line_rebuilds(tmp_path, records, appends):
+    # Without a trailing newline, appended bytes may continue the last row rather than start a new one
+    rows = [list(row) for row in records[:102]]
+    path = tmp_path / 'tracker.csv'
+    write_rows(path, rows, newline=False)
+    before = load_tracker(path, cache_dir=tmp_path / 'cache')
+
+    rows[-1][-1] += 'more text'
+    write_rows(path, rows + records[102:112])
+    df = load_tracker(path, cache_dir=tmp_path / 'cache')
+    assert appends == [None]
+    assert_same_as_full_parse(df, path)
+    assert len(df) == len(before) + 10
+
+
+def test_unwritable_cache(tmp_path, records):
+    path = tmp_path / 'tracker.csv'
+    blocker = tmp_path / 'not a directory'
+    blocker.write_text('')
+    for rows in (records[:120], records[:200]):
+        write_rows(path, rows)
+        assert_same_as_full_parse(load_tracker(path, cache_dir=blocker / 'cache'), path)
+
+
+@pytest.mark.parametrize('damaged', ['data', 'meta'])
+@pytest.mark.parametrize('grow', [False, True])
+def test_corrupt_cache_rebuilds(tmp_path, records, damaged, grow):
+    path = tmp_path / 'tracker.csv'
+    directory = tmp_path / 'cache'
+    write_rows(path, records[:120])
+    load_tracker(path, cache_dir=directory)
+    meta = cache.read_meta(path, directory)
+    target = directory / meta['data'] if damaged == 'data' else next(directory.glob('*.json'))
+    target.write_bytes(b'not a cache entry')
+
+    if grow:
+        write_rows(path, records[:200])
+    df = load_tracker(path, cache_dir=directory)
+    assert_same_as_full_parse(df, path)
+    # The rebuilt entry is usable again
+    assert cache.lookup(path, loader.cache_salt(), directory)[0] is not None
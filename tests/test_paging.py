@@ -0,0 +1,54 @@
+"""Sorted pages from precomputed ranks against pandas ``sort_values`` on the same rows."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from tracker.durations import StageDurations
+from tracker.paging import SortKeys, page_bounds, page_count
+
+# Categorical, string, date, nullable numeric and boolean columns, most with blanks
+COLUMNS = ['HM Details', 'Status', 'Candidate Name', 'Sourcing Date', 'Date of Birth', 'Experience', 'No. of Openings',
+           'Dashboard_Category']
+
+
+def sortable(df):
+    columns = {col: df[col] for col in COLUMNS}
+    columns.update(StageDurations(df).frame(np.arange(len(df)), as_of='2025-06-30'))
+    return pd.DataFrame(columns)
+
+
+def expected_order(frame, positions, column, ascending):
+    # Categoricals sort by their labels, not the category order
+    values = frame[column].iloc[positions]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+
+@pytest.mark.parametrize('ascending', [True, False])
+def test_order_matches_sort_values(tracker, ascending):
+    frame = sortable(tracker)
+    keys = SortKeys(frame)
+    rng = np.random.default_rng(3)
+    # Blanks and ties are what the ranks have to get right
+    assert frame.isna().any().sum() >= len(COLUMNS) - 1 and (frame.nunique() < len(frame)).all()
+    for positions in [np.arange(len(frame)), np.sort(rng.choice(len(frame), len(frame) // 3, replace=False)),
+                      np.array([], dtype=np.int64)]:
+        for column in frame.columns:
+            order = keys.order(positions, column, ascending)
+            assert np.array_equal(order, expected_order(frame, positions, column, ascending)), column
+
+
+def test_no_column_keeps_row_order(sample):
+    positions = np.arange(0, len(sample), 5)
+    assert SortKeys({'Status': sample['Status']}).order(positions) is positions
+
+
+def test_pages_cover_the_order_once():
+    positions = np.arange(23)
+    pages = [positions[slice(*page_bounds(len(positions), page, 5))] for page in range(1, page_count(23, 5) + 1)]
+    assert page_count(23, 5) == 5 and [len(p) for p in pages] == [5, 5, 5, 5, 3]
+    assert np.array_equal(np.concatenate(pages), positions)
+    # Out-of-range pages clamp to the first and last page; an empty view still has one page
+    assert page_bounds(23, 0, 5) == (0, 5) and page_bounds(23, 9, 5) == (20, 23)
+    assert page_count(0, 5) == 1 and page_bounds(0, 1, 5) == (0, 0)
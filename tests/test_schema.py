@@ -0,0 +1,99 @@
+"""Parity of the schema reader with the original ``pd.to_datetime`` / ``str.strip`` cleaning."""
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV
+from tracker import schema
+from tracker.schema import COLUMNS, DATE_COLUMNS, DATE_FORMATS, convert, date_days
+
+MALFORMED_DATES = [
+    '1-Dec-2025', ' 1-Dec-2025 ', '1-DEC-2025', '1-Dec-25', '01-12-2025', '1-12-26', '29-Feb-2024', '29-Feb-2023',
+    '31-Feb-2025', '22-DFec-2025', '3-Jan-2026 (Scheduled twice)', '12-Jan-2026\n(Joined)', '9th Jan, 2025',
+    '25-July-2001', 'Will confirm', '-', '', '   ', '1-Dec-0202', None,
+]
+PADDED_TEXT = [' Hari', 'Hari ', 'Hari', '  ', '', None, 'Mani  Nagar', '\tJava\t', 'java']
+
+
+@pytest.fixture(scope='module')
+def raw():
+    """The tracker's cells as text, under the schema's column names."""
+    names = schema.column_names(schema.read_header(TRACKER_CSV))
+    return pd.read_csv(TRACKER_CSV, skiprows=schema.METADATA_ROWS + 1, header=None, names=names, dtype=str,
+                       index_col=False)
+
+
+def row_wise_date(value):
+    # One value at a time: the first word of the stripped cell in the first format that fits
+    if not isinstance(value, str) or not value.split():
+        return np.datetime64('NaT', 'D')
+    for fmt in DATE_FORMATS:
+        try:
+            return np.datetime64(datetime.datetime.strptime(value.split()[0], fmt).date(), 'D')
+        except ValueError:
+            continue
+    return np.datetime64('NaT', 'D')
+
+
+def same_days(got, expected):
+    # NaT never equals NaT; compare the raw day numbers instead
+    return np.array_equal(np.asarray(got, dtype='datetime64[D]').view(np.int64),
+                          np.asarray(expected, dtype='datetime64[D]').view(np.int64))
+
+
+def original_text(series, categorical):
+    # dashboard.py stripped text with astype("string").str.strip(); categories also drop blanks
+    text = series.astype('string').str.strip()
+    return text.mask(text == '') if categorical else text
+
+
+def test_sourcing_date_matches_the_original_parse(sample, raw):
+    # The original dashboard parsed just this column, with an inferred format
+    original = pd.to_datetime(raw['Sourcing Date'], errors='coerce')
+    assert same_days(date_days(sample['Sourcing Date']), date_days(original))
+
+
+@pytest.mark.filterwarnings('ignore:Could not infer format')
+@pytest.mark.parametrize('column', DATE_COLUMNS)
+def test_dates_match_the_original_parse(sample, raw, column):
+    # Whatever an inferred-format parse of the column understands, the schema reads the same
+    original = pd.to_datetime(raw[column], errors='coerce')
+    parsed = original.notna().to_numpy()
+    assert same_days(date_days(sample[column])[parsed], date_days(original)[parsed])
+    expected = np.array([row_wise_date(value) for value in raw[column]], dtype='datetime64[D]')
+    assert same_days(date_days(sample[column]), expected)
+
+
+def test_malformed_dates():
+    dates = convert(pd.Series(MALFORMED_DATES, dtype='category'), 'date')
+    expected = np.array([row_wise_date(value) for value in MALFORMED_DATES], dtype='datetime64[D]')
+    assert same_days(date_days(dates), expected)
+    assert date_days(dates)[MALFORMED_DATES.index('1-Dec-0202')] == np.datetime64('0202-12-01')
+    assert np.isnat(date_days(dates)[MALFORMED_DATES.index('31-Feb-2025')])
+
+
+def test_date_days():
+    dates = pd.Series(pd.to_datetime(['1-Dec-2025', None, '29-Feb-2024'], format='%d-%b-%Y'))
+    assert same_days(date_days(dates), dates.to_numpy().astype('datetime64[D]'))
+    # Object and string input go through pd.to_datetime like the original code did
+    assert same_days(date_days(['2025-12-01', None]), ['2025-12-01', 'NaT'])
+
+
+@pytest.mark.parametrize('column', [c for c in COLUMNS if c.kind in ('category', 'string')], ids=lambda c: c.name)
+def test_text_matches_the_original_strip(sample, raw, column):
+    categorical = column.kind == 'category'
+    expected = original_text(raw[column.name], categorical)
+    got = sample[column.name].astype('string')
+    pd.testing.assert_series_equal(got, expected, check_names=False, check_dtype=False)
+
+
+@pytest.mark.parametrize('kind', ['category', 'string'])
+def test_padded_text(kind):
+    raw_text = pd.Series(PADDED_TEXT, dtype='category' if kind == 'category' else 'string')
+    got = convert(raw_text, kind).astype('string')
+    pd.testing.assert_series_equal(got, original_text(raw_text, kind == 'category'), check_dtype=False)
+    if kind == 'category':
+        # ' Hari', 'Hari ' and 'Hari' are one level
+        assert list(convert(raw_text, kind).cat.categories) == ['Hari', 'Java', 'Mani  Nagar', 'java']
@@ -0,0 +1,51 @@
+"""Candidate search against a plain scan of every row."""
+import numpy as np
+
+from tracker.search import MIN_NGRAM_QUERY, CandidateSearchIndex, normalize_digits, normalize_text
+
+
+def naive_search(df, query):
+    """Rows whose name contains ``query``, whose mail id starts with it or whose mobile starts / ends with its digits."""
+    text = normalize_text(query)
+    if not text:
+        return np.arange(len(df))
+    names = df['Candidate Name'].astype(object).map(normalize_text)
+    found = names.str.contains(text, regex=False).to_numpy(dtype=bool, copy=True)
+    mail = text.replace(' ', '')
+    if len(mail) >= MIN_NGRAM_QUERY:
+        mails = df['Mail Id'].astype(object).map(lambda value: normalize_text(value).replace(' ', ''))
+        found |= mails.str.startswith(mail).to_numpy()
+    digits = normalize_digits(query)
+    if len(digits) >= MIN_NGRAM_QUERY and len(digits) * 2 >= len(mail):
+        mobiles = df['Mobile Number'].astype(object).map(normalize_digits)
+        found |= (mobiles.str.startswith(digits) | mobiles.str.endswith(digits)).to_numpy()
+    return np.flatnonzero(found)
+
+
+def queries(df, seed=0):
+    """Slices of real names, mail ids and mobiles at every length, plus edge cases."""
+    rng = np.random.default_rng(seed)
+    found = ['', ' ', 'a', 'A', 'zz', 'an', ' a ', '.', '.*', 'a.', '(', '[a]', '+', '?', '^', '$', '\\', '|', '%', '_',
+             "'", '"', 'no such candidate anywhere']
+    for column in ['Candidate Name', 'Mail Id', 'Mobile Number']:
+        values = df[column].dropna().astype(str).to_numpy()
+        for value in rng.choice(values, 15):
+            start = rng.integers(0, max(len(value) - 1, 1))
+            for length in (1, 2, 3, 5, 9):
+                found.append(value[start:start + length])
+            found.append(value.upper())
+            found.append(f"  {value[:6]}  ")
+    return found
+
+
+def test_search_matches_a_plain_scan(tracker):
+    index = CandidateSearchIndex(tracker)
+    for query in queries(tracker):
+        assert np.array_equal(index.search(query), naive_search(tracker, query)), query
+
+
+def test_fuzzy_search_finds_the_exact_matches_too(sample):
+    index = CandidateSearchIndex(sample)
+    for query in queries(sample, seed=1):
+        exact = index.search(query)
+        assert np.isin(exact, index.search(query, fuzzy=True)).all(), query
@@ -0,0 +1,41 @@
+"""Loading several trackers: sheets with different columns, and a cache directory that cannot be written."""
+import csv
+
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV
+from tracker.sources import TRACKER_COLUMN, UNIT_COLUMN, load_trackers
+
+
+def write_without(path, column):
+    """Copy the bundled tracker to ``path`` with ``column`` removed, as a sheet that never had it."""
+    with open(TRACKER_CSV, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    drop = rows[1].index(column)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows([cell for i, cell in enumerate(row) if i != drop] for row in rows)
+    return path
+
+
+@pytest.mark.parametrize('first', ['A', 'B'])
+def test_sheets_with_different_columns(tmp_path, sample, first):
+    # File order decides which frame comes first; the column must survive either way
+    write_without(tmp_path / f'TA Tracker - {first}.csv', 'Gender')
+    other = 'B' if first == 'A' else 'A'
+    (tmp_path / f'TA Tracker - {other}.csv').write_bytes(TRACKER_CSV.read_bytes())
+
+    df = load_trackers(str(tmp_path), cache_dir=tmp_path / 'cache')
+    assert len(df) == 2 * len(sample)
+    assert set(df.columns) == set(sample.columns) | {TRACKER_COLUMN, UNIT_COLUMN}
+    gender = df.groupby(UNIT_COLUMN, observed=True)['Gender']
+    assert gender.count()[first] == 0
+    assert gender.count()[other] == sample['Gender'].count()
+    assert isinstance(df['Gender'].dtype, pd.CategoricalDtype)
+
+
+def test_unwritable_cache_directory(tmp_path, sample):
+    blocker = tmp_path / 'not a directory'
+    blocker.write_text('')
+    df = load_trackers(str(TRACKER_CSV), cache_dir=blocker / 'cache')
+    pd.testing.assert_frame_equal(df.drop(columns=[TRACKER_COLUMN, UNIT_COLUMN]), sample, check_categorical=False)
@@ -0,0 +1,113 @@
+"""A streamed tracker against the same file loaded whole."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import TRACKER_CSV, naive_mask, random_states
+from tracker.backends import StreamBackend
+from tracker.metrics import compute_kpis
+from tracker.rules import unknown_statuses
+from tracker.stream import GROUP_COLUMNS, SourceFile, scan_offsets, stream_tracker
+from tracker.views import FilterState
+
+
+@pytest.fixture(scope='module', params=['sample', 'synthetic'])
+def streamed(request):
+    """``(loaded frame, stream)``; small chunks and blocks so merges and block reads span many of them."""
+    if request.param == 'sample':
+        return request.getfixturevalue('sample'), stream_tracker(TRACKER_CSV, chunk_rows=200, stride=50)
+    path = request.getfixturevalue('synthetic_csv')
+    return request.getfixturevalue('synthetic'), stream_tracker(path, chunk_rows=3_000, stride=250)
+
+
+def test_rows_and_totals(streamed):
+    df, stream = streamed
+    assert len(stream) == len(df) == stream.aggregates.rows
+    assert stream.kpis() == compute_kpis(df['Dashboard_Category'])
+
+
+def test_filtered_queries_match_the_frame(streamed):
+    df, stream = streamed
+    backend = StreamBackend(stream, 'test')
+    for state in random_states(df[GROUP_COLUMNS + ['Sourcing Date', 'Dashboard_Category']], 200, seed=4):
+        mask = naive_mask(df, state)
+        assert np.array_equal(backend.positions(state), np.flatnonzero(mask)), state
+        assert backend.kpis(state) == compute_kpis(df['Dashboard_Category'][mask]), state
+
+
+def test_value_counts(streamed):
+    df, stream = streamed
+    backend = StreamBackend(stream, 'test')
+    for col in GROUP_COLUMNS:
+        counts = df[col].value_counts(sort=False)
+        assert backend.value_counts(col).to_dict() == counts[counts > 0].to_dict()
+    assert backend.value_counts('Business Unit').empty
+
+
+def test_rows_are_parsed_from_their_blocks(streamed):
+    df, stream = streamed
+    positions = np.random.default_rng(5).choice(len(df), size=min(len(df), 300), replace=False)
+    got = stream.rows(positions)
+    assert got.index.tolist() == positions.tolist()
+    expected = df.take(positions)
+    for col in df.columns:
+        pd.testing.assert_series_equal(
+            got[col].astype(object), expected[col].astype(object), check_index=False, check_names=False, obj=col,
+        )
+    assert stream.rows([]).empty
+
+
+def test_unknown_statuses(streamed):
+    df, stream = streamed
+    expected = unknown_statuses(df)
+    assert stream.unknown.to_dict() == expected.rename(index=str).to_dict()
+
+
+def test_date_bounds(streamed):
+    df, stream = streamed
+    assert StreamBackend(stream, 'test').date_bounds() == (df['Sourcing Date'].min(), df['Sourcing Date'].max())
+
+
+def test_chunking_does_not_change_the_aggregates(synthetic_csv):
+    whole = stream_tracker(synthetic_csv)
+    chunked = stream_tracker(synthetic_csv, chunk_rows=1_000, stride=100)
+    assert whole.kpis() == chunked.kpis()
+    for col in GROUP_COLUMNS:
+        assert whole.aggregates.value_counts(col).equals(chunked.aggregates.value_counts(col))
+    pd.testing.assert_frame_equal(whole.aggregates.duration_summary(), chunked.aggregates.duration_summary())
+
+
+@pytest.mark.parametrize('state', [FilterState.from_widgets(name='a'), FilterState.from_widgets(dedupe=True)])
+def test_row_level_features_are_refused(streamed, state):
+    with pytest.raises(ValueError):
+        StreamBackend(streamed[1], 'test').kpis(state)
+
+
+def test_offsets_do_not_depend_on_the_scan_block():
+    # Record starts and quoted newlines falling on block boundaries
+    source = SourceFile(TRACKER_CSV)
+    expected = scan_offsets(source, 2, stride=7)
+    for block_bytes in (2, 61, 97, 4096):
+        offsets, rows = scan_offsets(source, 2, stride=7, block_bytes=block_bytes)
+        assert rows == expected[1] and np.array_equal(offsets, expected[0])
+
+
+def test_quoted_newlines_and_blank_lines(tmp_path, sample):
+    # Cells with line breaks are quoted in a sheet export; blank lines are skipped like read_csv does
+    path = tmp_path / 'tracker.csv'
+    lines = TRACKER_CSV.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b''.join(lines[:2]) + b'\n' + b''.join(lines[2:5]) + b'\r\n\n' + b''.join(lines[5:]))
+    stream = stream_tracker(path, chunk_rows=30, stride=3)
+    assert len(stream) == len(sample)
+    assert stream.rows([0, 3, 4, 200])['Candidate Name'].tolist() == sample['Candidate Name'].take([0, 3, 4, 200]).tolist()
+
+
+def test_a_file_truncated_in_place_raises(tmp_path):
+    # An editor saving over the file must not crash the server (as a memory map would, with SIGBUS)
+    path = tmp_path / 'tracker.csv'
+    path.write_bytes(TRACKER_CSV.read_bytes())
+    stream = stream_tracker(path, chunk_rows=100, stride=50)
+    with open(path, 'r+b') as f:
+        f.truncate(1000)
+    with pytest.raises(ValueError):
+        stream.rows([len(stream) - 1])
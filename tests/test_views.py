@@ -0,0 +1,89 @@
+"""View cache keys: equal widget states share an entry, any other change misses."""
+import dataclasses
+import datetime
+
+import numpy as np
+import pytest
+
+from tracker.views import FilterState, View, ViewCache, compact_positions
+
+VERSION = 'v2-abc-0123456789abcdef'
+WIDGETS = dict(
+    hm=['Mani Nagar', 'Akash Yadav'], skill=['Java'], location=['Noida', 'Pune'], recruiter=['Ritu'],
+    business_unit=['Cloud'], date_range=(datetime.date(2025, 1, 1), datetime.date(2025, 3, 31)),
+    name='Divya  Sharma', fuzzy=False, dedupe=False,
+)
+# Another value for every field of the state
+CHANGES = dict(
+    hm=['Mani Nagar'], skill=['Java', 'Python'], location=[], recruiter=['Ravi'], business_unit=['Data'],
+    date_range=(datetime.date(2025, 1, 1), datetime.date(2025, 4, 1)), name='Divya', fuzzy=True, dedupe=True,
+)
+
+
+def view(positions):
+    return View(compact_positions(positions), kpis=None, funnel_json='{}')
+
+
+def test_equal_widget_states_share_a_key():
+    state = FilterState.from_widgets(**WIDGETS)
+    same = FilterState.from_widgets(**dict(
+        WIDGETS, hm=['Akash Yadav', 'Mani Nagar', 'Akash Yadav'], location=('Pune', 'Noida'),
+        name='  divya sharma ',
+    ))
+    assert same == state
+    assert same.key(VERSION) == state.key(VERSION)
+
+    cache = ViewCache()
+    cache.put(state.key(VERSION), view([1, 2, 3]))
+    assert cache.get(same.key(VERSION)) is not None
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_no_filters_and_an_empty_selection_match():
+    assert FilterState.from_widgets().key(VERSION) == FilterState().key(VERSION)
+    assert FilterState.from_widgets(date_range=()).key(VERSION) == FilterState().key(VERSION)
+
+
+@pytest.mark.parametrize('field', list(CHANGES))
+def test_any_changed_filter_misses(field):
+    assert set(CHANGES) == {f.name for f in dataclasses.fields(FilterState)}
+    state = FilterState.from_widgets(**WIDGETS)
+    changed = FilterState.from_widgets(**dict(WIDGETS, **{field: CHANGES[field]}))
+    assert changed.key(VERSION) != state.key(VERSION)
+
+    cache = ViewCache()
+    cache.put(state.key(VERSION), view([1, 2, 3]))
+    assert cache.get(changed.key(VERSION)) is None
+
+
+def test_a_new_data_version_misses():
+    state = FilterState.from_widgets(**WIDGETS)
+    cache = ViewCache()
+    cache.put(state.key(VERSION), view([1, 2, 3]))
+    assert cache.get(state.key(VERSION + '0')) is None
+    assert cache.get(state.key(VERSION)) is not None
+
+
+def test_values_do_not_run_together():
+    # Selections are encoded as lists, not joined strings
+    assert FilterState.from_widgets(hm=['a, b']).key(VERSION) != FilterState.from_widgets(hm=['a', ' b']).key(VERSION)
+    assert FilterState.from_widgets(hm=['x']).key(VERSION) != FilterState.from_widgets(skill=['x']).key(VERSION)
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    entry = view(np.arange(1000))
+    cache = ViewCache(max_bytes=3 * entry.nbytes)
+    for key in 'abc':
+        cache.put(key, view(np.arange(1000)))
+    cache.get('a')  # now the most recently used
+    cache.put('d', view(np.arange(1000)))
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in 'acd')
+    assert len(cache) == 3 and cache.nbytes == 3 * entry.nbytes
+
+    # Replacing an entry does not count it twice; an oversized view is returned but not kept
+    cache.put('a', view(np.arange(1000)))
+    assert cache.nbytes == 3 * entry.nbytes
+    large = view(np.arange(10_000))
+    assert cache.put('e', large) is large
+    assert cache.get('e') is None and len(cache) == 3
@@ -0,0 +1,35 @@
+"""Data core for the TA dashboard: loading, categorization and aggregation.
+
+Imports neither Streamlit nor Plotly, so it serves scripts and the batch
+report (``python -m tracker.report``) as well as the dashboard. The
+streaming mode is imported from :mod:`tracker.stream` directly, which also
+runs as ``python -m tracker.stream``.
+"""
+from tracker.analysis import TrackerAnalysis
+from tracker.backends import BACKENDS, DatabaseHolder, PandasBackend, SqlBackend, StreamBackend, open_backend
+from tracker.categorize import REJECT_ROUNDS, categorize_status
+from tracker.cube import TREND_FREQUENCIES, MetricsCube
+from tracker.dataset import Dataset, DatasetHolder
+from tracker.durations import TTF_SLA_DAYS, TTH_SLA_DAYS, StageDurations
+from tracker.identity import IdentityIndex
+from tracker.index import FilterIndex
+from tracker.interviews import InterviewEvents
+from tracker.loader import load_tracker, read_tracker
+from tracker.metrics import FUNNEL_STAGES, KpiSummary, compute_kpis, kpis_from_counts, quality_of_hire
+from tracker.paging import SortKeys
+from tracker.rules import CATEGORIES, StatusRules, load_rules, unknown_statuses
+from tracker.search import CandidateSearchIndex
+from tracker.sources import load_trackers, resolve_sources
+from tracker.timing import Recorder
+from tracker.views import FilterState, Selection, View, ViewCache, compact_positions
+from tracker.watch import TrackerWatcher
+
+__all__ = [
+    'BACKENDS', 'CATEGORIES', 'FUNNEL_STAGES', 'REJECT_ROUNDS', 'TREND_FREQUENCIES', 'TTF_SLA_DAYS', 'TTH_SLA_DAYS',
+    'CandidateSearchIndex', 'DatabaseHolder', 'Dataset', 'DatasetHolder', 'FilterIndex', 'FilterState',
+    'IdentityIndex', 'InterviewEvents', 'KpiSummary', 'MetricsCube', 'PandasBackend', 'Recorder', 'Selection',
+    'SortKeys', 'SqlBackend', 'StageDurations', 'StatusRules', 'StreamBackend', 'TrackerAnalysis', 'TrackerWatcher',
+    'View', 'ViewCache',
+    'categorize_status', 'compact_positions', 'compute_kpis', 'kpis_from_counts', 'load_rules', 'load_tracker',
+    'load_trackers', 'open_backend', 'quality_of_hire', 'read_tracker', 'resolve_sources', 'unknown_statuses',
+]
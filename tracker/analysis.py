@@ -0,0 +1,109 @@
+"""Filter, KPI and summary queries over one loaded tracker, without Streamlit.
+
+A :class:`TrackerAnalysis` bundles the per-dataset structures every view is
+answered from (filter index, metrics cube, stage durations, repeat-candidate
+identities, interview events, candidate search) and is built once per data
+version. The dashboard caches one per version; scripts and the batch report
+build one and query it for as many filter states as they need::
+
+    analysis = TrackerAnalysis(load_tracker('TA Tracker - HM Sheet.csv'))
+    state = FilterState.from_widgets(hm=['Mani Nagar'])
+    positions = analysis.positions(state)
+    kpis = analysis.kpis(state, positions)
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from tracker.cube import MetricsCube
+from tracker.durations import StageDurations
+from tracker.identity import IdentityIndex
+from tracker.index import FilterIndex
+from tracker.interviews import InterviewEvents
+from tracker.metrics import compute_kpis
+from tracker.rules import CATEGORIES
+from tracker.search import CandidateSearchIndex
+
+HM_COLUMN = 'HM Details'
+
+
+class TrackerAnalysis:
+    def __init__(self, df):
+        self.df = df
+        self.version = df.attrs.get('data_version')
+        self.filter_index = FilterIndex(df)
+        self.cube = MetricsCube(df)
+        self.durations = StageDurations(df)
+        self.identities = IdentityIndex(df)
+        self.interviews = InterviewEvents(df)
+        self._search_index = None
+
+    @property
+    def search_index(self):
+        # Built on the first name search; most views and reports never need it
+        if self._search_index is None:
+            self._search_index = CandidateSearchIndex(self.df)
+        return self._search_index
+
+    def positions(self, state, steps=None):
+        """Sorted row positions matching a :class:`~tracker.views.FilterState`.
+
+        ``steps`` collects ``(filter, seconds, rows in, rows out)`` as in
+        :meth:`FilterIndex.resolve`, including the name search.
+        """
+        positions = self.filter_index.resolve(state.selections, state.date_range, steps=steps)
+        if state.name:
+            start = time.perf_counter()
+            matches = self.search_index.search(state.name, fuzzy=state.fuzzy)
+            rows_in, positions = len(positions), np.intersect1d(positions, matches, assume_unique=True)
+            if steps is not None:
+                steps.append(('search', time.perf_counter() - start, rows_in, len(positions)))
+        return positions
+
+    def counted(self, state, positions):
+        """The rows counts are taken over: ``positions``, or one per candidate when ``state.dedupe`` is set."""
+        return self.identities.unique(positions) if state.dedupe else positions
+
+    def kpis(self, state, positions=None):
+        """:class:`~tracker.metrics.KpiSummary` for the state.
+
+        The cube answers column and date filters; a name search or counting
+        each candidate once needs the matching rows (``positions``, resolved
+        here when not given).
+        """
+        if state.name or state.dedupe:
+            if positions is None:
+                positions = self.positions(state)
+            return compute_kpis(self.df['Dashboard_Category'].take(self.counted(state, positions)))
+        return self.cube.kpis(state.selections, state.date_range)
+
+    def trend(self, state, freq='W', positions=None):
+        """Sourced, joined and rejected candidates per period, as :meth:`MetricsCube.trend`."""
+        if state.name:
+            if positions is None:
+                positions = self.positions(state)
+            return MetricsCube(self.df.take(positions)).trend(freq=freq)
+        return self.cube.trend(state.selections, state.date_range, freq)
+
+    def hm_summary(self, positions):
+        """Candidates per dashboard category, conversion rate and median TTF per hiring manager.
+
+        One row per HM with at least one matching candidate, busiest first.
+        """
+        hm = self.df[HM_COLUMN].cat
+        hm_codes = hm.codes.to_numpy()[positions].astype(np.int64)
+        categories = pd.Categorical(self.df['Dashboard_Category'], categories=CATEGORIES).codes[positions]
+        known = (hm_codes >= 0) & (categories >= 0)
+        size = len(hm.categories)
+        counts = np.bincount(
+            hm_codes[known] * len(CATEGORIES) + categories[known], minlength=size * len(CATEGORIES),
+        ).reshape(size, len(CATEGORIES))
+
+        summary = pd.DataFrame(counts, index=pd.Index(hm.categories, name='HM'), columns=CATEGORIES)
+        summary.insert(0, 'Total', counts.sum(axis=1))
+        summary['Conversion %'] = (summary['Joined'] / summary['Total'].where(summary['Total'] > 0) * 100).round(1)
+        ttf = pd.Series(self.durations.ttf[positions]).groupby(hm_codes).median()
+        summary['Median TTF'] = ttf.reindex(range(size)).to_numpy()
+        summary = summary[summary['Total'] > 0]
+        return summary.sort_values('Total', ascending=False, kind='stable')
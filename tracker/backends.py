@@ -0,0 +1,501 @@
+"""Query backends: where filters, option counts, KPIs and table pages are answered.
+
+Every backend answers the same few calls, so the dashboard does not care
+which one it talks to:
+
+``value_counts(column)``
+    rows per value of a filter column, for the sidebar options;
+``positions(state, steps=None)``
+    sorted row ids matching a :class:`~tracker.views.FilterState`;
+``kpis(state, positions=None)``
+    the :class:`~tracker.metrics.KpiSummary` (cards, funnel, Quick Stats);
+``rows(positions)``
+    the rows of one table page, indexed by row id;
+``date_bounds()``
+    the first and last sourcing date, for the date filter's defaults;
+``repeats(state, positions=None)``
+    matching rows that are a repeat application (``None`` when unknown);
+``duration_summary(state, positions=None, as_of=None)``
+    the stage duration table of :meth:`~tracker.durations.StageDurations.summary`,
+    open candidates' SLA breaches aged to ``as_of`` (default today);
+``unknown``
+    rows per raw status no rule matched, for the diagnostics panel.
+
+:class:`PandasBackend` is the in-memory path (filter index, metrics cube) and
+the default. :class:`SqlBackend` runs the same queries against an embedded
+database file. The cleaned tracker is ingested once per data version, with an
+index on every filter column, and each call becomes one ``SELECT``. SQLite
+ships with Python. DuckDB, a columnar engine that is faster on large scans,
+is used when it is installed (``pip install duckdb``). Both work offline on a
+local file::
+
+    TA_BACKEND=sqlite streamlit run dashboard.py
+    TA_BACKEND=duckdb streamlit run dashboard.py
+
+The dashboard then keeps no frame in memory: a :class:`DatabaseHolder` opens
+the database file of the tracker's current data version, and only when that
+file is missing loads the tracker once to ingest it (in the background
+watcher, not in a session's rerun). Row ids are the tracker's row positions.
+The SQL backend has no typo-tolerant search; with ``fuzzy`` set it matches
+names by substring only. Trends and interview analytics need the in-memory
+structures and are not available.
+
+:class:`StreamBackend` answers from a :class:`~tracker.stream.TrackerStream`
+instead of a loaded frame, for trackers too large to load
+(``TA_BACKEND=stream``); see its docstring for what it cannot answer.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from tracker import cache
+from tracker.dataset import DatasetHolder
+from tracker.durations import STAGE_DATES, StageDurations
+from tracker.identity import IdentityIndex
+from tracker.index import DATE_COLUMN, FILTER_COLUMNS
+from tracker.metrics import kpis_from_counts
+from tracker.rules import CATEGORIES, unknown_statuses
+from tracker.schema import date_days
+from tracker.search import (
+    MIN_NGRAM_QUERY, normalize_digits, normalize_mails, normalize_mobiles, normalize_names, normalize_text,
+)
+from tracker.sources import data_version, load_trackers
+
+BACKENDS = ('pandas', 'sqlite', 'duckdb')
+DEFAULT_BACKEND = os.environ.get('TA_BACKEND', 'pandas')
+TABLE = 'candidates'
+SCHEMA_VERSION = 2  # bump when the ingested layout changes
+INSERT_BATCH_ROWS = 50_000
+# Seconds a superseded database file stays on disk, for reruns that started on the previous snapshot
+RELEASE_GRACE_SECONDS = 600
+CATEGORY_COLUMN = 'Dashboard_Category'
+# Helper columns next to the tracker's own: sourcing day number, normalized search keys, repeat-candidate identity
+DAY, NAME, MAIL, MOBILE = '_day', '_name', '_mail', '_mobile'
+IDENTITY, SEQUENCE, APPLICATION = '_identity', '_sequence', '_application'
+
+
+def _day_timestamp(day):
+    return pd.NaT if day is None else pd.Timestamp(np.datetime64(int(day), 'D'))
+
+
+def _parse_dates(values):
+    return pd.to_datetime(values, format='%Y-%m-%d')
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class PandasBackend:
+    """In-memory queries over the shared frame through a :class:`~tracker.analysis.TrackerAnalysis`."""
+
+    name = 'pandas'
+
+    def __init__(self, analysis):
+        self.analysis = analysis
+        self.version = analysis.version
+
+    def value_counts(self, column):
+        return self.analysis.filter_index.value_counts(column)
+
+    def positions(self, state, steps=None):
+        return self.analysis.positions(state, steps=steps)
+
+    def kpis(self, state, positions=None):
+        return self.analysis.kpis(state, positions)
+
+    def rows(self, positions):
+        return self.analysis.df.take(positions)
+
+    def date_bounds(self):
+        dates = self.analysis.df[DATE_COLUMN]
+        return dates.min(), dates.max()
+
+    def repeats(self, state, positions=None):
+        if positions is None:
+            positions = self.positions(state)
+        return self.analysis.identities.repeats(positions)
+
+    def duration_summary(self, state, positions=None, as_of=None):
+        if positions is None:
+            positions = self.positions(state)
+        return self.analysis.durations.summary(positions, as_of)
+
+    @property
+    def unknown(self):
+        return unknown_statuses(self.analysis.df)
+
+
+class StreamBackend:
+    """Queries over a :class:`~tracker.stream.TrackerStream`: counts from its aggregates, pages parsed from the file.
+
+    Nothing row-level stays in memory beyond a group id per row. The
+    aggregates are grouped by the stream's ``filter_columns`` (HM, Skill,
+    Location, Recruiter) and sourcing day only, so there is no candidate
+    search, no Business Unit filter and no repeat-candidate counting.
+    """
+
+    name = 'stream'
+
+    def __init__(self, stream, version):
+        self.stream = stream
+        self.version = version
+
+    def _groups(self, state):
+        if state.name or state.dedupe:
+            raise ValueError("the stream backend has no candidate search or repeat-candidate counting")
+        return self.stream.groups(state.selections, state.date_range)
+
+    def value_counts(self, column):
+        if column not in self.stream.filter_columns:
+            return pd.Series([], name='count', dtype=np.int64)
+        return self.stream.aggregates.value_counts(column)
+
+    def positions(self, state, steps=None):
+        start = time.perf_counter()
+        positions = self.stream.positions(self._groups(state))
+        if steps is not None:
+            steps.append(('stream groups', time.perf_counter() - start, len(self.stream), len(positions)))
+        return positions
+
+    def kpis(self, state, positions=None):
+        """Summed from the aggregates; ``positions`` is not needed."""
+        return self.stream.kpis(self._groups(state))
+
+    def rows(self, positions):
+        return self.stream.rows(positions)
+
+    def date_bounds(self):
+        days = self.stream.aggregates.days
+        days = days[days != np.iinfo(np.int64).min]
+        return (_day_timestamp(days.min()), _day_timestamp(days.max())) if len(days) else (pd.NaT, pd.NaT)
+
+    def repeats(self, state, positions=None):
+        return None
+
+    def duration_summary(self, state, positions=None, as_of=None):
+        """Over every row: the stream keeps duration histograms for the whole tracker only."""
+        return self.stream.aggregates.duration_summary(as_of)
+
+    @property
+    def unknown(self):
+        return self.stream.unknown
+
+
+def _column_types(df):
+    # (column, SQL type, stored as ISO date text) for every tracker column
+    types = []
+    for col in df.columns:
+        dtype = df[col].dtype
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            types.append((col, 'VARCHAR', True))
+        elif pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            types.append((col, 'BIGINT', False))
+        elif pd.api.types.is_float_dtype(dtype):
+            types.append((col, 'DOUBLE', False))
+        else:
+            types.append((col, 'VARCHAR', False))
+    return types
+
+
+def _table_frame(df, identities, types):
+    """The frame to ingest: tracker columns as plain values plus the helper columns."""
+    columns = {'row_id': np.arange(len(df), dtype=np.int64)}
+    for col, sql_type, is_date in types:
+        series = df[col]
+        if is_date:
+            # Zero-padded ISO text from the day numbers; strftime drops the padding of years before 1000
+            days = date_days(series)
+            series = pd.Series(np.where(np.isnat(days), None, np.datetime_as_string(days)), dtype='string')
+        elif sql_type == 'BIGINT':
+            series = series.astype('Int64')
+        elif sql_type == 'VARCHAR':
+            series = series.astype('string')
+        columns[col] = series.array
+    days = date_days(df[DATE_COLUMN])
+    columns[DAY] = pd.arrays.IntegerArray(days.astype(np.int64), np.isnat(days))
+
+    def search_key(column, normalize):
+        values = df[column] if column in df.columns else pd.Series([None] * len(df), dtype=object)
+        arr = normalize(pa.array(pd.Series(values).astype(object), type=pa.string(), from_pandas=True))
+        return pd.array(arr.to_pandas(), dtype='string')
+
+    columns[NAME] = search_key('Candidate Name', normalize_names)
+    columns[MAIL] = search_key('Mail Id', normalize_mails)
+    columns[MOBILE] = search_key('Mobile Number', normalize_mobiles)
+    columns[IDENTITY] = identities.identity
+    columns[SEQUENCE] = identities.sequence
+    columns[APPLICATION] = identities.application
+    return pd.DataFrame(columns)
+
+
+def _connect(path, engine, read_only=True):
+    if engine == 'duckdb':
+        import duckdb  # optional dependency, only needed for TA_BACKEND=duckdb
+
+        return duckdb.connect(str(path), read_only=read_only)
+    if read_only:
+        return sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    return sqlite3.connect(str(path))
+
+
+def ingest(df, path, engine='sqlite', identities=None):
+    """Write a cleaned tracker into a new database file at ``path`` (replaced atomically).
+
+    ``identities`` is the frame's :class:`~tracker.identity.IdentityIndex`
+    when one is already built.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    types = _column_types(df)
+    frame = _table_frame(df, identities or IdentityIndex(df), types)
+    helpers = [(DAY, 'BIGINT'), (NAME, 'VARCHAR'), (MAIL, 'VARCHAR'), (MOBILE, 'VARCHAR'),
+               (IDENTITY, 'BIGINT'), (SEQUENCE, 'BIGINT'), (APPLICATION, 'BIGINT')]
+    key = 'INTEGER PRIMARY KEY' if engine == 'sqlite' else 'BIGINT PRIMARY KEY'
+    definitions = [f'row_id {key}'] + [f'{_quote(col)} {sql_type}' for col, sql_type, _ in types]
+    definitions += [f'{_quote(col)} {sql_type}' for col, sql_type in helpers]
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    os.close(fd)
+    Path(tmp).unlink()  # DuckDB refuses to open an empty file as a database
+    try:
+        con = _connect(tmp, engine, read_only=False)
+        try:
+            con.execute(f'CREATE TABLE {TABLE} ({", ".join(definitions)})')
+            if engine == 'duckdb':
+                con.register('frame', frame)
+                con.execute(f'INSERT INTO {TABLE} SELECT * FROM frame')
+                con.unregister('frame')
+            else:
+                insert = f'INSERT INTO {TABLE} VALUES ({", ".join("?" * len(frame.columns))})'
+                for start in range(0, len(frame), INSERT_BATCH_ROWS):
+                    batch = frame.iloc[start:start + INSERT_BATCH_ROWS].astype(object)
+                    con.executemany(insert, batch.where(batch.notna(), None).itertuples(index=False, name=None))
+            for col in [c for c in FILTER_COLUMNS if c in df.columns] + [DAY, IDENTITY]:
+                con.execute(f'CREATE INDEX {_quote("idx" + col.replace(" ", "_"))} ON {TABLE} ({_quote(col)})')
+            unknown = unknown_statuses(df)
+            meta = {
+                'data_version': df.attrs.get('data_version'),
+                'rows': len(frame),
+                'dates': [col for col, _, is_date in types if is_date],
+                'columns': [col for col, _, _ in types],
+                'unknown': [[str(status), int(rows)] for status, rows in unknown.items()],
+            }
+            con.execute('CREATE TABLE meta (key VARCHAR, value VARCHAR)')
+            con.executemany('INSERT INTO meta VALUES (?, ?)', [(k, json.dumps(v)) for k, v in meta.items()])
+            con.commit()
+        finally:
+            con.close()
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class SqlBackend:
+    """Pushed-down queries against a database file written by :func:`ingest`."""
+
+    def __init__(self, path, engine='sqlite'):
+        self.path = Path(path)
+        self.name = engine
+        self._local = threading.local()
+        self._shared = _connect(self.path, engine) if engine == 'duckdb' else None
+        meta = {key: json.loads(value) for key, value in self._execute('SELECT key, value FROM meta')}
+        self.version = meta['data_version']
+        self.size = meta['rows']
+        self.columns = meta['columns']
+        self.dates = meta['dates']
+        self.unknown = pd.Series(
+            [rows for _, rows in meta['unknown']], index=pd.Index([s for s, _ in meta['unknown']], name='Status'),
+            name='Rows', dtype=np.int64,
+        )
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        """Bytes of tracker data held in memory: none, the rows stay in the database file."""
+        return 0
+
+    def _connection(self):
+        # One connection (SQLite) or cursor (DuckDB) per thread; Streamlit runs sessions on threads
+        con = getattr(self._local, 'con', None)
+        if con is None:
+            con = self._shared.cursor() if self._shared is not None else _connect(self.path, self.name)
+            self._local.con = con
+        return con
+
+    def _execute(self, sql, params=()):
+        return self._connection().execute(sql, list(params)).fetchall()
+
+    def _where(self, state):
+        clauses, params = [], []
+        for col, values in state.selections.items():
+            if values and col in self.columns:
+                clauses.append(f'{_quote(col)} IN ({", ".join("?" * len(values))})')
+                params.extend(values)
+        if state.date_range is not None:
+            lo, hi = (np.datetime64(d, 'D').astype(np.int64) for d in state.date_range)
+            clauses.append(f'{DAY} BETWEEN ? AND ?')
+            params.extend([int(lo), int(hi)])
+        if state.name:
+            # Same matching as CandidateSearchIndex.search, minus the fuzzy name match
+            text = normalize_text(state.name)
+            search = [f"{NAME} LIKE ? ESCAPE '\\'"]
+            params.append(f'%{_like(text)}%')
+            mail = text.replace(' ', '')
+            if len(mail) >= MIN_NGRAM_QUERY:
+                search.append(f"{MAIL} LIKE ? ESCAPE '\\'")
+                params.append(f'{_like(mail)}%')
+            digits = normalize_digits(state.name)
+            if len(digits) >= MIN_NGRAM_QUERY and len(digits) * 2 >= len(mail):
+                search.append(f'({MOBILE} LIKE ? OR {MOBILE} LIKE ?)')
+                params.extend([f'{digits}%', f'%{digits}'])
+            clauses.append(f'({" OR ".join(search)})')
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def value_counts(self, column):
+        if column not in self.columns:
+            return pd.Series([], name='count', dtype=np.int64)
+        col = _quote(column)
+        rows = self._execute(f'SELECT {col}, COUNT(*) FROM {TABLE} WHERE {col} IS NOT NULL GROUP BY {col} ORDER BY {col}')
+        return pd.Series([n for _, n in rows], index=[v for v, _ in rows], name='count', dtype=np.int64)
+
+    def positions(self, state, steps=None):
+        start = time.perf_counter()
+        where, params = self._where(state)
+        rows = self._execute(f'SELECT row_id FROM {TABLE}{where} ORDER BY row_id', params)
+        positions = np.fromiter((r for r, in rows), dtype=np.int64, count=len(rows))
+        if steps is not None:
+            steps.append((f'{self.name} query', time.perf_counter() - start, self.size, len(positions)))
+        return positions
+
+    def kpis(self, state, positions=None):
+        """Rows per category grouped in the database; ``positions`` is not needed."""
+        where, params = self._where(state)
+        category = _quote(CATEGORY_COLUMN)
+        source = TABLE
+        if state.dedupe:
+            # Each candidate's latest matching application only
+            source = (f'(SELECT {category}, ROW_NUMBER() OVER (PARTITION BY {IDENTITY} ORDER BY {SEQUENCE} DESC) '
+                      f'AS _latest FROM {TABLE}{where}) AS latest')
+            where, params = ' WHERE _latest = 1', params
+        counts = dict(self._execute(f'SELECT {category}, COUNT(*) FROM {source}{where} GROUP BY {category}', params))
+        return kpis_from_counts([counts.get(c, 0) for c in CATEGORIES], total=sum(counts.values()))
+
+    def repeats(self, state, positions=None):
+        """Matching rows that are a repeat application, counted in the database."""
+        where, params = self._where(state)
+        where += (' AND ' if where else ' WHERE ') + f'{APPLICATION} > 1'
+        return self._execute(f'SELECT COUNT(*) FROM {TABLE}{where}', params)[0][0]
+
+    def duration_summary(self, state, positions=None, as_of=None):
+        """Stage durations of the matching rows, from just their date and category columns."""
+        columns = [col for _, col in STAGE_DATES if col in self.dates] + [CATEGORY_COLUMN]
+        where, params = self._where(state)
+        rows = self._execute(f'SELECT {", ".join(_quote(col) for col in columns)} FROM {TABLE}{where}', params)
+        frame = pd.DataFrame(rows, columns=columns)
+        for col in columns[:-1]:
+            frame[col] = _parse_dates(frame[col])
+        return StageDurations(frame).summary(as_of=as_of)
+
+    def rows(self, positions):
+        """Rows at ``positions`` (one table page) in the given order, indexed by row id."""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = ', '.join(_quote(col) for col in self.columns)
+        frame = pd.DataFrame(columns=self.columns, index=pd.Index([], dtype=np.int64))
+        if len(positions):
+            rows = self._execute(
+                f'SELECT row_id, {columns} FROM {TABLE} WHERE row_id IN ({", ".join("?" * len(positions))})',
+                positions.tolist(),
+            )
+            frame = pd.DataFrame([r[1:] for r in rows], columns=self.columns, index=[r[0] for r in rows])
+        frame = frame.reindex(positions)
+        for col in self.dates:
+            frame[col] = _parse_dates(frame[col])
+        return frame
+
+    def date_bounds(self):
+        lo, hi = self._execute(f'SELECT MIN({DAY}), MAX({DAY}) FROM {TABLE}')[0]
+        return _day_timestamp(lo), _day_timestamp(hi)
+
+
+def database_path(version, engine, directory=None):
+    digest = hashlib.blake2b(f'{SCHEMA_VERSION}-{version}'.encode(), digest_size=8).hexdigest()
+    return Path(directory or cache.cache_dir()) / 'db' / f'tracker-{digest}.{engine}'
+
+
+def open_backend(analysis, name=DEFAULT_BACKEND, directory=None):
+    """Backend ``name`` for the analysis' data version, ingesting it first when the database file is missing."""
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend {name!r}; expected one of {', '.join(BACKENDS)}")
+    if name == 'pandas':
+        return PandasBackend(analysis)
+    path = database_path(analysis.version, name, directory)
+    if not path.exists():
+        ingest(analysis.df, path, name, analysis.identities)
+    return SqlBackend(path, name)
+
+
+class DatabaseHolder(DatasetHolder):
+    """A :class:`~tracker.dataset.DatasetHolder` of :class:`SqlBackend` snapshots instead of frames.
+
+    A snapshot opens the database file of the source's data version, which
+    is worked out from content hashes without loading the tracker. Only a
+    version without a database file is loaded, ingested and dropped again.
+
+    Database files this holder ingested are deleted once a newer version has
+    replaced them for :data:`RELEASE_GRACE_SECONDS`; files written by other
+    processes sharing the directory are left alone.
+    """
+
+    def __init__(self, source, engine='sqlite', directory=None, **kwargs):
+        if engine not in ('sqlite', 'duckdb'):
+            raise ValueError(f"unknown database engine {engine!r}; expected 'sqlite' or 'duckdb'")
+        super().__init__(source, **kwargs)
+        self.engine = engine
+        self.directory = directory
+        self._owned = {}  # database path -> monotonic time it was superseded, None while current
+
+    def load(self):
+        version = data_version(self.source, self.rules_path, self.cache_dir)
+        path = database_path(version, self.engine, self.directory)
+        if not path.exists():
+            df = load_trackers(self.source, self.rules_path, self.cache_dir)
+            # The files may have changed since they were hashed; name the file after what was loaded
+            version = df.attrs['data_version']
+            path = database_path(version, self.engine, self.directory)
+            if not path.exists():
+                ingest(df, path, self.engine)
+                self._owned[path] = None
+        self._release(path)
+        return SqlBackend(path, self.engine), version
+
+    def _release(self, current):
+        now = time.monotonic()
+        for path, superseded in list(self._owned.items()):
+            if path == current:
+                self._owned[path] = None
+            elif superseded is None:
+                self._owned[path] = now
+            elif now - superseded >= RELEASE_GRACE_SECONDS:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    continue  # still open elsewhere (Windows); retried on the next load
+                del self._owned[path]
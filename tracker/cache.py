@@ -0,0 +1,153 @@
+"""Persistent columnar cache of cleaned tracker frames.
+
+A cleaned DataFrame is written as an uncompressed Arrow IPC (Feather v2) file
+so it can be reopened with memory mapping. A small JSON sidecar records the
+source file's size, mtime and content hash plus a ``salt`` describing the
+cleaning pipeline (format version, status rules). A cache entry is reused when
+size and mtime match, or when only the mtime moved but the content hash is
+unchanged. Files are replaced atomically, so several Streamlit processes on
+the same host can share one cache directory.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'tracker'
+
+
+def _new_digest():
+    return hashlib.blake2b(digest_size=20)
+
+
+def content_hash(path, chunk_size=1 << 20):
+    """Return the hex BLAKE2b digest of a file's bytes."""
+    digest = _new_digest()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_appended(source, prefix_size, size, chunk_size=1 << 20):
+    """Split ``source`` at ``prefix_size`` bytes for append-only ingestion.
+
+    Returns ``(prefix_hash, full_hash, tail, last_prefix_byte)`` where the hashes
+    cover the first ``prefix_size`` and ``size`` bytes and ``tail`` holds the
+    bytes in between. Everything is read in one sequential pass.
+    """
+    digest = _new_digest()
+    last = b''
+    with open(source, 'rb') as f:
+        remaining = prefix_size
+        while remaining:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            last = chunk[-1:]
+            remaining -= len(chunk)
+        prefix_hash = digest.hexdigest()
+        tail = f.read(size - prefix_size)
+    digest.update(tail)
+    return prefix_hash, digest.hexdigest(), tail, last
+
+
+def cache_dir():
+    """Cache directory; override with the ``TA_CACHE_DIR`` environment variable."""
+    return Path(os.environ.get('TA_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+def _entry_name(source):
+    # One entry per absolute source path, readable stem plus a short path hash
+    source = Path(source).resolve()
+    return f"{source.stem}-{hashlib.blake2b(str(source).encode(), digest_size=6).hexdigest()}"
+
+
+def _atomic_write(path, write):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_meta(source, directory=None):
+    """Return the sidecar metadata for ``source``, or ``None`` if there is no usable entry."""
+    meta_path = Path(directory or cache_dir()) / f"{_entry_name(source)}.json"
+    try:
+        return json.loads(meta_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_meta(source, meta, directory=None):
+    meta_path = Path(directory or cache_dir()) / f"{_entry_name(source)}.json"
+    _atomic_write(meta_path, lambda tmp: Path(tmp).write_text(json.dumps(meta)))
+
+
+def read_frame(data_path):
+    """Memory-map a cached Feather file and convert it back to pandas."""
+    with pa.memory_map(str(data_path), 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def write_frame(df, data_path):
+    # Uncompressed so the file can be memory mapped on read
+    _atomic_write(Path(data_path), lambda tmp: feather.write_feather(df, tmp, compression='uncompressed'))
+
+
+def lookup(source, salt, directory=None):
+    """Return ``(df, meta)`` for a valid cache entry of ``source``, else ``(None, meta_or_None)``."""
+    directory = Path(directory or cache_dir())
+    source = Path(source)
+    meta = read_meta(source, directory)
+    if meta is None or meta.get('salt') != salt:
+        return None, None
+    stat = source.stat()
+    if meta['size'] != stat.st_size:
+        return None, meta
+    if meta['mtime_ns'] != stat.st_mtime_ns:
+        # Touched but possibly unchanged: confirm with the content hash
+        if meta['hash'] != content_hash(source):
+            return None, meta
+        meta = dict(meta, mtime_ns=stat.st_mtime_ns)
+        try:
+            write_meta(source, meta, directory)
+        except OSError:
+            pass  # read-only cache directory: hash again next time
+    try:
+        return read_frame(directory / meta['data']), meta
+    except (OSError, pa.ArrowInvalid):
+        return None, meta
+
+
+def store(source, df, salt, directory=None, stat=None, digest=None, **extra):
+    """Write ``df`` as the cache entry for ``source`` and return the new metadata."""
+    directory = Path(directory or cache_dir())
+    source = Path(source)
+    stat = stat or source.stat()
+    digest = digest or content_hash(source)
+    name = _entry_name(source)
+    data_name = f"{name}-{digest[:16]}.feather"
+    write_frame(df, directory / data_name)
+    meta = dict(extra, size=stat.st_size, mtime_ns=stat.st_mtime_ns, hash=digest, salt=salt, data=data_name)
+    write_meta(source, meta, directory)
+    # Drop superseded data files; readers that still map them keep working on POSIX
+    for old in directory.glob(f"{name}-*.feather"):
+        if old.name != data_name:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return meta
+
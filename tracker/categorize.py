@@ -0,0 +1,65 @@
+"""Vectorized status categorization for the TA tracker.
+
+Every candidate is bucketed into one of the dashboard categories from the raw
+``Status`` text and the ``Status of R1/R2/R3`` interview outcomes. Status
+spellings come from the rules file (see :mod:`tracker.rules`) and are resolved
+once per distinct value; rows are then mapped through integer codes.
+"""
+import numpy as np
+import pandas as pd
+
+from tracker.rules import CATEGORIES, load_rules
+
+REJECT_ROUNDS = ['R1', 'R2', 'R3']
+ROUND_STATUS_COLUMNS = ['Status of R1', 'Status of R2', 'Status of R3']
+
+
+def _factorize(df, col):
+    # Missing columns behave like an all-blank column
+    if col not in df.columns:
+        return np.full(len(df), -1, dtype=np.intp), []
+    values = df[col]
+    # Categorical columns are already factorized
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), list(values.cat.categories)
+    return pd.factorize(values.to_numpy(dtype=object))
+
+
+def _round_flags(df, col):
+    """Return ``(not_cleared, blank)`` masks for one interview round column."""
+    codes, uniques = _factorize(df, col)
+    texts = [str(u).strip() for u in uniques]
+    # The extra trailing slot is what code -1 (missing value) maps to
+    not_cleared = np.array([t == 'Not Cleared' for t in texts] + [False])
+    blank = np.array([t == '' for t in texts] + [True])
+    return not_cleared[codes], blank[codes]
+
+
+def categorize_status(df, rules=None):
+    """Return ``(Dashboard_Category, Reject_Round)`` as categorical Series aligned with ``df``."""
+    if rules is None:
+        rules = load_rules()
+
+    # One rule lookup per distinct status, then a single integer-coded mapping
+    codes, uniques = _factorize(df, 'Status')
+    buckets = [rules.bucket_for(status) or 'Other' for status in uniques] + [rules.blank]
+    lookup = np.array([CATEGORIES.index(b) for b in buckets], dtype=np.int8)
+    category_codes = lookup[codes]
+
+    # Determine reject round; R1 beats R2 beats R3
+    (r1_nc, r1_blank), (r2_nc, r2_blank), (r3_nc, r3_blank) = (_round_flags(df, col) for col in ROUND_STATUS_COLUMNS)
+    round_codes = np.select([r1_nc, r2_nc, r3_nc], [0, 1, 2], default=-1).astype(np.int8)
+
+    # A rejection with no round info at all is treated as a screening reject
+    rejected = category_codes == CATEGORIES.index('Rejected')
+    screening = rejected & (round_codes == -1) & r1_blank & r2_blank & r3_blank
+    category_codes[screening] = CATEGORIES.index('Screening Reject')
+    round_codes[category_codes != CATEGORIES.index('Rejected')] = -1
+
+    category = pd.Series(
+        pd.Categorical.from_codes(category_codes, categories=CATEGORIES), index=df.index, name='Dashboard_Category'
+    )
+    reject_round = pd.Series(
+        pd.Categorical.from_codes(round_codes, categories=REJECT_ROUNDS), index=df.index, name='Reject_Round'
+    )
+    return category, reject_round
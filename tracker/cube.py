@@ -0,0 +1,182 @@
+"""Pre-aggregated metrics cube for KPIs and trend charts.
+
+Built once per data load. Rows are grouped by sourcing day and every filter
+column (HM, Skill, Location, Recruiter, Business Unit); each group keeps its
+row count per dashboard category and per reject round. Only combinations
+that occur are stored (a sparse table), so the cube is never larger than the
+tracker and usually far smaller. A filter combination is resolved against
+the group table with the same :class:`~tracker.index.FilterIndex` the rows
+use, and KPIs, funnel stages and trends are sums over the matching groups
+rather than scans over candidate rows.
+
+Joins are also counted by joining day, so the trend charts place a hire in
+the week or month it happened rather than when the candidate was sourced.
+"""
+import numpy as np
+import pandas as pd
+
+from tracker.categorize import REJECT_ROUNDS
+from tracker.index import DATE_COLUMN, FILTER_COLUMNS, FilterIndex
+from tracker.metrics import kpis_from_counts
+from tracker.rules import CATEGORIES
+from tracker.schema import date_days
+
+JOIN_DATE_COLUMN = 'Joining Date'
+# Trend bucket per display label: weeks start on Monday, months on the 1st
+TREND_FREQUENCIES = {'Weekly': 'W', 'Monthly': 'M'}
+REJECTION_COLUMNS = ['Screening Reject'] + [f'{r} Reject' for r in REJECT_ROUNDS]
+TREND_COLUMNS = ['Sourced', 'Joined'] + REJECTION_COLUMNS
+
+_NO_DAY = np.iinfo(np.int64).min  # NaT as int64 day number
+
+
+def _days(dates):
+    return date_days(dates).astype(np.int64)
+
+
+def group_rows(df, columns, date_column=DATE_COLUMN):
+    """``(group id per row, first row of each group)`` over categorical ``columns`` and the day of ``date_column``.
+
+    Group ids number the distinct combinations in order of first appearance.
+    """
+    keys = {col: df[col].cat.codes.to_numpy() for col in columns}
+    keys[date_column] = _days(df[date_column])
+    groups = pd.DataFrame(keys).groupby(list(keys), sort=False).ngroup().to_numpy()
+    return groups, np.unique(groups, return_index=True)[1]
+
+
+def period_starts(days, freq):
+    """First day (as ``datetime64[us]``, the unit dates are parsed to) of the week (``'W'``, Monday) or month (``'M'``) of each day number."""
+    if freq == 'W':
+        starts = days - (days + 3) % 7  # day 0, 1970-01-01, was a Thursday
+        return starts.astype('datetime64[D]').astype('datetime64[us]')
+    if freq == 'M':
+        return days.astype('datetime64[D]').astype('datetime64[M]').astype('datetime64[us]')
+    raise ValueError(f"unknown trend frequency {freq!r}; expected 'W' or 'M'")
+
+
+class MetricsCube:
+    def __init__(self, df, columns=FILTER_COLUMNS):
+        self.columns = [col for col in columns if col in df.columns]
+        self.size = len(df)
+        groups, first = group_rows(df, self.columns)
+        self.groups = pd.DataFrame({col: df[col].take(first).array for col in self.columns + [DATE_COLUMN]})
+        self.days = _days(self.groups[DATE_COLUMN])
+        self.index = FilterIndex(self.groups, columns=self.columns)
+
+        # (groups x categories) and (groups x reject rounds) row counts
+        categories = pd.Categorical(df['Dashboard_Category'], categories=CATEGORIES).codes.astype(np.int64)
+        self.counts = np.bincount(
+            groups * len(CATEGORIES) + categories, minlength=len(first) * len(CATEGORIES),
+        ).reshape(len(first), len(CATEGORIES)).astype(np.int32)
+        rounds = pd.Categorical(df['Reject_Round'], categories=REJECT_ROUNDS).codes.astype(np.int64)
+        rejected = rounds >= 0
+        self.rounds = np.bincount(
+            groups[rejected] * len(REJECT_ROUNDS) + rounds[rejected], minlength=len(first) * len(REJECT_ROUNDS),
+        ).reshape(len(first), len(REJECT_ROUNDS)).astype(np.int32)
+
+        # Joined rows by (group, joining day); joins without a joining date have no place on a timeline
+        join_days = _days(df[JOIN_DATE_COLUMN]) if JOIN_DATE_COLUMN in df.columns else np.full(len(df), _NO_DAY)
+        joined = (categories == CATEGORIES.index('Joined')) & (join_days != _NO_DAY)
+        joins = pd.DataFrame({'group': groups[joined], 'day': join_days[joined]}).value_counts(sort=False)
+        self.join_groups = joins.index.get_level_values('group').to_numpy()
+        self.join_days = joins.index.get_level_values('day').to_numpy()
+        self.join_counts = joins.to_numpy()
+
+        # Per-category prefix sums over the groups in date order, for date-only filters
+        ordered = self.counts[self.index.date_order].astype(np.int64)
+        self.cumulative = np.vstack([np.zeros((1, len(CATEGORIES)), dtype=np.int64), np.cumsum(ordered, axis=0)])
+
+        # Day-level rollups of the trend counts, for trends without column filters
+        self.daily_days, day_codes = np.unique(self.days, return_inverse=True)
+        self.daily = _sum_by(day_codes, self._trend_counts(slice(None)), len(self.daily_days))
+        pairs = pd.DataFrame({'sourced': self.days[self.join_groups], 'joined': self.join_days, 'count': self.join_counts})
+        pairs = pairs.groupby(['sourced', 'joined'], sort=False)['count'].sum()
+        self.daily_join_sourced = pairs.index.get_level_values('sourced').to_numpy()
+        self.daily_join_days = pairs.index.get_level_values('joined').to_numpy()
+        self.daily_join_counts = pairs.to_numpy().astype(np.int64)
+
+    def __len__(self):
+        return len(self.groups)
+
+    @property
+    def nbytes(self):
+        arrays = (self.days, self.counts, self.rounds, self.cumulative, self.join_groups, self.join_days, self.join_counts)
+        return int(self.groups.memory_usage(deep=True).sum()) + sum(a.nbytes for a in arrays)
+
+    def resolve(self, selections=None, date_range=None):
+        """Group ids matching the filters; same arguments as :meth:`FilterIndex.resolve`."""
+        return self.index.resolve({col: v for col, v in (selections or {}).items() if v}, date_range)
+
+    def category_counts(self, selections=None, date_range=None):
+        """Rows per dashboard category matching the filters.
+
+        A date range alone is answered from prefix sums over the groups in
+        date order (two lookups); other filters sum the matching groups.
+        """
+        if any((selections or {}).values()):
+            return self.counts[self.resolve(selections, date_range)].sum(axis=0, dtype=np.int64)
+        if date_range is None:
+            return self.cumulative[-1]
+        lo, hi = (np.datetime64(d, 'D').astype(np.int64) for d in date_range)
+        start = np.searchsorted(self.index.sorted_days, lo, 'left')
+        stop = max(np.searchsorted(self.index.sorted_days, hi, 'right'), start)
+        return self.cumulative[stop] - self.cumulative[start]
+
+    def kpis(self, selections=None, date_range=None):
+        """:class:`~tracker.metrics.KpiSummary` for the filters, from the cube alone."""
+        return kpis_from_counts(self.category_counts(selections, date_range))
+
+    def _trend_counts(self, groups):
+        # Sourced, Screening Reject and R1 / R2 / R3 Reject columns for the given groups
+        counts = self.counts[groups]
+        return np.column_stack([
+            counts.sum(axis=1), counts[:, CATEGORIES.index('Screening Reject')], self.rounds[groups],
+        ]).astype(np.int64)
+
+    def trend(self, selections=None, date_range=None, freq='W'):
+        """Sourced, joined and rejected candidates per week (``'W'``) or month (``'M'``) for the filters.
+
+        Sourced and rejection counts follow the sourcing date, joins the
+        joining date. Periods with no activity in between are filled with 0.
+        """
+        if any((selections or {}).values()):
+            groups = self.resolve(selections, date_range)
+            days, counts = self.days[groups], self._trend_counts(groups)
+            wanted = np.zeros(len(self), dtype=bool)
+            wanted[groups] = True
+            matched = wanted[self.join_groups]
+            join_days, join_counts = self.join_days[matched], self.join_counts[matched]
+        else:
+            days, counts = self.daily_days, self.daily
+            join_days, join_counts = self.daily_join_days, self.daily_join_counts
+            if date_range is not None:
+                lo, hi = (np.datetime64(d, 'D').astype(np.int64) for d in date_range)
+                in_range = (days >= lo) & (days <= hi)
+                days, counts = days[in_range], counts[in_range]
+                matched = (self.daily_join_sourced >= lo) & (self.daily_join_sourced <= hi)
+                join_days, join_counts = join_days[matched], join_counts[matched]
+
+        dated = days != _NO_DAY
+        sourced, sourced_periods = _sum_by_period(days[dated], counts[dated], freq)
+        joined, joined_periods = _sum_by_period(join_days, join_counts[:, None], freq)
+        periods = sourced_periods.union(joined_periods)
+        if len(periods):
+            periods = pd.date_range(periods.min(), periods.max(), freq='W-MON' if freq == 'W' else 'MS')
+        columns = ['Sourced'] + REJECTION_COLUMNS
+        trend = pd.DataFrame(sourced, index=sourced_periods, columns=columns).reindex(periods, fill_value=0)
+        trend['Joined'] = pd.Series(joined[:, 0], index=joined_periods).reindex(periods, fill_value=0)
+        trend.index.name = 'Period'
+        return trend[TREND_COLUMNS].astype(np.int64)
+
+
+def _sum_by(codes, values, size):
+    """Sum the rows of ``values`` per code (0 .. size - 1)."""
+    return np.column_stack([
+        np.bincount(codes, weights=values[:, i], minlength=size) for i in range(values.shape[1])
+    ]).astype(np.int64).reshape(size, values.shape[1])
+
+
+def _sum_by_period(days, values, freq):
+    starts, codes = np.unique(period_starts(days, freq), return_inverse=True)
+    return _sum_by(codes, values, len(starts)), pd.DatetimeIndex(starts)
@@ -0,0 +1,128 @@
+"""Process-wide, read-only tracker dataset shared by every session.
+
+A :class:`DatasetHolder` keeps one immutable :class:`Dataset` snapshot (the
+cleaned frame plus its data version) and hands the same object to every
+caller, so concurrent sessions share one copy of the data instead of each
+receiving a deserialized copy. Consumers never modify the frame: filters
+produce row-position arrays and pages are small ``take``s, and under pandas
+copy-on-write any derived frame is independent of the shared one.
+
+The source (a tracker file, directory or glob; see :mod:`tracker.sources`) is
+re-checked at most every ``check_interval`` seconds with a cheap ``stat`` of
+every file. Only when a file (or the status rules file) changed, appeared or
+went away are the trackers reloaded, and the new snapshot replaces the old
+one in a single assignment. Sessions still holding the previous snapshot keep
+a consistent view until their next rerun. A reload that fails (a half-saved
+file, a broken rules file) keeps the previous snapshot and is kept in
+``error`` until the files change again and load cleanly; only the very first
+load raises.
+
+Subclasses may hold something other than a frame by overriding
+:meth:`DatasetHolder.load` (the dashboard's streaming mode holds a
+:class:`~tracker.stream.TrackerStream`).
+
+A :class:`~tracker.watch.TrackerWatcher` pushes changes sooner: it refreshes
+the holder in the background within a second of a save.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from tracker.rules import DEFAULT_RULES_PATH
+from tracker.sources import load_trackers, resolve_sources
+
+DEFAULT_CHECK_INTERVAL = 60  # seconds, matching the dashboard's previous cache TTL
+
+
+@dataclass(frozen=True)
+class Dataset:
+    frame: pd.DataFrame = field(repr=False)  # or whatever DatasetHolder.load returns
+    version: str
+    loaded_at: float  # time.time() of the load
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def nbytes(self):
+        if isinstance(self.frame, pd.DataFrame):
+            return int(self.frame.memory_usage(deep=True).sum())
+        return self.frame.nbytes
+
+
+def _signature(*paths):
+    """``(path, size, mtime_ns)`` per path; ``None`` stats for a missing file."""
+    result = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            result.append((str(path), None))
+        else:
+            result.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(result)
+
+
+class DatasetHolder:
+    """Thread-safe holder of the current :class:`Dataset` for a tracker source spec."""
+
+    def __init__(self, source, rules_path=DEFAULT_RULES_PATH, cache_dir=None, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.source = source
+        self.rules_path = rules_path
+        self.cache_dir = cache_dir
+        self.check_interval = check_interval
+        self.loads = 0
+        self.error = None  # exception of the last failed reload, cleared by the next good one
+        self._current = None
+        self._signature = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        """Version of the snapshot held right now, without re-checking the source (``None`` before the first load)."""
+        dataset = self._current
+        return None if dataset is None else dataset.version
+
+    def signature(self):
+        """Cheap ``stat`` fingerprint of the tracker files and the status rules file."""
+        return _signature(*resolve_sources(self.source), self.rules_path)
+
+    def load(self):
+        """Load the source now: ``(data, data version)``."""
+        df = load_trackers(self.source, self.rules_path, self.cache_dir)
+        return df, df.attrs['data_version']
+
+    def current(self):
+        """Return the shared snapshot, reloading first if the source changed since the last check."""
+        dataset = self._current
+        if dataset is not None and time.monotonic() - self._checked < self.check_interval:
+            return dataset
+        return self.refresh(force=False)
+
+    def refresh(self, force=True):
+        """Re-check the source now (``force`` skips the check interval) and return the current snapshot."""
+        with self._lock:
+            # Another thread may have refreshed while this one waited for the lock
+            if not force and self._current is not None and time.monotonic() - self._checked < self.check_interval:
+                return self._current
+            signature = self.signature()
+            if self._current is None or signature != self._signature:
+                try:
+                    data, version = self.load()
+                except Exception as exc:
+                    if self._current is None:
+                        raise
+                    # Keep serving the previous snapshot; the next change of the files retries
+                    self.error = exc
+                else:
+                    self.error = None
+                    self.loads += 1
+                    if self._current is None or version != self._current.version:
+                        self._current = Dataset(data, version, time.time())
+                self._signature = signature
+            self._checked = time.monotonic()
+            return self._current
@@ -0,0 +1,128 @@
+"""Stage durations recomputed from the tracker's date columns.
+
+The sheet's own ``TTF (60 days)`` / ``TTH (30 days)`` cells are spreadsheet
+formulas that turn into serial-date garbage (``-45992``) whenever one of the
+dates is blank. :class:`StageDurations` derives the same numbers from the
+parsed dates instead, as whole-column array math:
+
+* time to fill (TTF): requisition date -> joining date,
+* time to hire (TTH): screening date -> offer acceptance date,
+* the days taken to reach each pipeline stage from the previous stage the
+  candidate has a date for (so skipped rounds do not leave gaps).
+
+A duration is missing when either date is blank or the dates are out of
+order. SLA breach flags cover finished hires over the limit as well as open
+candidates (Selected or Pending/Active) already older than it. Open
+candidates age every day while the data does not change, so their breaches
+are worked out when asked for, against today (or an explicit ``as_of``).
+"""
+import numpy as np
+import pandas as pd
+
+from tracker.schema import date_days
+
+# Pipeline stages in order, with the date column that marks each one
+STAGE_DATES = [
+    ('Requisition', 'Req Date'),
+    ('Sourced', 'Sourcing Date'),
+    ('Screened', 'Screening Date'),
+    ('R1 Interview', 'Date R1 Interview'),
+    ('R1 Feedback', 'R1 Feedback Date'),
+    ('R2 Interview', 'Date R2 Interview'),
+    ('R2 Feedback', 'R2 Feedback Date'),
+    ('R3 Interview', 'Date R3 Interview'),
+    ('R3 Feedback', 'R3 Feedback Date'),
+    ('Offer', 'Offer date'),
+    ('Offer Accepted', 'Offer Acceptance Date'),
+    ('Joined', 'Joining Date'),
+]
+TRANSITIONS = [stage for stage, _ in STAGE_DATES[1:]]
+
+TTF_SLA_DAYS = 60
+TTH_SLA_DAYS = 30
+OPEN_CATEGORIES = ['Selected', 'Pending/Active']
+PERCENTILES = [50, 75, 90]
+
+
+def day_numbers(dates):
+    """Days since the epoch as float32 (exact for any realistic date); NaT becomes NaN."""
+    days = date_days(dates)
+    result = days.astype(np.int64).astype(np.float32)
+    result[np.isnat(days)] = np.nan
+    return result
+
+
+def today_number(as_of=None):
+    """Day number of ``as_of`` (default: today, at the time of the call)."""
+    return day_numbers([np.datetime64(as_of or pd.Timestamp.today().normalize(), 'D')])[0]
+
+
+def _elapsed(start, end):
+    with np.errstate(invalid='ignore'):
+        days = end - start
+        days[days < 0] = np.nan  # dates out of order are data-entry errors
+    return days
+
+
+class StageDurations:
+    def __init__(self, df):
+        """Compute every duration for ``df`` once; open candidates are aged per call."""
+        self.size = len(df)
+        missing = np.full(len(df), np.nan, dtype=np.float32)
+        days = {stage: day_numbers(df[col]) if col in df.columns else missing for stage, col in STAGE_DATES}
+        # One (rows x stages) matrix of days since the last recorded stage, column-major
+        self.transitions = np.empty((len(df), len(TRANSITIONS)), dtype=np.float32, order='F')
+        previous = days[STAGE_DATES[0][0]]
+        for i, stage in enumerate(TRANSITIONS):
+            self.transitions[:, i] = _elapsed(previous, days[stage])
+            previous = np.where(np.isnan(days[stage]), previous, days[stage])
+        self.ttf = _elapsed(days['Requisition'], days['Joined'])
+        self.tth = _elapsed(days['Screened'], days['Offer Accepted'])
+
+        # Start day of each open candidate still without a TTF / TTH (NaN otherwise)
+        is_open = np.asarray(df['Dashboard_Category'].isin(OPEN_CATEGORIES)) if 'Dashboard_Category' in df.columns \
+            else np.zeros(len(df), dtype=bool)
+        self.ttf_open_since = np.where(is_open & np.isnan(self.ttf), days['Requisition'], np.nan).astype(np.float32)
+        self.tth_open_since = np.where(is_open & np.isnan(self.tth), days['Screened'], np.nan).astype(np.float32)
+
+    def breaches(self, positions=None, as_of=None):
+        """``(ttf_breach, tth_breach)`` flags for the rows at ``positions``, with open candidates aged to ``as_of``."""
+        if positions is None:
+            positions = slice(None)
+        today = today_number(as_of)
+        with np.errstate(invalid='ignore'):
+            ttf = (self.ttf[positions] > TTF_SLA_DAYS) | (today - self.ttf_open_since[positions] > TTF_SLA_DAYS)
+            tth = (self.tth[positions] > TTH_SLA_DAYS) | (today - self.tth_open_since[positions] > TTH_SLA_DAYS)
+        return ttf, tth
+
+    def frame(self, positions, as_of=None):
+        """TTF, TTH and SLA breach flags for the rows at ``positions``."""
+        ttf_breach, tth_breach = self.breaches(positions, as_of)
+        return pd.DataFrame({
+            'TTF': pd.array(self.ttf[positions], dtype='Float32').astype('Int32'),
+            'TTH': pd.array(self.tth[positions], dtype='Float32').astype('Int32'),
+            f'TTF > {TTF_SLA_DAYS}d': ttf_breach,
+            f'TTH > {TTH_SLA_DAYS}d': tth_breach,
+        })
+
+    def summary(self, positions=None, as_of=None):
+        """Candidates, median and percentile days per stage transition plus TTF / TTH.
+
+        Stage rows measure the days to reach that stage from the previous
+        recorded one. Each row has ``Candidates`` (rows with a duration),
+        ``P50`` / ``P75`` / ``P90`` and, for TTF / TTH, the SLA breach count
+        as of ``as_of`` (default today).
+        """
+        if positions is None:
+            positions = slice(None)
+        columns = [self.transitions[positions, i] for i in range(len(TRANSITIONS))]
+        columns += [self.ttf[positions], self.tth[positions]]
+        breaches = [None] * len(TRANSITIONS) + [int(flags.sum()) for flags in self.breaches(positions, as_of)]
+        rows = []
+        for name, values, breach in zip(TRANSITIONS + ['Time to Fill', 'Time to Hire'], columns, breaches):
+            values = values[~np.isnan(values)]
+            stats = np.percentile(values, PERCENTILES) if len(values) else [np.nan] * len(PERCENTILES)
+            rows.append([name, len(values), *stats, breach])
+        summary = pd.DataFrame(rows, columns=['Measure', 'Candidates'] + [f'P{p}' for p in PERCENTILES] + ['SLA Breaches'])
+        summary['SLA Breaches'] = summary['SLA Breaches'].astype('Int64')
+        return summary
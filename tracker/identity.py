@@ -0,0 +1,151 @@
+"""Repeat-candidate detection: who applied before, and how did it end.
+
+The sheet marks candidates "interviewed in past" with a red highlight, which
+a CSV export drops. :class:`IdentityIndex` rebuilds that signal from the data.
+Rows are the same person when they share a normalized mobile number (last 10
+digits), a mail id, or a name together with a date of birth. Each key is
+hashed into groups (``pd.factorize``) and the groups are merged into
+identities by propagating the smallest row id through them until nothing
+changes. Every step is a whole-column array pass, with no pairwise
+comparison, and chains of links settle in a few passes.
+
+A person's applications are numbered in sourcing-date order, so every row
+knows its application number, the total count and the earlier application
+it follows.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from tracker.schema import date_days
+from tracker.search import factorize_normalized, normalize_mails, normalize_mobiles, normalize_names
+
+MOBILE_DIGITS = 10  # compare the subscriber number; drops +91 / 0 prefixes
+MIN_MOBILE_DIGITS = 7  # shorter digit runs are notes, not numbers
+# A key shared by more rows than this is a placeholder ("NA", "0000000000"), not a person
+MAX_KEY_ROWS = 50
+KEY_COLUMNS = {
+    'mobile': 'Mobile Number',
+    'mail': 'Mail Id',
+    'name': 'Candidate Name',
+    'birth': 'Date of Birth',
+}
+
+
+def normalize_mobile_keys(arr):
+    """Trailing :data:`MOBILE_DIGITS` digits of each number; too few digits count as missing."""
+    digits = normalize_mobiles(arr)
+    tail = pc.utf8_slice_codeunits(digits, start=-MOBILE_DIGITS)
+    return pc.if_else(pc.less(pc.utf8_length(digits), MIN_MOBILE_DIGITS), pa.scalar(None, pa.string()), tail)
+
+
+def _column(df, name):
+    return df[name] if name in df.columns else pd.Series([None] * len(df), dtype=object)
+
+
+def _drop_placeholders(codes):
+    """Set codes shared by more than :data:`MAX_KEY_ROWS` rows to missing."""
+    codes = codes.astype(np.int64)
+    valid = codes >= 0
+    if not valid.any():
+        return codes
+    sizes = np.bincount(codes[valid])
+    codes[valid & (sizes[np.where(valid, codes, 0)] > MAX_KEY_ROWS)] = -1
+    return codes
+
+
+def identity_keys(df):
+    """Group codes per row for every identity key (``-1``: no usable key)."""
+    mobile, _ = factorize_normalized(_column(df, KEY_COLUMNS['mobile']), normalize_mobile_keys)
+    mail, _ = factorize_normalized(_column(df, KEY_COLUMNS['mail']), normalize_mails)
+    name, _ = factorize_normalized(_column(df, KEY_COLUMNS['name']), normalize_names)
+    birth = date_days(_column(df, KEY_COLUMNS['birth']))
+    dated = (name >= 0) & ~np.isnat(birth)
+    name_birth = np.full(len(df), -1, dtype=np.int64)
+    if dated.any():
+        pairs = (name[dated].astype(np.int64) << 32) | (birth[dated].astype(np.int64) & 0xFFFFFFFF)
+        name_birth[dated] = pd.factorize(pairs)[0]
+    return [_drop_placeholders(codes) for codes in (mobile, mail, name_birth)]
+
+
+def connect(keys, size):
+    """Identity label per row (the smallest row id reachable through shared keys)."""
+    labels = np.arange(size, dtype=np.int64)
+    keys = [(np.flatnonzero(codes >= 0), codes[codes >= 0]) for codes in keys]
+    while True:
+        previous = labels.copy()
+        for rows, codes in keys:
+            group_min = np.full(codes.max() + 1 if len(codes) else 0, size, dtype=np.int64)
+            np.minimum.at(group_min, codes, labels[rows])
+            labels[rows] = np.minimum(labels[rows], group_min[codes])
+        # Pointer jumping: follow labels to their own labels so long chains collapse quickly
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            return labels
+
+
+class IdentityIndex:
+    def __init__(self, df, date_column='Sourcing Date'):
+        self.size = len(df)
+        labels = connect(identity_keys(df), self.size)
+        _, self.identity = np.unique(labels, return_inverse=True)
+        self.identity = self.identity.astype(np.int64)
+        self.identities = int(self.identity.max()) + 1 if self.size else 0
+
+        # Applications of one person in sourcing-date order (undated last, then row order)
+        days = date_days(_column(df, date_column))
+        days = np.where(np.isnat(days), np.iinfo(np.int64).max, days.astype(np.int64))
+        order = np.lexsort((np.arange(self.size), days, self.identity))
+        self.sequence = np.empty(self.size, dtype=np.int64)
+        self.sequence[order] = np.arange(self.size)
+
+        ordered = self.identity[order]
+        first = np.ones(self.size, dtype=bool)
+        first[1:] = ordered[1:] != ordered[:-1]
+        starts = np.flatnonzero(first)
+        self.application = np.empty(self.size, dtype=np.int32)
+        self.application[order] = np.arange(self.size) - np.repeat(starts, np.diff(np.append(starts, self.size)))
+        self.application += 1
+        self.applications = np.bincount(self.identity, minlength=self.identities).astype(np.int32)[self.identity]
+        self.previous = np.full(self.size, -1, dtype=np.int64)
+        self.previous[order[1:][~first[1:]]] = order[:-1][~first[1:]]
+
+    @property
+    def repeat(self):
+        """True for rows of a candidate who had applied before (application 2 onwards)."""
+        return self.application > 1
+
+    def repeats(self, positions):
+        """Rows among ``positions`` that are repeat applications."""
+        return int(np.count_nonzero(self.application[positions] > 1))
+
+    def unique(self, positions):
+        """Sorted ``positions`` keeping one row per person: their latest application among them."""
+        positions = np.asarray(positions)
+        if not len(positions):
+            return positions
+        identity, sequence = self.identity[positions], self.sequence[positions]
+        latest = np.full(self.identities, -1, dtype=np.int64)
+        np.maximum.at(latest, identity, sequence)
+        return positions[latest[identity] == sequence]
+
+    def frame(self, positions, df):
+        """``Applications`` ("2 of 3") and ``Previous Application`` (outcome, HM, date) for some rows."""
+        positions = np.asarray(positions)
+        application, applications = self.application[positions], self.applications[positions]
+        previous = self.previous[positions]
+        labels = [f"{a} of {n}" if n > 1 else '' for a, n in zip(application.tolist(), applications.tolist())]
+        earlier = df.take(previous[previous >= 0])
+        details = iter(
+            f"{category} · {hm} · {date:%d-%b-%Y}" if pd.notna(date) else f"{category} · {hm}"
+            for category, hm, date in zip(earlier['Dashboard_Category'], earlier['HM Details'], earlier['Sourcing Date'])
+        )
+        return pd.DataFrame({
+            'Applications': labels,
+            'Previous Application': [next(details) if p >= 0 else '' for p in previous.tolist()],
+        })
@@ -0,0 +1,118 @@
+"""Inverted indexes for the sidebar filters.
+
+Built once per data load. Every filter dimension (a categorical column) keeps
+a posting list of row positions per value, and the sourcing date keeps a
+sorted index. A filter combination is resolved by taking the union of posting
+lists in the most selective dimension, then narrowing those candidate
+positions through code lookups in the other dimensions and the date range.
+The cost scales with the selected rows, not with the whole tracker, and the
+result is a sorted position array for one final ``take``.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from tracker.schema import date_days
+
+FILTER_COLUMNS = ['HM Details', 'Skill', 'Location of posting', 'Recruiter Name', 'Business Unit']
+DATE_COLUMN = 'Sourcing Date'
+
+
+def _day_numbers(dates):
+    """Whole days since the epoch; NaT becomes int64 min so it never falls in a range."""
+    return date_days(dates).astype(np.int64)
+
+
+class _Postings:
+    """Row positions grouped by category code (a CSR-style layout)."""
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype('category')
+        self.categories = series.cat.categories
+        self.codes = series.cat.codes.to_numpy()
+        self.order = np.argsort(self.codes, kind='stable')
+        self.counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.categories))
+        missing = len(self.codes) - int(self.counts.sum())
+        # Rows without a value sort first (code -1); each code's rows follow in row order
+        self.offsets = missing + np.concatenate([[0], np.cumsum(self.counts)])
+
+    def codes_for(self, values):
+        codes = self.categories.get_indexer(list(values))
+        return codes[codes >= 0]
+
+    def count(self, codes):
+        return int(self.counts[codes].sum())
+
+    def positions(self, codes):
+        parts = [self.order[self.offsets[c]:self.offsets[c + 1]] for c in codes]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+
+    def contains(self, positions, codes):
+        lookup = np.zeros(len(self.categories) + 1, dtype=bool)  # last slot: code -1
+        lookup[codes] = True
+        return lookup[self.codes[positions]]
+
+
+class FilterIndex:
+    def __init__(self, df, columns=FILTER_COLUMNS, date_column=DATE_COLUMN):
+        self.size = len(df)
+        self.postings = {col: _Postings(df[col]) for col in columns if col in df.columns}
+        self.days = _day_numbers(df[date_column])
+        self.date_order = np.argsort(self.days, kind='stable')
+        self.sorted_days = self.days[self.date_order]
+
+    def options(self, column):
+        """Sorted values of ``column`` that occur in at least one row."""
+        postings = self.postings[column]
+        return list(postings.categories[postings.counts > 0])
+
+    def value_counts(self, column):
+        postings = self.postings[column]
+        return pd.Series(postings.counts, index=postings.categories, name='count')
+
+    def resolve(self, selections, date_range=None, steps=None):
+        """Return sorted row positions matching every non-empty selection and the date range.
+
+        ``selections`` maps filter columns to the chosen values (OR within a
+        column, AND across columns); ``date_range`` is an inclusive
+        ``(start, end)`` pair of dates, or ``None`` for no date filter. When
+        ``steps`` is a list, ``(filter, seconds, rows in, rows out)`` is
+        appended to it for every filter applied.
+        """
+        # (candidate row count, label, fetch positions, narrow positions) per active filter
+        filters = []
+        for col, values in selections.items():
+            if values:
+                postings = self.postings[col]
+                codes = postings.codes_for(values)
+                filters.append((
+                    postings.count(codes), col,
+                    lambda p=postings, c=codes: p.positions(c),
+                    lambda pos, p=postings, c=codes: pos[p.contains(pos, c)],
+                ))
+        if date_range is not None:
+            lo, hi = (np.datetime64(d, 'D').astype(np.int64) for d in date_range)
+            start = np.searchsorted(self.sorted_days, lo, 'left')
+            stop = np.searchsorted(self.sorted_days, hi, 'right')
+            filters.append((
+                max(stop - start, 0), DATE_COLUMN,
+                lambda: np.sort(self.date_order[start:stop]),
+                lambda pos: pos[(self.days[pos] >= lo) & (self.days[pos] <= hi)],
+            ))
+        if not filters:
+            return np.arange(self.size)
+
+        # Fetch the smallest candidate set, then narrow it through the others
+        filters.sort(key=lambda f: f[0])
+        began = time.perf_counter()
+        positions = filters[0][2]()
+        if steps is not None:
+            steps.append((filters[0][1], time.perf_counter() - began, self.size, len(positions)))
+        for _, label, _, narrow in filters[1:]:
+            rows_in, began = len(positions), time.perf_counter()
+            positions = narrow(positions)
+            if steps is not None:
+                steps.append((label, time.perf_counter() - began, rows_in, len(positions)))
+        return positions
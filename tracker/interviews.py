@@ -0,0 +1,145 @@
+"""Interview rounds as a long table of events.
+
+The sheet keeps each interview round in its own block of columns
+(``Date R1 Interview``, ``R1 Panelist``, ``Status of R1``,
+``R1 Feedback Date`` and again for R2 and R3). :class:`InterviewEvents`
+stacks those blocks into one row per candidate and round that has any
+interview data, with categorical round, panelist, HM and outcome columns and
+the feedback turnaround in days. It is built once per data version with
+array operations only. Panelist load, feedback turnaround and pass rates are
+then ``groupby``\\s over the events of the filtered candidates.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from tracker.categorize import REJECT_ROUNDS
+from tracker.cube import period_starts
+from tracker.durations import PERCENTILES
+from tracker.schema import date_days
+
+ROUNDS = REJECT_ROUNDS
+# Column per event field, for round ``r``
+ROUND_FIELDS = {
+    'Interview Date': 'Date {r} Interview',
+    'Panelist': '{r} Panelist',
+    'Outcome': 'Status of {r}',
+    'Feedback Date': '{r} Feedback Date',
+}
+OUTCOMES = ['Cleared', 'Not Cleared', 'Pending']  # anything but a decision counts as pending
+MAX_TURNAROUND_DAYS = 365  # longer gaps are mistyped years, not slow feedback
+HM_COLUMN = 'HM Details'
+
+
+def _dates(df, col, rows):
+    if col not in df.columns:
+        return np.full(len(rows), np.datetime64('NaT'), dtype='datetime64[D]')
+    return date_days(df[col].take(rows))
+
+
+def _categories(df, col, rows):
+    if col not in df.columns:
+        return pd.Categorical([None] * len(rows), categories=[])
+    return pd.Categorical(df[col].take(rows))
+
+
+def _outcome_codes(status):
+    """Index into :data:`OUTCOMES` per row, resolved once per distinct status."""
+    decided = {outcome.casefold(): i for i, outcome in enumerate(OUTCOMES[:-1])}
+    lookup = np.array([decided.get(str(s).strip().casefold(), 2) for s in status.categories] + [2], dtype=np.int8)
+    return lookup[status.codes]
+
+
+class InterviewEvents:
+    def __init__(self, df):
+        self.size = len(df)
+        candidates, rounds, panelists, outcomes, interviewed, feedback = [], [], [], [], [], []
+        for i, r in enumerate(ROUNDS):
+            columns = {field: col.format(r=r) for field, col in ROUND_FIELDS.items()}
+            present = [col for col in columns.values() if col in df.columns]
+            if not present:
+                continue
+            held = np.logical_or.reduce([df[col].notna().to_numpy() for col in present])
+            rows = np.flatnonzero(held)
+            candidates.append(rows)
+            rounds.append(np.full(len(rows), i, dtype=np.int8))
+            panelists.append(_categories(df, columns['Panelist'], rows))
+            outcomes.append(_outcome_codes(_categories(df, columns['Outcome'], rows)))
+            interviewed.append(_dates(df, columns['Interview Date'], rows))
+            feedback.append(_dates(df, columns['Feedback Date'], rows))
+
+        if candidates:
+            candidate = np.concatenate(candidates)
+            panelist = union_categoricals(panelists, ignore_order=True)
+            interviewed, feedback = np.concatenate(interviewed), np.concatenate(feedback)
+        else:
+            candidate = np.empty(0, dtype=np.int64)
+            panelist = pd.Categorical([], categories=[])
+            interviewed = feedback = np.empty(0, dtype='datetime64[D]')
+        turnaround = ((feedback - interviewed) / np.timedelta64(1, 'D')).astype(np.float32)
+        # Feedback before the interview or a year later is a data-entry error
+        turnaround[(turnaround < 0) | (turnaround > MAX_TURNAROUND_DAYS)] = np.nan
+
+        hm = df[HM_COLUMN].take(candidate).array if HM_COLUMN in df.columns else pd.Categorical([None] * len(candidate))
+        self.events = pd.DataFrame({
+            'Candidate': candidate.astype(np.int32),  # row position in the dataset
+            'Round': pd.Categorical.from_codes(np.concatenate(rounds) if rounds else [], categories=ROUNDS),
+            'HM': hm,
+            'Panelist': panelist,
+            'Interview Date': interviewed,
+            'Feedback Date': feedback,
+            'Outcome': pd.Categorical.from_codes(np.concatenate(outcomes) if outcomes else [], categories=OUTCOMES),
+            'Turnaround': turnaround,  # days from interview to feedback
+        })
+
+    def __len__(self):
+        return len(self.events)
+
+    @property
+    def nbytes(self):
+        return int(self.events.memory_usage(deep=True).sum())
+
+    def select(self, positions=None):
+        """Events of the candidates at row ``positions`` (all events for ``None``)."""
+        if positions is None:
+            return self.events
+        wanted = np.zeros(self.size, dtype=bool)
+        wanted[positions] = True
+        return self.events[wanted[self.events['Candidate'].to_numpy()]]
+
+    def panelist_load(self, positions=None, freq='W'):
+        """Interviews per panelist per week (``'W'``) or month (``'M'``), by interview date.
+
+        Long format: ``Period``, ``Panelist``, ``Interviews``.
+        """
+        events = self.select(positions)
+        events = events[events['Interview Date'].notna() & events['Panelist'].notna()]
+        days = events['Interview Date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+        load = events.groupby([period_starts(days, freq), events['Panelist']], observed=True).size()
+        load.index.names = ['Period', 'Panelist']
+        return load.rename('Interviews').reset_index()
+
+    def feedback_turnaround(self, positions=None, by='Round'):
+        """Feedbacks shared and turnaround percentiles (days) per ``by`` (``'Round'`` or ``'Panelist'``)."""
+        events = self.select(positions).dropna(subset=['Turnaround'])
+        grouped = events.groupby(by, observed=True)['Turnaround']
+        quantiles = [p / 100 for p in PERCENTILES]
+        summary = grouped.quantile(quantiles).unstack().reindex(columns=quantiles)  # no columns when empty
+        summary.columns = [f'P{p}' for p in PERCENTILES]
+        summary.insert(0, 'Feedbacks', grouped.size())
+        if by != 'Round':
+            summary = summary.sort_values('Feedbacks', ascending=False, kind='stable')
+        return summary.round(1)
+
+    def pass_rates(self, positions=None):
+        """Cleared, not cleared and pending interviews and the pass rate per HM and round.
+
+        The pass rate is cleared over decided (cleared + not cleared) interviews.
+        """
+        events = self.select(positions)
+        counts = events.groupby(['HM', 'Round', 'Outcome'], observed=True).size()
+        counts = counts.unstack('Outcome', fill_value=0).reindex(columns=OUTCOMES, fill_value=0)
+        counts.columns = list(OUTCOMES)
+        decided = counts['Cleared'] + counts['Not Cleared']
+        counts['Pass %'] = (counts['Cleared'] / decided.where(decided > 0) * 100).round(1)
+        return counts.reset_index()
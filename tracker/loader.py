@@ -0,0 +1,88 @@
+"""Reading and cleaning the TA tracker CSV.
+
+The tracker is append-only in practice ("Always insert new row from previous
+filled row"), so :func:`load_tracker` ingests incrementally: when the CSV has
+only grown and the previously ingested bytes are unchanged, just the new tail
+is parsed, cleaned and appended to the cached frame. Any edit to earlier rows
+falls back to a full rebuild.
+"""
+import io
+from pathlib import Path
+
+from tracker import cache, schema
+from tracker.categorize import categorize_status
+from tracker.rules import DEFAULT_RULES_PATH, load_rules, rules_fingerprint
+
+# Bump whenever read_tracker's output changes so stale cache entries are ignored
+PIPELINE_VERSION = 3
+
+
+def clean_tracker(df, rules):
+    """Add the dashboard category columns to schema-typed tracker rows."""
+    # Vectorized categorization over whole columns
+    df['Dashboard_Category'], df['Reject_Round'] = categorize_status(df, rules)
+    return df
+
+
+def read_tracker(path, rules_path=DEFAULT_RULES_PATH):
+    """Parse and clean one tracker CSV, bypassing the cache."""
+    return clean_tracker(schema.read_tracker_csv(path), load_rules(rules_path))
+
+
+def cache_salt(rules_path=DEFAULT_RULES_PATH):
+    return f"v{PIPELINE_VERSION}-{rules_fingerprint(rules_path)}"
+
+
+def _versioned(df, salt, digest):
+    # Identifies this exact content + pipeline, for keying derived structures
+    df.attrs['data_version'] = f"{salt}-{digest[:16]}"
+    return df
+
+
+def _append_tail(path, meta, stat, rules, salt, cache_dir):
+    """Ingest only the bytes appended since ``meta`` was written; ``None`` means rebuild."""
+    prefix_hash, digest, tail, last = cache.read_appended(path, meta['size'], stat.st_size)
+    if prefix_hash != meta['hash']:
+        return None  # earlier rows were edited
+    if last not in (b'\n', b'\r') and tail[:1] not in (b'\n', b'\r'):
+        return None  # the last ingested row was extended, not followed by a new one
+    try:
+        # Parse the tail against the header recorded at the last full parse
+        new_rows = schema.read_rows(io.BytesIO(tail), meta['header'])
+        cached = cache.read_frame(Path(cache_dir or cache.cache_dir()) / meta['data'])
+        df = schema.concat_frames([cached, clean_tracker(new_rows, rules)])
+        cache.store(path, df, salt, cache_dir, stat=stat, digest=digest, header=meta['header'])
+    except (ValueError, TypeError, OSError):
+        # Malformed tail or a vanished cache entry: rebuild from scratch
+        return None
+    return _versioned(df, salt, digest)
+
+
+def _store(path, df, salt, cache_dir, **meta):
+    try:
+        cache.store(path, df, salt, cache_dir, **meta)
+    except OSError:
+        pass  # e.g. a read-only cache directory: the frame is still good, just not cached
+
+
+def load_tracker(path, rules_path=DEFAULT_RULES_PATH, cache_dir=None):
+    """Return the cleaned tracker, reusing the on-disk cache and ingesting appended rows only."""
+    path = Path(path)
+    rules = load_rules(rules_path)
+    salt = cache_salt(rules_path)
+    df, meta = cache.lookup(path, salt, cache_dir)
+    if df is not None:
+        return _versioned(df, salt, meta['hash'])
+
+    stat = path.stat()
+    if meta is not None and stat.st_size > meta['size']:
+        df = _append_tail(path, meta, stat, rules, salt, cache_dir)
+        if df is not None:
+            return df
+
+    # Full rebuild; stat and hash first so a file changing mid-parse is rebuilt next time
+    digest = cache.content_hash(path)
+    header = schema.read_header(path)
+    df = clean_tracker(schema.read_rows(path, header, skiprows=schema.METADATA_ROWS + 1), rules)
+    _store(path, df, salt, cache_dir, stat=stat, digest=digest, header=header)
+    return _versioned(df, salt, digest)
@@ -0,0 +1,81 @@
+"""KPI, funnel and rate aggregation shared by every dashboard view.
+
+All numbers come from one ``bincount`` over the ``Dashboard_Category`` codes,
+so the KPI cards, the pipeline funnel and Quick Stats read a single
+:class:`KpiSummary` instead of re-scanning the filtered frame per number.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from tracker.rules import CATEGORIES
+
+FUNNEL_STAGES = ['Total Candidates', 'After Screening', 'After Interviews', 'Shortlisted', 'Joined']
+
+
+@dataclass(frozen=True)
+class KpiSummary:
+    total: int
+    joined: int
+    selected: int
+    rejected: int
+    screening_rejected: int
+    pending: int
+    other: int
+
+    @property
+    def funnel(self):
+        """Funnel stage counts, widest first, in :data:`FUNNEL_STAGES` order."""
+        after_screening = self.total - self.screening_rejected
+        return [self.total, after_screening, after_screening - self.rejected, self.selected, self.joined]
+
+    @property
+    def conversion_rate(self):
+        return self.joined / self.total * 100 if self.total > 0 else 0
+
+    @property
+    def shortlist_rate(self):
+        return self.selected / self.total * 100 if self.total > 0 else 0
+
+
+def category_counts(categories):
+    """Rows per dashboard category (in :data:`CATEGORIES` order) from one pass over the codes."""
+    if isinstance(categories.dtype, pd.CategoricalDtype) and list(categories.cat.categories) == CATEGORIES:
+        codes = categories.cat.codes.to_numpy()
+    else:
+        codes = pd.Categorical(categories, categories=CATEGORIES).codes
+    return np.bincount(codes[codes >= 0], minlength=len(CATEGORIES))
+
+
+def compute_kpis(categories):
+    """Summarize a ``Dashboard_Category`` column into a :class:`KpiSummary`."""
+    return kpis_from_counts(category_counts(categories), total=len(categories))
+
+
+def kpis_from_counts(counts, total=None):
+    """:class:`KpiSummary` from rows per category in :data:`CATEGORIES` order (e.g. pre-aggregated counts)."""
+    counts = dict(zip(CATEGORIES, np.asarray(counts).tolist()))
+    return KpiSummary(
+        total=sum(counts.values()) if total is None else total,
+        joined=counts['Joined'],
+        selected=counts['Selected'],
+        rejected=counts['Rejected'],
+        screening_rejected=counts['Screening Reject'],
+        pending=counts['Pending/Active'],
+        other=counts['Other'],
+    )
+
+
+QUALITY_OF_HIRE = {'Selected': 'High', 'Pending/Active': 'In Progress'}
+QUALITY_LEVELS = ['High', 'In Progress', 'Not Selected']
+
+
+def quality_of_hire(categories):
+    """Quality of Hire label per row, mapped once per category level (anything else is 'Not Selected')."""
+    lookup = np.array([QUALITY_LEVELS.index(QUALITY_OF_HIRE.get(c, 'Not Selected')) for c in CATEGORIES] + [2])
+    codes = pd.Categorical(categories, categories=CATEGORIES).codes
+    return pd.Series(
+        pd.Categorical.from_codes(lookup[codes], categories=QUALITY_LEVELS),
+        index=categories.index, name='Quality of Hire',
+    )
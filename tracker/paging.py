@@ -0,0 +1,58 @@
+"""Server-side sorting and pagination over row positions.
+
+Sort keys are precomputed once per data load as integer ranks for every
+sortable column, so ordering a filtered view is an integer ``argsort`` over
+its positions and a page is a slice of that order. Only the rows of the
+current page are ever materialized and shipped to the browser.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def rank_column(series):
+    """Dense ascending rank of every value plus the rank given to missing values (after everything else)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        # Category order is not necessarily alphabetical; rank by the labels
+        label_rank = np.empty(len(categories), dtype=np.int32)
+        label_rank[np.argsort(np.asarray(categories, dtype=object), kind='stable')] = np.arange(len(categories))
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, label_rank[codes], len(categories)).astype(np.int32), len(categories)
+    codes, uniques = pd.factorize(series, sort=True)
+    return np.where(codes >= 0, codes, len(uniques)).astype(np.int32), len(uniques)
+
+
+class SortKeys:
+    def __init__(self, columns):
+        """``columns`` maps display column names to Series over the full dataset."""
+        self.ranks = {}
+        self.missing = {}
+        for name, series in columns.items():
+            self.ranks[name], self.missing[name] = rank_column(series)
+
+    @property
+    def columns(self):
+        return list(self.ranks)
+
+    def order(self, positions, column=None, ascending=True):
+        """Return ``positions`` reordered by ``column``; ties keep row order, blanks go last."""
+        if column is None:
+            return positions
+        keys = self.ranks[column][positions]
+        if not ascending:
+            missing = self.missing[column]
+            keys = np.where(keys == missing, missing, missing - 1 - keys)
+        return positions[np.argsort(keys, kind='stable')]
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def page_bounds(total, page, page_size):
+    """``(start, stop)`` of 1-based ``page``, clamped to the available pages."""
+    page = min(max(1, page), page_count(total, page_size))
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total)
@@ -0,0 +1,146 @@
+"""Batch KPI, funnel and per-HM reports for many filter presets in one run.
+
+The tracker is loaded and indexed once; every preset is then a query against
+the same :class:`~tracker.analysis.TrackerAnalysis`, so a nightly run over
+dozens of slices costs about one load. Nothing here imports Streamlit or
+Plotly::
+
+    python -m tracker.report --presets .streamlit/report_presets.toml --output reports/nightly
+
+Presets live in a TOML file as ``[[preset]]`` tables. Every key but ``name``
+is optional; values are OR-ed within a filter and filters are AND-ed, as in
+the dashboard sidebar::
+
+    [[preset]]
+    name = "Mani Nagar, Panchkula"
+    hm = ["Mani Nagar"]
+    location = ["Panchkula"]
+    from = 2025-01-01          # sourcing date range, inclusive
+    to = 2025-12-31
+    search = "rahul"           # candidate name, mail or mobile
+    dedupe = true              # count repeat candidates once
+"""
+import json
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from tracker.analysis import TrackerAnalysis
+from tracker.metrics import FUNNEL_STAGES
+from tracker.rules import DEFAULT_RULES_PATH, parse_toml
+from tracker.sources import load_trackers
+from tracker.views import FilterState
+
+DEFAULT_PRESETS_PATH = DEFAULT_RULES_PATH.parent / 'report_presets.toml'
+DEFAULT_SOURCE = os.environ.get('TA_TRACKER_PATH', 'TA Tracker - HM Sheet.csv')
+
+FILTER_KEYS = ('hm', 'skill', 'location', 'recruiter', 'business_unit')
+KPI_COLUMNS = {
+    'Total': 'total',
+    'Joined': 'joined',
+    'Selected': 'selected',
+    'Rejected': 'rejected',
+    'Screening Reject': 'screening_rejected',
+    'Pending': 'pending',
+    'Other': 'other',
+}
+
+
+def _as_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+def load_presets(path=DEFAULT_PRESETS_PATH):
+    """``{name: FilterState}`` from a presets TOML file, in file order."""
+    path = Path(path)
+    presets = {}
+    for i, table in enumerate(parse_toml(path.read_text(encoding='utf-8')).get('preset', [])):
+        name = str(table.get('name') or f'Preset {i + 1}')
+        unknown = set(table) - {'name', 'from', 'to', 'search', 'fuzzy', 'dedupe', *FILTER_KEYS}
+        if unknown:
+            raise ValueError(f"{path}: preset {name!r} has unknown keys {sorted(unknown)}")
+        if name in presets:
+            raise ValueError(f"{path}: duplicate preset name {name!r}")
+        if ('from' in table) != ('to' in table):
+            raise ValueError(f"{path}: preset {name!r} needs both 'from' and 'to' for a date range")
+        filters = {key: [table[key]] if isinstance(table[key], str) else table[key] for key in FILTER_KEYS if key in table}
+        presets[name] = FilterState.from_widgets(
+            **filters,
+            date_range=(_as_date(table['from']), _as_date(table['to'])) if 'from' in table else None,
+            name=table.get('search', ''),
+            fuzzy=table.get('fuzzy', False),
+            dedupe=table.get('dedupe', False),
+        )
+    return presets
+
+
+def build_report(analysis, presets):
+    """KPI, funnel and per-HM frames for every preset, each with a leading ``Preset`` column."""
+    kpi_rows, funnel_rows, hm_frames = [], [], []
+    for name, state in presets.items():
+        positions = analysis.positions(state)
+        kpis = analysis.kpis(state, positions)
+        row = {'Preset': name}
+        row.update({column: getattr(kpis, field) for column, field in KPI_COLUMNS.items()})
+        row['Conversion %'] = round(kpis.conversion_rate, 1)
+        row['Shortlist %'] = round(kpis.shortlist_rate, 1)
+        row['Repeat Candidates'] = analysis.identities.repeats(positions)
+        kpi_rows.append(row)
+        funnel_rows.extend({'Preset': name, 'Stage': stage, 'Candidates': count}
+                           for stage, count in zip(FUNNEL_STAGES, kpis.funnel))
+        hm_frames.append(analysis.hm_summary(analysis.counted(state, positions)).reset_index().assign(Preset=name))
+
+    hm_summary = pd.concat(hm_frames, ignore_index=True)
+    return {
+        'kpis': pd.DataFrame(kpi_rows),
+        'funnel': pd.DataFrame(funnel_rows),
+        'hm_summary': hm_summary[['Preset'] + [c for c in hm_summary.columns if c != 'Preset']],
+    }
+
+
+def write_report(report, output, fmt='csv'):
+    """Write one CSV per table (or a single ``report.json``) into ``output``; return the written paths."""
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    if fmt == 'json':
+        path = output / 'report.json'
+        payload = {table: json.loads(frame.to_json(orient='records')) for table, frame in report.items()}
+        path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+        return [path]
+    paths = []
+    for table, frame in report.items():
+        path = output / f'{table}.csv'
+        frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    """``python -m tracker.report``: write KPI, funnel and per-HM tables for every preset."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batch KPI, funnel and per-HM reports for filter presets.")
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help="tracker CSV, directory or glob")
+    parser.add_argument('--presets', type=Path, default=DEFAULT_PRESETS_PATH)
+    parser.add_argument('--output', type=Path, default=Path('reports'))
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    parser.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH)
+    args = parser.parse_args(argv)
+
+    presets = load_presets(args.presets)
+    analysis = TrackerAnalysis(load_trackers(args.source, args.rules))
+    report = build_report(analysis, presets)
+    paths = write_report(report, args.output, args.format)
+
+    print(f"{len(analysis.df):,} rows, {len(presets)} presets (data version {analysis.version})")
+    print(report['kpis'].to_string(index=False))
+    for path in paths:
+        print(f"wrote {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Declarative status-mapping rules loaded from ``.streamlit/status_rules.toml``.
+
+The rules file maps raw ``Status`` spellings to dashboard buckets. It is
+compiled once into a dictionary and then applied to the *distinct* status
+values of a tracker, never row by row.
+"""
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import tomllib
+
+    def parse_toml(text):
+        return tomllib.loads(text)
+except ModuleNotFoundError:  # Python < 3.11; toml ships with streamlit
+    import toml
+
+    def parse_toml(text):
+        return toml.loads(text)
+
+DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent / '.streamlit' / 'status_rules.toml'
+
+CATEGORIES = ['Joined', 'Selected', 'Rejected', 'Screening Reject', 'Pending/Active', 'Other']
+
+
+def normalize_status(value):
+    """Normalize a raw status the same way the rules file is written: trimmed and lowercased."""
+    return str(value).strip().lower()
+
+
+@dataclass(frozen=True)
+class StatusRules:
+    exact: dict
+    contains: tuple
+    blank: str = 'Pending/Active'
+
+    def bucket_for(self, status):
+        """Return the bucket for one raw status, or ``None`` if no rule matches."""
+        status_lc = normalize_status(status)
+        if status_lc in ('', 'nan'):
+            return self.blank
+        if status_lc in self.exact:
+            return self.exact[status_lc]
+        for text, bucket in self.contains:
+            if text in status_lc:
+                return bucket
+        return None
+
+
+def _check_bucket(bucket, path):
+    if bucket not in CATEGORIES or bucket == 'Other':
+        raise ValueError(f"{path}: unknown bucket {bucket!r}, expected one of {CATEGORIES[:-1]}")
+    return bucket
+
+
+def compile_rules(config, path='<rules>'):
+    """Compile a parsed rules mapping into a :class:`StatusRules` lookup."""
+    exact = {}
+    for bucket, statuses in config.get('buckets', {}).items():
+        _check_bucket(bucket, path)
+        for status in statuses:
+            status_lc = normalize_status(status)
+            if exact.get(status_lc, bucket) != bucket:
+                raise ValueError(f"{path}: status {status!r} is listed under both {exact[status_lc]!r} and {bucket!r}")
+            exact[status_lc] = bucket
+    contains = tuple(
+        (normalize_status(rule['text']), _check_bucket(rule['bucket'], path)) for rule in config.get('contains', [])
+    )
+    blank = _check_bucket(config.get('blank', 'Pending/Active'), path)
+    return StatusRules(exact=exact, contains=contains, blank=blank)
+
+
+_compiled = {}
+
+
+def load_rules(path=DEFAULT_RULES_PATH):
+    """Load and compile the rules file, reusing the compiled rules until the file changes."""
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _compiled.get(path)
+    if cached is None or cached[0] != mtime:
+        rules = compile_rules(parse_toml(path.read_text(encoding='utf-8')), path)
+        cached = _compiled[path] = (mtime, rules)
+    return cached[1]
+
+
+def unknown_statuses(df):
+    """Count the raw statuses that no rule matched (rows that fell into ``Other``)."""
+    other = df['Dashboard_Category'] == 'Other'
+    counts = df.loc[other, 'Status'].value_counts()
+    # Categorical value_counts also lists levels with no rows
+    return counts[counts > 0].rename_axis('Status').rename('Rows')
+
+
+def rules_fingerprint(path=DEFAULT_RULES_PATH):
+    """Short hash of the rules file, used to invalidate caches when the rules change."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=8).hexdigest()
@@ -0,0 +1,269 @@
+"""Explicit column schema for the 56-column TA tracker sheet.
+
+Only the columns the dashboard uses are read (``usecols``), each with a fixed
+low-memory dtype instead of ``read_csv`` inference:
+
+* low-cardinality text (HM, Skill, Location, Recruiter, Status, Source, ...)
+  becomes a stripped categorical,
+* free text that is searched (names, mail ids, mobile numbers) stays ``string``,
+* dates in the sheet's ``1-Dec-2025`` style (and a few known variants) become
+  ``datetime64``,
+* experience, CTC, TTF and TTH become nullable numbers.
+
+The sheet repeats ``Panelist name`` and ``Date of feedback shared`` once per
+interview round; those are renamed to stable ``R1 Panelist`` /
+``R1 Feedback Date`` style names. Cleaning works on distinct values (category
+levels) rather than on every row.
+"""
+import csv
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# The sheet starts with one metadata row ("Always insert new row ...") before the header
+METADATA_ROWS = 1
+
+DATE_FORMATS = ['%d-%b-%Y', '%d-%b-%y', '%d-%m-%Y', '%d-%m-%y']
+
+# Rows per parser chunk; bounds the tokenizer's working memory on large trackers
+PARSE_CHUNK_ROWS = 250_000
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str  # stable name in the cleaned frame
+    kind: str  # 'category', 'string', 'date', 'experience', 'amount' or a nullable numeric dtype
+    header: str = None  # header text in the sheet, when it differs from ``name``
+    occurrence: int = 0  # which repetition of ``header`` (duplicated per interview round)
+
+    @property
+    def source(self):
+        return self.header or self.name
+
+
+COLUMNS = [
+    Column('Req Date', 'date'),
+    Column('HM Details', 'category'),
+    Column('Skill', 'category'),
+    Column('Designation', 'category'),
+    Column('Location of posting', 'category'),
+    Column('No. of Openings', 'Int16'),
+    Column('Status', 'category'),
+    Column('Candidate Name', 'string'),
+    Column('Recruiter Name', 'category'),
+    Column('Source', 'category'),
+    Column('Sub Source', 'category'),
+    Column('Sourcing Date', 'date'),
+    Column('Mobile Number', 'string'),
+    Column('Mail Id', 'string'),
+    Column('Gender', 'category'),
+    Column('Experience', 'experience'),
+    Column('Current CTC', 'amount'),
+    Column('Expected CTC', 'amount'),
+    Column('Date of Birth', 'date'),
+    Column('Screening Date', 'date'),
+    Column('Screening check status', 'category'),
+    Column('Date R1 Interview', 'date'),
+    Column('R1 Panelist', 'category', 'Panelist name', 0),
+    Column('Status of R1', 'category'),
+    Column('R1 Feedback Date', 'date', 'Date of feedback shared', 0),
+    Column('Date R2 Interview', 'date'),
+    Column('R2 Panelist', 'category', 'Panelist name', 1),
+    Column('Status of R2', 'category'),
+    Column('R2 Feedback Date', 'date', 'Date of feedback shared', 1),
+    Column('Date R3 Interview', 'date'),
+    Column('R3 Panelist', 'category', 'Panelist name', 2),
+    Column('Status of R3', 'category'),
+    Column('R3 Feedback Date', 'date', 'Date of feedback shared', 2),
+    Column('Final Status', 'category'),
+    Column('Rejection Reason', 'category'),
+    Column('Rejection Mailer Date', 'date'),
+    Column('Approval date', 'date'),
+    Column('Offer date', 'date'),
+    Column('Offer Acceptance Date', 'date'),
+    Column('Joining Date', 'date'),
+    Column('TTF (60 days)', 'Int32'),
+    Column('TTH (30 days)', 'Int32'),
+]
+
+CATEGORY_COLUMNS = [c.name for c in COLUMNS if c.kind == 'category']
+DATE_COLUMNS = [c.name for c in COLUMNS if c.kind == 'date']
+
+
+def read_header(path):
+    """Return the stripped header cells of a tracker file (the row after the metadata row)."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        for _ in range(METADATA_ROWS):
+            next(reader, None)
+        return [cell.strip() for cell in next(reader, [])]
+
+
+def column_names(header):
+    """Map raw header cells to unique names, applying the schema's stable renames."""
+    renames = {(c.source, c.occurrence): c.name for c in COLUMNS}
+    seen = {}
+    names = []
+    for cell in header:
+        occurrence = seen.get(cell, 0)
+        seen[cell] = occurrence + 1
+        default = cell if occurrence == 0 else f"{cell}.{occurrence}"
+        names.append(renames.get((cell, occurrence), default))
+    return names
+
+
+def read_rows(source, header, skiprows=0):
+    """Read tracker data rows from ``source`` (path or buffer) using the schema.
+
+    ``header`` is the sheet's raw header row; ``skiprows`` counts the lines in
+    ``source`` before the first data row.
+    """
+    return convert_frame(read_raw(source, header, skiprows))
+
+
+def read_raw(source, header, skiprows=0):
+    """Parse the schema's columns without converting them (text and raw category levels)."""
+    names = column_names(header)
+    wanted = [c.name for c in COLUMNS if c.name in names]
+    # Strings and names are read as text; everything else via category levels so
+    # stripping and type conversion run once per distinct value
+    dtype = {c.name: 'string' if c.kind == 'string' else 'category' for c in COLUMNS if c.name in names}
+    reader = pd.read_csv(
+        source, header=None, names=names, skiprows=skiprows, usecols=wanted, dtype=dtype, index_col=False,
+        chunksize=PARSE_CHUNK_ROWS, low_memory=False,  # chunking here, not inside the parser
+    )
+    with reader:
+        chunks = [chunk[wanted] for chunk in reader]
+    if not chunks:
+        return pd.DataFrame({name: pd.Series(dtype=dtype[name]) for name in wanted})
+    return concat_frames(chunks)
+
+
+def convert_frame(df):
+    """Convert every column of a :func:`read_raw` frame to its schema dtype."""
+    kinds = {c.name: c.kind for c in COLUMNS}
+    for name in df.columns:
+        df[name] = convert(df[name], kinds[name])
+    return df
+
+
+def read_tracker_csv(path):
+    """Read a whole tracker file (metadata row, header row, data rows) using the schema."""
+    return read_rows(path, read_header(path), skiprows=METADATA_ROWS + 1)
+
+
+def convert(series, kind):
+    """Convert one raw column to its schema dtype."""
+    if kind == 'string':
+        return series.str.strip()
+    if kind == 'category':
+        return _map_levels(series, _strip_levels, categorical=True)
+    if kind == 'date':
+        return _map_levels(series, parse_dates)
+    if kind == 'experience':
+        return _map_levels(series, parse_experience)
+    if kind == 'amount':
+        return _map_levels(series, parse_amount)
+    return _map_levels(series, lambda levels: pd.to_numeric(levels, errors='coerce').round().astype(kind))
+
+
+def _map_levels(series, convert_levels, categorical=False):
+    """Apply ``convert_levels`` to the distinct values of a categorical and broadcast by code."""
+    levels = pd.Series(series.cat.categories.astype('string'))
+    codes = series.cat.codes.to_numpy()
+    if categorical:
+        return _recode(convert_levels(levels), codes, series.index, series.name)
+    values = pd.Series(convert_levels(levels)).array
+    return pd.Series(values.take(codes, allow_fill=True), index=series.index, name=series.name)
+
+
+def _recode(levels, codes, index, name):
+    # Stripping can merge levels ('Hari' / 'Hari ') and blank some out
+    categories, inverse = np.unique(levels.fillna('').to_numpy(dtype=object), return_inverse=True)
+    inverse = np.append(inverse, -1)
+    if len(categories) and categories[0] == '':
+        categories = categories[1:]
+        inverse = inverse - 1  # '' sorted first: its code becomes -1, the rest shift down
+        inverse[-1] = -1
+    new_codes = inverse[codes].astype(np.int32)
+    return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories), index=index, name=name)
+
+
+def _strip_levels(levels):
+    return levels.str.strip()
+
+
+def parse_dates(levels):
+    """Parse date strings like ``1-Dec-2025`` (trailing notes are ignored); unparseable values become NaT."""
+    token = levels.str.strip().str.split(n=1).str[0]  # a note may follow on the next line of the cell
+    parsed = pd.to_datetime(token, format=DATE_FORMATS[0], errors='coerce')
+    for fmt in DATE_FORMATS[1:]:
+        missing = parsed.isna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(token[missing], format=fmt, errors='coerce')
+    return parsed
+
+
+def date_days(dates):
+    """Dates as a ``datetime64[D]`` array, converted from their own unit.
+
+    Going through ``datetime64[ns]`` would wrap years outside 1678-2262, so a
+    typo like ``1-Dec-0202`` (kept by :func:`parse_dates`) would land in 1956.
+    """
+    days = np.asarray(dates)
+    if days.dtype.kind != 'M':
+        days = np.asarray(pd.to_datetime(days))
+    return days.astype('datetime64[D]')
+
+
+_LEADING_NUMBER = re.compile(r'^\s*(\d+(?:\.\d+)?)')
+
+
+def _leading_number(levels):
+    return pd.to_numeric(levels.str.extract(_LEADING_NUMBER, expand=False), errors='coerce')
+
+
+def parse_experience(levels):
+    """Years of experience from values like ``4.7``, ``2 Years``, ``6 Months`` or ``Fresher``."""
+    lower = levels.str.lower()
+    years = _leading_number(levels)
+    years = years.where(~lower.str.contains('month', na=False), years / 12)
+    years = years.mask(lower.str.strip() == 'fresher', 0)
+    return years.astype('Float32')
+
+
+def parse_amount(levels):
+    """CTC in LPA from values like ``5``, ``14.5 LPA`` or ``4-5``; ambiguous ``10k`` style values are dropped."""
+    amount = _leading_number(levels)
+    amount = amount.mask(levels.str.contains(r'\d\s*k\b', case=False, na=False))
+    return amount.astype('Float32')
+
+
+def _text_levels(series):
+    # A chunk with no values in a column infers object levels where others have str
+    return series.cat.rename_categories(series.cat.categories.astype('str'))
+
+
+def concat_frames(frames):
+    """Concatenate frames column by column, unioning category levels so categoricals stay categorical.
+
+    The result has every column of any frame (sheets may lack some schema
+    columns); rows of a frame without a column get missing values of the
+    column's dtype.
+    """
+    if len(frames) == 1:
+        return frames[0]
+    columns = {}
+    for col in dict.fromkeys(col for f in frames for col in f.columns):
+        dtype = next(f[col].dtype for f in frames if col in f.columns)
+        parts = [f[col] if col in f.columns else pd.Series(index=range(len(f)), dtype=dtype) for f in frames]
+        if isinstance(dtype, pd.CategoricalDtype) and any(p.dtype != dtype for p in parts[1:]):
+            columns[col] = pd.api.types.union_categoricals(
+                [_text_levels(p) for p in parts], sort_categories=True, ignore_order=True,
+            )
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
@@ -0,0 +1,258 @@
+"""Candidate search index over names, mail ids and mobile numbers.
+
+Built once per data load and usable as a plain Python object outside
+Streamlit::
+
+    index = CandidateSearchIndex(df)
+    positions = index.search('divya')             # substring on names
+    positions = index.search('divia', fuzzy=True)  # typo tolerant
+    positions = index.search('98550 66')          # mobile prefix / suffix
+
+Names are normalized (casefolded, accents stripped, whitespace collapsed) and
+indexed per *distinct* value with a trigram inverted index, so a substring
+query intersects a few posting lists instead of scanning every row. Mail ids
+are matched by prefix and mobile numbers by leading or trailing digits, both
+through sorted arrays and binary search. Fuzzy matching compares query words
+against the vocabulary of name words (trigram candidates, then a difflib
+ratio) and tolerates a typo or two per word.
+"""
+import difflib
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+MIN_NGRAM_QUERY = 3
+FUZZY_CUTOFF = 0.75
+FUZZY_CANDIDATES = 50
+
+_NON_DIGITS = re.compile(r'\D+')
+_PAD = '\x01'  # name padding for short queries; never produced by normalization
+
+
+def normalize_text(value):
+    """Casefold, strip accents and collapse whitespace."""
+    if not isinstance(value, str):
+        return ''
+    if not value.isascii():
+        value = ''.join(ch for ch in unicodedata.normalize('NFKD', value) if not unicodedata.combining(ch))
+    return ' '.join(value.casefold().split())
+
+
+def normalize_digits(value):
+    return _NON_DIGITS.sub('', value) if isinstance(value, str) else ''
+
+
+def _trigram_keys(text):
+    """Trigrams of ``text`` packed into int64 keys (21 bits per code point)."""
+    if len(text) < 3:
+        return np.empty(0, dtype=np.int64)
+    chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    return np.unique((chars[:-2] << 42) | (chars[1:-1] << 21) | chars[2:])
+
+
+class _TrigramIndex:
+    """Posting lists of value ids per trigram, built in one vectorized pass."""
+
+    def __init__(self, values, suffix=''):
+        values = [v + suffix for v in values]
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        text = '\x00'.join(values)
+        chars = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        # Value id and offset inside the value for every character (separators included)
+        owner = np.repeat(np.arange(len(values), dtype=np.int32), lengths + 1)[:len(chars)]
+        starts = np.concatenate([[0], np.cumsum(lengths + 1)[:-1]])
+        offset = np.arange(len(chars)) - starts[owner]
+        if len(chars) >= 3:
+            keep = offset[:-2] <= lengths[owner[:-2]] - 3  # trigram stays inside one value
+            keys = ((chars[:-2] << 42) | (chars[1:-1] << 21) | chars[2:])[keep]
+            ids = owner[:-2][keep]
+        else:
+            keys, ids = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int32)
+        order = np.lexsort((ids, keys))
+        keys, ids = keys[order], ids[order]
+        distinct = np.ones(len(keys), dtype=bool)
+        distinct[1:] = (keys[1:] != keys[:-1]) | (ids[1:] != ids[:-1])
+        keys, self.ids = keys[distinct], ids[distinct]
+        self.keys, starts = np.unique(keys, return_index=True)
+        self.offsets = np.append(starts, len(keys))
+
+    def postings(self, key):
+        i = np.searchsorted(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            return self.ids[:0]
+        return self.ids[self.offsets[i]:self.offsets[i + 1]]
+
+    def prefixed(self, text):
+        """Value ids with a trigram starting with ``text`` (one or two characters)."""
+        chars = [ord(c) for c in text]
+        lo = (chars[0] << 42) | (chars[1] << 21 if len(chars) > 1 else 0)
+        hi = lo + (1 << (21 if len(chars) > 1 else 42))
+        start, stop = np.searchsorted(self.keys, [lo, hi])
+        return self.ids[self.offsets[start]:self.offsets[stop]]
+
+    def candidates(self, text):
+        """Value ids containing every trigram of ``text`` (a superset of substring matches)."""
+        lists = sorted((self.postings(k) for k in _trigram_keys(text)), key=len)
+        if not lists:
+            return self.ids[:0]
+        result = lists[0]
+        for ids in lists[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, ids, assume_unique=True)
+        return result
+
+    def overlap(self, text):
+        """``(value ids, shared trigram counts)`` for values sharing any trigram with ``text``."""
+        lists = [self.postings(k) for k in _trigram_keys(text)]
+        if not lists:
+            return self.ids[:0], np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(lists), return_counts=True)
+
+
+class _SortedField:
+    """Distinct normalized values in sorted order for prefix lookups."""
+
+    def __init__(self, codes, uniques):
+        self.codes = codes
+        self.size = len(uniques)
+        # Arrow's sort kernel instead of Python string comparisons
+        self.order = pd.Series(uniques, dtype='string[pyarrow]').argsort().to_numpy()
+        self.sorted = uniques[self.order]
+
+    def prefix(self, text):
+        lo = np.searchsorted(self.sorted, text, 'left')
+        hi = np.searchsorted(self.sorted, text + '\U0010ffff', 'left')
+        return self.order[lo:hi]
+
+
+def _arrow_strings(values):
+    return pa.array(pd.Series(values).astype(object), type=pa.string(), from_pandas=True)
+
+
+def normalize_names(arr):
+    """Vectorized :func:`normalize_text` over an Arrow string array (nulls stay null)."""
+    # Only non-ASCII values need the Python accent-stripping path
+    non_ascii = pc.fill_null(pc.invert(pc.string_is_ascii(arr)), False)
+    if pc.any(non_ascii).as_py():
+        fixed = [normalize_text(v) for v in arr.filter(non_ascii).to_pylist()]
+        arr = pc.replace_with_mask(arr, non_ascii, pa.array(fixed, type=arr.type))
+    arr = pc.replace_substring_regex(pc.utf8_lower(arr), pattern=r'\s+', replacement=' ')
+    return pc.utf8_trim_whitespace(arr)
+
+
+def normalize_mails(arr):
+    return pc.replace_substring_regex(normalize_names(arr), pattern=' ', replacement='')
+
+
+def normalize_mobiles(arr):
+    return pc.replace_substring_regex(arr, pattern=r'\D+', replacement='')
+
+
+def factorize_normalized(values, normalize):
+    """Codes per row and distinct normalized values; empty values count as missing."""
+    arr = normalize(_arrow_strings(values))
+    arr = pc.if_else(pc.equal(arr, ''), pa.scalar(None, arr.type), arr)
+    codes, uniques = pd.factorize(pd.Series(pd.arrays.ArrowStringArray(arr)))
+    return codes, np.asarray(uniques, dtype=object)
+
+
+def _rows_for(codes, value_ids, n_values):
+    mask = np.zeros(n_values + 1, dtype=bool)  # last slot: missing (-1)
+    mask[value_ids] = True
+    return np.flatnonzero(mask[codes])
+
+
+def _mail_key(value):
+    return normalize_text(value).replace(' ', '')
+
+
+class CandidateSearchIndex:
+    def __init__(self, df, name_column='Candidate Name', mail_column='Mail Id', mobile_column='Mobile Number'):
+        self.size = len(df)
+
+        def column(name):
+            return df[name] if name in df.columns else pd.Series([None] * len(df), dtype=object)
+
+        self.name_codes, self.names = factorize_normalized(column(name_column), normalize_names)
+        self.names_arrow = pa.array(self.names, type=pa.string())
+        # Two sentinel characters make every 1-2 character substring the start of a trigram
+        self.name_trigrams = _TrigramIndex(self.names, suffix=_PAD * 2)
+
+        # Name word vocabulary for fuzzy matching, with word -> name ids postings.
+        # Words are padded so short ones still produce trigrams.
+        split = pc.split_pattern(self.names_arrow, ' ')
+        word_codes, self.words = pd.factorize(pd.Series(pd.arrays.ArrowStringArray(pc.list_flatten(split))))
+        self.words = np.asarray(self.words, dtype=object)
+        order = np.argsort(word_codes, kind='stable')
+        self.word_name_ids = pc.list_parent_indices(split).to_numpy()[order]
+        self.word_offsets = np.concatenate([[0], np.cumsum(np.bincount(word_codes, minlength=len(self.words)))])
+        self.word_trigrams = _TrigramIndex(f' {w} ' for w in self.words)
+
+        self.mails = _SortedField(*factorize_normalized(column(mail_column), normalize_mails))
+        mobile_codes, mobiles = factorize_normalized(column(mobile_column), normalize_mobiles)
+        self.mobiles = _SortedField(mobile_codes, mobiles)
+        self.mobiles_reversed = _SortedField(mobile_codes, np.array([m[::-1] for m in mobiles], dtype=object))
+
+    def _name_substring(self, text):
+        if len(text) < MIN_NGRAM_QUERY:
+            return self.name_trigrams.prefixed(text)
+        candidates = self.name_trigrams.candidates(text)
+        if len(_trigram_keys(text)) > 1 and len(candidates):
+            # Every trigram present does not guarantee a contiguous match
+            found = pc.match_substring(self.names_arrow.take(candidates), text).to_numpy(zero_copy_only=False)
+            candidates = candidates[found]
+        return candidates
+
+    def _fuzzy_word(self, word):
+        ids, shared = self.word_trigrams.overlap(f' {word} ')
+        if not len(ids):
+            return np.empty(0, dtype=np.int64)
+        top = ids[np.argsort(-shared, kind='stable')[:FUZZY_CANDIDATES]]
+        matched = [
+            i for i in top
+            if self.words[i].startswith(word)
+            or difflib.SequenceMatcher(None, word, self.words[i]).ratio() >= FUZZY_CUTOFF
+        ]
+        if not matched:
+            return np.empty(0, dtype=np.int64)
+        postings = [self.word_name_ids[self.word_offsets[i]:self.word_offsets[i + 1]] for i in matched]
+        return np.unique(np.concatenate(postings))
+
+    def _name_fuzzy(self, text):
+        result = None
+        for word in text.split():
+            ids = self._fuzzy_word(word)
+            result = ids if result is None else np.intersect1d(result, ids, assume_unique=True)
+            if not len(result):
+                break
+        return result if result is not None else np.empty(0, dtype=np.int64)
+
+    def search(self, query, fuzzy=False):
+        """Sorted row positions whose name contains ``query`` or whose mail / mobile matches it.
+
+        With ``fuzzy=True``, names whose words are close to the query words
+        (typos, transpositions, partial words) also match.
+        """
+        text = normalize_text(query)
+        if not text:
+            return np.arange(self.size)
+
+        matches = [_rows_for(self.name_codes, self._name_substring(text), len(self.names))]
+        if fuzzy:
+            matches.append(_rows_for(self.name_codes, self._name_fuzzy(text), len(self.names)))
+        mail = _mail_key(query)
+        if len(mail) >= MIN_NGRAM_QUERY:
+            matches.append(_rows_for(self.mails.codes, self.mails.prefix(mail), self.mails.size))
+        digits = normalize_digits(query)
+        # Mostly-digit queries are mobile numbers, matched on leading or trailing digits
+        if len(digits) >= MIN_NGRAM_QUERY and len(digits) * 2 >= len(mail):
+            matches.append(_rows_for(self.mobiles.codes, self.mobiles.prefix(digits), self.mobiles.size))
+            matches.append(_rows_for(
+                self.mobiles_reversed.codes, self.mobiles_reversed.prefix(digits[::-1]), self.mobiles_reversed.size
+            ))
+        return np.unique(np.concatenate(matches))
@@ -0,0 +1,124 @@
+"""Loading several tracker files (one per business unit) into one dataset.
+
+A source spec is a single CSV, a directory of CSVs or a glob pattern::
+
+    df = load_trackers('trackers/')            # every *.csv in the directory
+    df = load_trackers('exports/TA Tracker - *.csv')
+
+Files whose cleaned cache entry is still valid are memory-mapped straight from
+the cache. The rest are parsed and cleaned in a process pool; workers write
+the per-file cache and the parent maps the fresh entries, so cleaned frames
+are never pickled between processes. Every row is tagged with its
+``Tracker`` (file name) and ``Business Unit`` as categoricals before the
+frames are concatenated.
+"""
+import glob
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from tracker import cache, schema
+from tracker.loader import cache_salt, load_tracker
+from tracker.rules import DEFAULT_RULES_PATH
+
+TRACKER_COLUMN = 'Tracker'
+UNIT_COLUMN = 'Business Unit'
+# Below this much changed CSV, parsing in-process beats starting worker processes
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+def resolve_sources(spec):
+    """Sorted tracker CSV paths for a file, directory or glob ``spec``."""
+    path = Path(spec)
+    if path.is_dir():
+        return sorted(p for p in path.glob('*.csv') if p.is_file())
+    if path.is_file():
+        return [path]
+    return sorted(Path(p) for p in glob.glob(str(spec)) if Path(p).is_file())
+
+
+def business_unit(path):
+    """Business unit of a tracker file: the part of its name after the last ``' - '`` (``TA Tracker - Cloud.csv``)."""
+    return Path(path).stem.rsplit(' - ', 1)[-1].strip()
+
+
+def _tag(df, path):
+    for column, value in ((TRACKER_COLUMN, Path(path).stem), (UNIT_COLUMN, business_unit(path))):
+        codes = np.zeros(len(df), dtype=np.int8)
+        df[column] = pd.Categorical.from_codes(codes, categories=[value])
+    return df
+
+
+def _ingest(path, rules_path, cache_dir):
+    # Worker entry point: refresh the per-file cache and report only the version
+    return load_tracker(path, rules_path, cache_dir).attrs['data_version']
+
+
+def load_trackers(spec, rules_path=DEFAULT_RULES_PATH, cache_dir=None, max_workers=None):
+    """Return the cleaned, tagged and concatenated trackers matched by ``spec``."""
+    paths = resolve_sources(spec)
+    if not paths:
+        raise FileNotFoundError(f"no tracker CSV files match {spec!r}")
+    salt = cache_salt(rules_path)
+
+    frames = {}
+    stale = []
+    for path in paths:
+        df, meta = cache.lookup(path, salt, cache_dir)
+        if df is None:
+            stale.append(path)
+        else:
+            frames[path] = (df, f"{salt}-{meta['hash'][:16]}")
+
+    workers = min(len(stale), max_workers or os.cpu_count() or 1)
+    if workers > 1 and sum(p.stat().st_size for p in stale) >= PARALLEL_MIN_BYTES:
+        # spawn: forking a threaded server process is unsafe
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            list(pool.map(_ingest, stale, [rules_path] * len(stale), [cache_dir] * len(stale)))
+    for path in stale:
+        df, meta = cache.lookup(path, salt, cache_dir)
+        if df is None:
+            # Cache not written (e.g. read-only cache directory): load in-process
+            df = load_tracker(path, rules_path, cache_dir)
+            frames[path] = (df, df.attrs['data_version'])
+        else:
+            frames[path] = (df, f"{salt}-{meta['hash'][:16]}")
+
+    tagged = [_tag(frames[path][0], path) for path in paths]
+    df = schema.concat_frames(tagged) if len(tagged) > 1 else tagged[0]
+    df.attrs['data_version'] = _combined_version(salt, [(path, frames[path][1]) for path in paths])
+    return df
+
+
+def _combined_version(salt, versions):
+    # One version for the whole set: changes when any file, the file list or the rules change.
+    # Per-file versions match what load_tracker reports for the same file.
+    digest = hashlib.blake2b(digest_size=16)
+    for path, version in versions:
+        digest.update(f"{path.resolve()}\0{version}\0".encode())
+    return f"{salt}-{digest.hexdigest()[:16]}"
+
+
+def data_version(spec, rules_path=DEFAULT_RULES_PATH, cache_dir=None):
+    """The data version :func:`load_trackers` reports for ``spec``, without loading any tracker.
+
+    A file whose size and mtime match its cache entry uses the recorded
+    content hash; any other file is hashed (one sequential read, no parsing).
+    """
+    paths = resolve_sources(spec)
+    if not paths:
+        raise FileNotFoundError(f"no tracker CSV files match {spec!r}")
+    salt = cache_salt(rules_path)
+    versions = []
+    for path in paths:
+        meta, stat = cache.read_meta(path, cache_dir), path.stat()
+        fresh = meta is not None and meta.get('salt') == salt and \
+            (meta['size'], meta['mtime_ns']) == (stat.st_size, stat.st_mtime_ns)
+        digest = meta['hash'] if fresh else cache.content_hash(path)
+        versions.append((path, f"{salt}-{digest[:16]}"))
+    return _combined_version(salt, versions)
@@ -0,0 +1,306 @@
+"""Synthetic TA trackers for capacity planning and benchmarks.
+
+Writes CSVs in the same layout as the real sheet: the metadata first row, the
+full header with its duplicated ``Panelist name`` / ``Date of feedback
+shared`` columns, and rows that look like the real data (inconsistent status
+spellings, blank interview rounds, mixed date formats, free-text experience
+and CTC, the sheet's broken TTF / TTH formula values and a block of empty
+template rows at the end). Output is deterministic for a given row count and
+seed.
+
+    python -m tracker.synthetic 100k .cache/synthetic/tracker-100k.csv
+"""
+import argparse
+import csv
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1M': 1_000_000, '10M': 10_000_000}
+
+METADATA_ROW = [
+    'Always insert new row from previous filled row, else data will not pop up as intended',
+    '', '', '', '', '', '', '', '', ' ', '', '', '', 'If highlighted Red, Candidate was interviewed in past',
+] + [''] * 41
+
+HEADER = [
+    'Sr No.', 'Req Date', 'HM Details', 'Skill', 'Designation', 'Location of posting', 'No. of Openings', 'Status',
+    'Candidate Name', 'Resume', 'Recruiter Name', 'Source', 'Sub Source', 'Sourcing Date', 'Mobile Number', 'Mail Id',
+    'Gender', 'Experience', 'Current CTC', 'Expected CTC', 'Current Company', 'Current location',
+    'Notice Period/Last working day', 'Date of Birth', 'Screening Date', 'Test for screening',
+    'Recruiter remarks if any', 'Screening check status', 'Date R1 Interview', 'Panelist name', 'Status of R1',
+    'Date of feedback shared', 'Date R2 Interview', 'Panelist name', 'Status of R2', 'Date of feedback shared',
+    'Date R3 Interview', 'Panelist name', 'Status of R3', 'Date of feedback shared', 'Assignment Status',
+    'Final Status', 'Rejection Reason', 'Reason for Others in AM column', 'Rejection Mailer Date',
+    'Onboarding doc date', 'Approval date', 'Offer date', 'Offer Acceptance Date', 'PC Request date', 'Joining Date',
+    'TTF (60 days)', 'Delay in TTF', 'TTH (30 days)', 'Delay in TTH',
+]
+
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Akash', 'Aman', 'Amit', 'Anjali', 'Ankit', 'Anuj', 'Arjun', 'Bhavay', 'Deepak', 'Divya',
+    'Gaurav', 'Harpreet', 'Ishaan', 'Jaspreet', 'Karan', 'Kavya', 'Manish', 'Meera', 'Neha', 'Nikhil', 'Pawan',
+    'Pooja', 'Priya', 'Rahul', 'Rajat', 'Ritika', 'Rohit', 'Sahil', 'Sakshi', 'Sanjay', 'Shalu', 'Shweta', 'Simran',
+    'Sneha', 'Sudesh', 'Sunil', 'Tanvi', 'Varun', 'Vikas', 'Vinay', 'Yash', 'Zoya',
+]
+LAST_NAMES = [
+    'Aggarwal', 'Arora', 'Bansal', 'Bhardwaj', 'Chauhan', 'Dang', 'Garg', 'Gupta', 'Jain', 'Joshi', 'Kapoor',
+    'Kaur', 'Kumar', 'Malhotra', 'Mehta', 'Nagar', 'Paneja', 'Rana', 'Saini', 'Sharma', 'Singh', 'Singla', 'Thakur',
+    'Tripathi', 'Verma', 'Yadav',
+]
+SKILLS = [
+    'QA', 'Java', 'Java Developer', 'Python', 'AWS IAAS', 'DevOps', 'Cyber security Engineer', 'Finance', 'AUTOCAD',
+    'React', 'Angular', '.NET', 'Data Engineer', 'Data Analyst', 'HR', 'Sales', 'Business Analyst', 'SAP', 'Salesforce',
+    'Network Engineer', 'Linux Admin', 'Android', 'iOS', 'UI/UX', 'Technical Writer', 'Support Engineer',
+]
+LOCATIONS = ['Panchkula', 'Ambala', 'Panchkula/Ambala', 'Mohali', 'Chandigarh', 'Gurugram', 'UK', 'panchkula']
+SOURCES = {'Job Site': ['Naukri', 'Indeed', 'linkedin Posting', 'Linkedin Posting'],
+           'Employee Referral': None, 'WalkIn': ['Direct', 'placement drive'], 'Referral': None}
+DESIGNATIONS = [
+    'Quality Analyst', 'Cloud', 'Software Engineer', 'Senior Software Engineer', 'Analyst', 'Consultant', 'Intern',
+    'Team Lead', 'Associate', 'Manager',
+]
+COMPANIES = ['Accenture Pvt. Ltd', 'Infosys', 'TCS', 'Wipro', 'HCL', 'Tech Mahindra', 'Fresher', 'Startup']
+NOTICE = ['Immediate', '15 days', '30 days', '60 days', '90 days', '']
+REJECTION_REASONS = [
+    'Technical Reject', 'Not fit as per requirement', 'Compensation Drop', 'Behavioural Reject', 'Other',
+    'Candidate not Interested', 'Candidate not responding',
+]
+
+# Outcome -> (probability, status spellings); rounds and dates follow from the outcome
+OUTCOMES = {
+    'screening_reject': (0.36, ['Screening reject', 'Screening Reject', 'screening reject']),
+    'rejected': (0.30, ['Rejected', 'Rejected in R1', 'Rejected in R2', 'Rejected in technical screening']),
+    'pending': (0.17, ['Pending at R1', 'Pending at R2', 'Pending at R3', 'In process', 'Under discussion',
+                       'on hold', 'Scheduled for R1', 'Schduled for R1', '']),
+    'selected': (0.08, ['Shortlisted', 'Yes', 'selected', 'Selected']),
+    'joined': (0.03, ['Joined', 'Internship letter shared']),
+    'other': (0.06, ['Pending', 'Offer Declined in salary negotiation round', 'Req on Hold', 'Duplicate profile']),
+}
+
+START_DATE = np.datetime64('2024-01-01')
+SPAN_DAYS = 730
+EXCEL_EPOCH = np.datetime64('1899-12-30')
+# Share of dates written in each format: the sheet's usual style plus known variants
+DATE_STYLES = [('%-d-%b-%Y', 0.96), ('%d-%m-%Y', 0.02), ('%d-%b-%y', 0.015), ('%-d-%b-%Y (rescheduled)', 0.005)]
+
+
+def _people(count, rng):
+    first = rng.choice(FIRST_NAMES, count)
+    last = rng.choice(LAST_NAMES, count)
+    return np.unique(np.char.add(np.char.add(first, ' '), last))
+
+
+class _Pools:
+    """Value pools whose cardinality grows with the tracker size, like a growing company's."""
+
+    def __init__(self, rows, rng):
+        self.hms = _people(max(18, min(rows // 2_000, 2_000)), rng)
+        levels = ['', ' L1', ' L2', ' Lead', ' Intern']
+        skills = [s + level for level in levels for s in SKILLS]
+        self.skills = np.array(skills[:max(32, min(rows // 3_000, len(skills)))])
+        self.designations = np.array(DESIGNATIONS)
+        self.recruiters = _people(max(7, min(rows // 20_000, 300)), rng)
+        self.panelists = _people(max(20, min(rows // 1_000, 3_000)), rng)
+        days = np.arange(-400, SPAN_DAYS + 200)
+        dates = pd.DatetimeIndex(START_DATE + days.astype('timedelta64[D]'))
+        # Formatted once per distinct day and style; rows just index into this table
+        self.date_offset = 400
+        self.dates = np.stack([
+            np.array([d.strftime(fmt.replace('%-d', str(d.day))) for d in dates], dtype=object)
+            for fmt, _ in DATE_STYLES
+        ])
+        births = pd.date_range('1985-01-01', '2004-12-31')
+        self.birth_dates = np.array([f"{d.day}-{d.strftime('%b-%Y')}" for d in births], dtype=object)
+        self.experience = np.array(
+            [f"{x / 10:g}" for x in range(0, 151, 3)] + ['2 Years', '6 Months', 'Fresher', '1.5 Years'], dtype=object)
+        self.amounts = np.array(
+            [f"{x / 2:g}" for x in range(4, 61)] + ['14.5 LPA', '4-5', '10k', '6 LPA', 'Nil'], dtype=object)
+
+
+def _messy(values, rng):
+    """Sprinkle case and whitespace variants over a share of string values."""
+    values = values.astype(object)
+    pick = rng.random(len(values))
+    values[pick < 0.03] = np.char.lower(values[pick < 0.03].astype(str))
+    trailing = (pick >= 0.03) & (pick < 0.08)
+    values[trailing] = np.char.add(values[trailing].astype(str), ' ')
+    return values
+
+
+def _format_dates(days, present, pools, rng):
+    """Day offsets to date strings in the sheet's mixed styles; absent dates are blank."""
+    style = np.searchsorted(np.cumsum([w for _, w in DATE_STYLES]), rng.random(len(days)))
+    style = np.minimum(style, len(DATE_STYLES) - 1)
+    index = np.clip(days + pools.date_offset, 0, pools.dates.shape[1] - 1)
+    return np.where(present, pools.dates[style, index], '')
+
+
+def _excel_serial(days, present):
+    # The sheet's TTF / TTH formulas subtract serial dates, treating blanks as 0
+    serial = (START_DATE - EXCEL_EPOCH).astype(int) + days
+    return np.where(present, serial, 0)
+
+
+def _table(columns):
+    return pa.Table.from_arrays([pa.array(columns[i], type=pa.string()) for i in range(len(HEADER))], names=HEADER)
+
+
+def generate_rows(count, pools, rng, first_sr=1):
+    """One chunk of synthetic tracker rows as an Arrow table in :data:`HEADER` order."""
+    names = list(OUTCOMES)
+    probs = np.array([OUTCOMES[n][0] for n in names])
+    outcome = rng.choice(len(names), count, p=probs / probs.sum())
+    is_ = {name: outcome == i for i, name in enumerate(names)}
+
+    status = np.empty(count, dtype=object)
+    for i, name in enumerate(names):
+        mask = outcome == i
+        status[mask] = rng.choice(OUTCOMES[name][1], mask.sum())
+    status = _messy(status, rng)
+
+    # Interview rounds attended and how the last one ended
+    rounds = np.zeros(count, dtype=np.int64)
+    rounds[is_['rejected']] = rng.choice([0, 1, 2, 3], is_['rejected'].sum(), p=[0.1, 0.6, 0.2, 0.1])
+    rounds[is_['pending']] = rng.choice([0, 1, 2, 3], is_['pending'].sum(), p=[0.2, 0.5, 0.2, 0.1])
+    won = is_['selected'] | is_['joined']
+    rounds[won] = rng.choice([1, 2, 3], won.sum(), p=[0.3, 0.5, 0.2])
+    rounds[is_['other']] = rng.integers(0, 4, is_['other'].sum())
+    last_status = np.where(is_['rejected'], 'Not Cleared', np.where(won, 'Cleared', 'Pending'))
+
+    req = rng.integers(0, SPAN_DAYS, count)
+    sourcing = req + rng.integers(0, 45, count)
+    screening = sourcing + rng.geometric(0.6, count) - 1
+    has_sourcing = rng.random(count) > 0.02
+    has_screening = has_sourcing & (rng.random(count) > 0.05)
+    has_req = rng.random(count) > 0.08
+
+    columns = {h: np.full(count, '', dtype=object) for h in range(len(HEADER))}
+    columns[0] = np.arange(first_sr, first_sr + count).astype(str).astype(object)
+    columns[1] = _format_dates(req, has_req, pools, rng)
+    columns[2] = _messy(rng.choice(pools.hms, count), rng)
+    columns[3] = _messy(rng.choice(pools.skills, count), rng)
+    columns[4] = rng.choice(pools.designations, count).astype(object)
+    columns[5] = rng.choice(LOCATIONS, count, p=[0.7, 0.14, 0.05, 0.03, 0.03, 0.02, 0.01, 0.02]).astype(object)
+    columns[6] = rng.integers(1, 6, count).astype(str).astype(object)
+    columns[7] = status
+    first = rng.choice(FIRST_NAMES, count)
+    last = np.where(rng.random(count) < 0.15, '', rng.choice(LAST_NAMES, count))
+    columns[8] = np.char.strip(np.char.add(np.char.add(first, ' '), last)).astype(object)
+    columns[10] = rng.choice(pools.recruiters, count).astype(object)
+    source_names = list(SOURCES)
+    source = rng.choice(len(source_names), count, p=[0.82, 0.13, 0.03, 0.02])
+    columns[11] = np.array(source_names, dtype=object)[source]
+    sub = rng.choice(SOURCES['Job Site'], count, p=[0.85, 0.07, 0.04, 0.04]).astype(object)
+    referrer = rng.choice(pools.recruiters, count).astype(object)
+    columns[12] = np.where(source == 0, sub, np.where(source == 2, rng.choice(SOURCES['WalkIn'], count), referrer))
+    columns[13] = _format_dates(sourcing, has_sourcing, pools, rng)
+    mobile = rng.integers(6_000_000_000, 10_000_000_000, count).astype(str).astype(object)
+    columns[14] = np.where(rng.random(count) < 0.03, '', mobile)
+    mail = np.char.add(np.char.add(np.char.lower(first), np.char.lower(last)), rng.integers(1, 9999, count).astype(str))
+    columns[15] = np.char.add(mail, '@gmail.com').astype(object)
+    columns[16] = rng.choice(['Male', 'Female'], count, p=[0.85, 0.15]).astype(object)
+    columns[17] = rng.choice(pools.experience, count)
+    columns[18] = rng.choice(pools.amounts, count)
+    columns[19] = rng.choice(pools.amounts, count)
+    columns[20] = rng.choice(COMPANIES, count).astype(object)
+    columns[21] = rng.choice(LOCATIONS[:6], count).astype(object)
+    columns[22] = rng.choice(NOTICE, count).astype(object)
+    birth = rng.choice(pools.birth_dates, count)
+    columns[23] = np.where(rng.random(count) < 0.4, birth, '')
+    columns[24] = _format_dates(screening, has_screening, pools, rng)
+    columns[25] = np.where(rng.random(count) < 0.7, 'Not Applicable', '').astype(object)
+    screen_status = np.where(is_['screening_reject'], 'Not Cleared', 'Cleared').astype(object)
+    screen_status[(rounds == 0) & is_['pending']] = 'In process'
+    columns[27] = np.where(has_screening, screen_status, '')
+
+    previous = screening.copy()
+    for r in range(3):
+        base = 28 + 4 * r
+        attended = rounds > r
+        interview = previous + rng.integers(1, 11, count)
+        outcome_r = np.where(rounds - 1 > r, 'Cleared', last_status).astype(object)
+        pending = attended & (outcome_r == 'Pending')
+        outcome_r[pending] = rng.choice([f'Pending at R{r + 1}', f'Pending with R{r + 1}'], pending.sum())
+        feedback = interview + rng.integers(0, 8, count)
+        has_feedback = attended & ~pending & (rng.random(count) > 0.2)
+        columns[base] = _format_dates(interview, attended, pools, rng)
+        columns[base + 1] = np.where(attended, rng.choice(pools.panelists, count), '')
+        columns[base + 2] = np.where(attended, outcome_r, '')
+        columns[base + 3] = _format_dates(feedback, has_feedback, pools, rng)
+        previous = np.where(attended, np.where(has_feedback, feedback, interview), previous)
+
+    final = np.full(count, '', dtype=object)
+    final[is_['rejected'] & (rounds > 0)] = 'Rejected'
+    final[won] = 'Selected'
+    final[is_['pending'] & (rounds > 0)] = 'In Process'
+    columns[41] = final
+    rejected = is_['rejected'] | is_['screening_reject']
+    columns[42] = np.where(rejected & (rng.random(count) < 0.1), rng.choice(REJECTION_REASONS, count), '')
+    columns[44] = _format_dates(previous + 2, rejected & (rng.random(count) < 0.02), pools, rng)
+
+    has_offer = is_['joined'] | (is_['selected'] & (rng.random(count) < 0.5))
+    offer = previous + rng.integers(1, 15, count)
+    acceptance = offer + rng.integers(0, 6, count)
+    has_acceptance = (has_offer & (rng.random(count) < 0.6)) | is_['joined']
+    joining = acceptance + rng.integers(7, 46, count)
+    columns[46] = _format_dates(offer - 1, has_offer, pools, rng)
+    columns[47] = _format_dates(offer, has_offer, pools, rng)
+    columns[48] = _format_dates(acceptance, has_acceptance, pools, rng)
+    columns[50] = _format_dates(joining, is_['joined'], pools, rng)
+    columns[51] = (_excel_serial(joining, is_['joined']) - _excel_serial(req, has_req)).astype(str).astype(object)
+    columns[53] = (_excel_serial(acceptance, has_acceptance) - _excel_serial(screening, has_screening)).astype(str)
+    return _table(columns)
+
+
+def template_rows(count):
+    """Empty rows the way the sheet pads its bottom: broken serial numbers and zeroed formulas."""
+    columns = {h: np.full(count, '', dtype=object) for h in range(len(HEADER))}
+    columns[0][:] = '#REF!'
+    columns[51][:] = '0'
+    columns[53][:] = '0'
+    return _table(columns)
+
+
+def write_tracker(path, rows, seed=0, chunk_rows=250_000):
+    """Write a synthetic tracker with ``rows`` data rows (2% of them empty template rows) to ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    pools = _Pools(rows, rng)
+    filled = rows - rows // 50
+    # Generated values never contain delimiters or quotes, so rows are written unquoted like a sheet export
+    options = pa_csv.WriteOptions(include_header=False, quoting_style='none')
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(METADATA_ROW)
+        writer.writerow(HEADER)
+    with open(path, 'ab') as f:
+        for start in range(0, filled, chunk_rows):
+            count = min(chunk_rows, filled - start)
+            pa_csv.write_csv(generate_rows(count, pools, rng, first_sr=start + 1), f, options)
+        pa_csv.write_csv(template_rows(rows - filled), f, options)
+    return path
+
+
+def parse_size(text):
+    """``'100k'`` / ``'1M'`` / ``'2500'`` style row counts."""
+    if text in SIZES:
+        return SIZES[text]
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic TA tracker CSV.")
+    parser.add_argument('rows', help="row count, e.g. 10k, 100k, 1M, 10M or 2500")
+    parser.add_argument('path', help="output CSV path")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    print(write_tracker(args.path, parse_size(args.rows), seed=args.seed))
+
+
+if __name__ == '__main__':
+    main()
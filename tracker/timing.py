@@ -0,0 +1,212 @@
+"""Lightweight per-stage timing for dashboard reruns.
+
+Each rerun opens a :class:`Run` from the process-wide :class:`Recorder` and
+wraps its stages in ``with run.stage(name):`` blocks. Finished runs feed a
+bounded window of durations per stage (for p50 / p95), row counts in and out
+of each filter step and cache hit / miss counters. Optionally every run is
+appended to a JSON-lines log and a Prometheus text file is rewritten for
+local scraping::
+
+    TA_PERF_LOG=.cache/perf.jsonl TA_PERF_METRICS=.cache/metrics.prom streamlit run dashboard.py
+
+A disabled run hands out one shared no-op span, so instrumentation costs a
+method call per stage when nobody is looking.
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WINDOW = 500  # recent durations kept per stage
+METRICS_INTERVAL = 5.0  # seconds between Prometheus file rewrites
+
+
+class _Span:
+    __slots__ = ('run', 'name', 'rows_in', 'rows_out', 'start')
+
+    def __init__(self, run, name, rows_in):
+        self.run = run
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.run.add(self.name, time.perf_counter() - self.start, self.rows_in, self.rows_out)
+        return False
+
+
+class _NullSpan:
+    """Shared stand-in for disabled runs; ``rows_out`` assignments are ignored."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Run:
+    """Stage timings and cache outcomes of one rerun."""
+
+    def __init__(self, recorder, enabled=True):
+        self.recorder = recorder
+        self.enabled = enabled
+        self.spans = []  # (stage, seconds, rows in, rows out)
+        self.cache = {}  # cache name -> True (hit) / False (miss)
+        self.start = time.perf_counter()
+
+    def stage(self, name, rows_in=None):
+        """Context manager timing ``name``; set ``.rows_out`` on it to record the rows produced."""
+        return _Span(self, name, rows_in) if self.enabled else _NULL_SPAN
+
+    def add(self, name, seconds, rows_in=None, rows_out=None):
+        """Record a stage measured elsewhere."""
+        if self.enabled:
+            self.spans.append((name, seconds, rows_in, rows_out))
+
+    def hit(self, cache, hit):
+        if self.enabled:
+            self.cache[cache] = bool(hit)
+
+    def finish(self):
+        if self.enabled:
+            self.add('total', time.perf_counter() - self.start)
+            self.recorder.record(self)
+
+
+class Recorder:
+    """Process-wide aggregate of finished runs; thread-safe."""
+
+    def __init__(self, window=DEFAULT_WINDOW, log_path=None, metrics_path=None, metrics_interval=METRICS_INTERVAL):
+        self.window = window
+        self.log_path = Path(log_path) if log_path else None
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self.metrics_interval = metrics_interval
+        self.durations = defaultdict(lambda: deque(maxlen=self.window))
+        self.totals = defaultdict(lambda: [0, 0.0])  # stage -> [count, seconds]
+        self.rows = {}  # stage -> (rows in, rows out) of the latest run
+        self.hits = defaultdict(lambda: [0, 0])  # cache -> [hits, misses]
+        self._metrics_written = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Sinks from ``TA_PERF_LOG`` (JSON lines) and ``TA_PERF_METRICS`` (Prometheus text)."""
+        return cls(log_path=os.environ.get('TA_PERF_LOG'), metrics_path=os.environ.get('TA_PERF_METRICS'))
+
+    @property
+    def has_sinks(self):
+        return self.log_path is not None or self.metrics_path is not None
+
+    def run(self, enabled=True):
+        return Run(self, enabled)
+
+    def record(self, run):
+        with self._lock:
+            for name, seconds, rows_in, rows_out in run.spans:
+                self.durations[name].append(seconds)
+                totals = self.totals[name]
+                totals[0] += 1
+                totals[1] += seconds
+                if rows_in is not None or rows_out is not None:
+                    self.rows[name] = (rows_in, rows_out)
+            for cache, hit in run.cache.items():
+                self.hits[cache][0 if hit else 1] += 1
+            write_metrics = self.metrics_path is not None and time.monotonic() - self._metrics_written >= self.metrics_interval
+            if write_metrics:
+                self._metrics_written = time.monotonic()
+        if self.log_path is not None:
+            self._log(run)
+        if write_metrics:
+            _atomic_write_text(self.metrics_path, self.prometheus_text())
+
+    def _log(self, run):
+        entry = {
+            'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'stages': [
+                {'stage': name, 'ms': round(seconds * 1000, 3), 'rows_in': rows_in, 'rows_out': rows_out}
+                for name, seconds, rows_in, rows_out in run.spans
+            ],
+            'cache': {cache: 'hit' if hit else 'miss' for cache, hit in run.cache.items()},
+        }
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(entry) + '\n'
+        with self._lock, open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+    def summary(self):
+        """Calls, p50 / p95 milliseconds and the latest rows in / out per stage."""
+        with self._lock:
+            stages = {name: np.array(values) for name, values in self.durations.items()}
+            calls = {name: totals[0] for name, totals in self.totals.items()}
+            rows = dict(self.rows)
+        records = []
+        for name, values in stages.items():
+            p50, p95 = np.percentile(values, [50, 95]) * 1000
+            rows_in, rows_out = rows.get(name, (None, None))
+            records.append([name, calls[name], round(p50, 2), round(p95, 2), rows_in, rows_out])
+        summary = pd.DataFrame(records, columns=['Stage', 'Calls', 'p50 ms', 'p95 ms', 'Rows in', 'Rows out'])
+        for col in ['Rows in', 'Rows out']:
+            summary[col] = summary[col].astype('Int64')
+        return summary
+
+    def hit_ratios(self):
+        """``{cache: (hits, misses, hit ratio)}``."""
+        with self._lock:
+            counts = {cache: tuple(c) for cache, c in self.hits.items()}
+        return {cache: (h, m, h / (h + m) if h + m else 0.0) for cache, (h, m) in counts.items()}
+
+    def prometheus_text(self):
+        """Stage duration summaries and cache counters in the Prometheus text exposition format."""
+        with self._lock:
+            stages = {name: (np.array(values), tuple(self.totals[name])) for name, values in self.durations.items()}
+            hits = {cache: tuple(c) for cache, c in self.hits.items()}
+            rows = dict(self.rows)
+        lines = [
+            '# HELP ta_stage_seconds Dashboard stage durations over the recent window.',
+            '# TYPE ta_stage_seconds summary',
+        ]
+        for name, (values, (count, total)) in stages.items():
+            label = _label(name)
+            for q in (0.5, 0.95):
+                lines.append(f'ta_stage_seconds{{stage="{label}",quantile="{q}"}} {np.quantile(values, q):.6f}')
+            lines.append(f'ta_stage_seconds_sum{{stage="{label}"}} {total:.6f}')
+            lines.append(f'ta_stage_seconds_count{{stage="{label}"}} {count}')
+        lines += ['# HELP ta_stage_rows Rows in and out of a stage in the latest run.', '# TYPE ta_stage_rows gauge']
+        for name, (rows_in, rows_out) in rows.items():
+            for direction, value in (('in', rows_in), ('out', rows_out)):
+                if value is not None:
+                    lines.append(f'ta_stage_rows{{stage="{_label(name)}",direction="{direction}"}} {value}')
+        lines += ['# HELP ta_cache_requests_total Cache lookups by outcome.', '# TYPE ta_cache_requests_total counter']
+        for cache, (h, m) in hits.items():
+            lines.append(f'ta_cache_requests_total{{cache="{_label(cache)}",result="hit"}} {h}')
+            lines.append(f'ta_cache_requests_total{{cache="{_label(cache)}",result="miss"}} {m}')
+        return '\n'.join(lines) + '\n'
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _atomic_write_text(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
@@ -0,0 +1,164 @@
+"""Memoized filtered views shared across sessions.
+
+Many users look at the same few slices, so the derived results of a filter
+combination (matching row positions, KPI summary, stage durations, serialized
+figures)
+are kept in an LRU cache keyed by a canonical hash of the normalized filter
+state plus the data version. The cache is bounded by an approximate memory
+cap rather than an entry count.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get('TA_VIEW_CACHE_MB', 64)) * 1024 * 1024)
+
+
+def normalize_search(text):
+    """Casefold and collapse whitespace so equivalent searches share a cache entry."""
+    return ' '.join((text or '').casefold().split())
+
+
+@dataclass(frozen=True)
+class Selection:
+    """Chosen values of one filter as a single compact set.
+
+    Select-all and clear are O(1): "all" is stored as an inverted empty set
+    rather than by enumerating every option.
+    """
+    values: frozenset = frozenset()
+    inverted: bool = False  # True: every option except ``values``
+
+    @classmethod
+    def everything(cls):
+        return cls(inverted=True)
+
+    def __contains__(self, value):
+        return (value in self.values) != self.inverted
+
+    def toggled(self, value):
+        return Selection(self.values ^ {value}, self.inverted)
+
+    def resolve(self, options):
+        """Selected values among ``options``, sorted."""
+        if self.inverted:
+            return sorted(set(options).difference(self.values))
+        return sorted(self.values.intersection(options))
+
+
+@dataclass(frozen=True)
+class FilterState:
+    hm: tuple = ()
+    skill: tuple = ()
+    location: tuple = ()
+    recruiter: tuple = ()
+    business_unit: tuple = ()
+    date_range: tuple = None  # inclusive (start, end) ISO dates, or None
+    name: str = ''
+    fuzzy: bool = False
+    dedupe: bool = False  # count each candidate once (latest application) in KPIs and funnel
+
+    @classmethod
+    def from_widgets(cls, hm=(), skill=(), location=(), recruiter=(), business_unit=(), date_range=None, name='',
+                     fuzzy=False, dedupe=False):
+        """Build a canonical state: sorted, de-duplicated selections and a normalized search."""
+        return cls(
+            hm=tuple(sorted(set(hm))),
+            skill=tuple(sorted(set(skill))),
+            location=tuple(sorted(set(location))),
+            recruiter=tuple(sorted(set(recruiter))),
+            business_unit=tuple(sorted(set(business_unit))),
+            date_range=tuple(d.isoformat() for d in date_range) if date_range else None,
+            name=normalize_search(name),
+            fuzzy=bool(fuzzy),
+            dedupe=bool(dedupe),
+        )
+
+    @property
+    def selections(self):
+        return {
+            'HM Details': list(self.hm),
+            'Skill': list(self.skill),
+            'Location of posting': list(self.location),
+            'Recruiter Name': list(self.recruiter),
+            'Business Unit': list(self.business_unit),
+        }
+
+    def key(self, data_version):
+        payload = json.dumps([data_version, self.hm, self.skill, self.location, self.recruiter, self.business_unit,
+                              self.date_range, self.name, self.fuzzy, self.dedupe])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class View:
+    positions: np.ndarray  # row positions into the full dataset
+    kpis: object  # tracker.metrics.KpiSummary
+    funnel_json: str  # Plotly figure serialized with fig.to_json()
+    durations: object = None  # pandas DataFrame from tracker.durations.StageDurations.summary
+    durations_json: str = ''  # duration chart serialized with fig.to_json()
+    repeats: int = 0  # rows that are a repeat application of an earlier candidate (None: unknown, e.g. streaming)
+
+    @property
+    def nbytes(self):
+        size = self.positions.nbytes + len(self.funnel_json) + len(self.durations_json) + 256
+        if self.durations is not None:
+            size += int(self.durations.memory_usage(deep=True).sum())
+        return size
+
+
+def compact_positions(positions):
+    """Store positions as int32 when they fit, halving the cache footprint."""
+    positions = np.asarray(positions)
+    if len(positions) and positions.max() < np.iinfo(np.int32).max:
+        return positions.astype(np.int32)
+    return positions
+
+
+class ViewCache:
+    """Thread-safe LRU of :class:`View` objects with an approximate memory cap."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            view = self._entries.get(key)
+            if view is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return view
+
+    def put(self, key, view):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            if view.nbytes > self.max_bytes:
+                return view  # too large to keep; still usable by the caller
+            self._entries[key] = view
+            self.nbytes += view.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+            return view
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
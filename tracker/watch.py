@@ -0,0 +1,62 @@
+"""Background refresh of a :class:`~tracker.dataset.DatasetHolder` on file changes.
+
+A :class:`TrackerWatcher` polls the ``stat`` fingerprint of the tracker files
+(and the status rules file) a few times a second; that is a handful of
+syscalls per tick, so an idle watcher costs next to nothing. When the
+fingerprint changes it waits until the files have been quiet for
+``debounce`` seconds (spreadsheet tools often save in several writes), then
+reloads once through :meth:`DatasetHolder.refresh`, which swaps in the new
+snapshot atomically. Sessions notice the new ``holder.version`` and rerun.
+"""
+import threading
+import time
+
+DEFAULT_INTERVAL = 0.25  # seconds between stat polls
+DEFAULT_DEBOUNCE = 0.5  # seconds the files must stay unchanged before reloading
+
+
+class TrackerWatcher:
+    """Daemon thread refreshing ``holder`` once per settled change of its files."""
+
+    def __init__(self, holder, interval=DEFAULT_INTERVAL, debounce=DEFAULT_DEBOUNCE):
+        self.holder = holder
+        self.interval = interval
+        self.debounce = debounce
+        self.refreshes = 0
+        self.error = None  # exception of the last failed reload (as in DatasetHolder.error)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='tracker-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        seen = self.holder.signature()
+        changed_at = None  # monotonic time of the latest change not yet loaded
+        while not self._stop.wait(self.interval):
+            signature = self.holder.signature()
+            if signature != seen:
+                seen = signature
+                changed_at = time.monotonic()
+            elif changed_at is not None and time.monotonic() - changed_at >= self.debounce:
+                changed_at = None
+                try:
+                    self.holder.refresh()
+                except Exception as exc:
+                    # Nothing loaded yet to fall back on; the next save retries
+                    self.error = exc
+                else:
+                    self.error = self.holder.error
+                    self.refreshes += self.error is None